@@ -10,7 +10,10 @@ Usage:
     uv run python scripts/normalize_input_data.py
 """
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional, Union
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
 import shutil
@@ -20,43 +23,57 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from pathfilter.normalization import normalize_curies
 from pathfilter.curie_utils import parse_concatenated_curies, parse_path_curies
+from pathfilter.path_loader import EXCEL_ENGINE
 
 
-def load_query_from_ods(excel_file: str, sheet_name: str) -> dict:
+def load_query_from_ods(excel_file: Union[str, pd.ExcelFile], sheet_name: str) -> dict:
     """
     Load a single query definition from a sheet in the ODS file.
 
     This is the authoritative ODF parsing logic moved from query_loader.py.
 
+    Args:
+        excel_file: Path to the ODS file, or a pd.ExcelFile already opened on
+            it with engine='odf'. odfpy parses the whole document when it is
+            opened, so pass an ExcelFile when reading several sheets.
+        sheet_name: Name of the query sheet
+
     Returns:
         Dictionary with query data structure
     """
     df = pd.read_excel(excel_file, sheet_name=sheet_name, engine='odf')
 
+    # One scan of column A locates every row type we need
+    values = df.to_numpy(dtype=object)
+    has_curie_column = values.shape[1] > 2
+    col0 = df.iloc[:, 0].astype(str).to_numpy()
+    start_idx = np.flatnonzero(col0 == 'Start node')
+    end_idx = np.flatnonzero(col0 == 'End node')
+    expected_idx = np.flatnonzero(col0 == 'Expected Node')
+
     # Extract start node
-    start_row = df[df.iloc[:, 0] == 'Start node']
-    if len(start_row) == 0:
+    if len(start_idx) == 0:
         raise ValueError(f"No 'Start node' row found in sheet {sheet_name}")
 
-    start_label = str(start_row.iloc[0, 1]).strip()
-    start_curies_str = str(start_row.iloc[0, 2]) if len(start_row.iloc[0]) > 2 else ""
+    start_label = str(values[start_idx[0], 1]).strip()
+    start_curies_str = str(values[start_idx[0], 2]) if has_curie_column else ""
     start_curies = parse_concatenated_curies(start_curies_str)
 
     # Extract end node
-    end_row = df[df.iloc[:, 0] == 'End node']
-    if len(end_row) == 0:
+    if len(end_idx) == 0:
         raise ValueError(f"No 'End node' row found in sheet {sheet_name}")
 
-    end_label = str(end_row.iloc[0, 1]).strip()
-    end_curies_str = str(end_row.iloc[0, 2]) if len(end_row.iloc[0]) > 2 else ""
+    end_label = str(values[end_idx[0], 1]).strip()
+    end_curies_str = str(values[end_idx[0], 2]) if has_curie_column else ""
     end_curies = parse_concatenated_curies(end_curies_str)
 
     # Extract expected nodes (only rows with CURIEs in column C)
     expected_nodes = {}
-    expected_rows = df[df.iloc[:, 0] == 'Expected Node']
-    for idx, row in expected_rows.iterrows():
-        label = str(row.iloc[1]).strip() if pd.notna(row.iloc[1]) else ""
-        curies_str = str(row.iloc[2]) if len(row) > 2 and pd.notna(row.iloc[2]) else ""
+    for idx in expected_idx:
+        label_value = values[idx, 1]
+        label = str(label_value).strip() if pd.notna(label_value) else ""
+        curie_value = values[idx, 2] if has_curie_column else None
+        curies_str = str(curie_value) if has_curie_column and pd.notna(curie_value) else ""
         curies = parse_concatenated_curies(curies_str)
 
         # Only include if we have CURIEs
@@ -73,11 +90,18 @@ def load_query_from_ods(excel_file: str, sheet_name: str) -> dict:
     }
 
 
-def normalize_queries_to_json(input_file: str, output_file: str):
+def normalize_queries_to_json(input_file: str, output_file: str, max_workers: Optional[int] = None):
     """
     Load queries from ODS file, normalize all CURIEs, and save to JSON.
 
-    This replaces the broken ODF file writing approach.
+    This replaces the broken ODF file writing approach. Sheets are parsed in
+    parallel worker processes (ODF parsing is CPU-bound); results are
+    handled in sheet order.
+
+    Args:
+        input_file: Path to the ODS query file
+        output_file: Path of the JSON file to write
+        max_workers: Number of worker processes (None = os.cpu_count())
     """
     print(f"Processing query file: {input_file}")
 
@@ -89,12 +113,19 @@ def normalize_queries_to_json(input_file: str, output_file: str):
 
     normalized_queries = []
 
-    for sheet_name in query_sheets:
+    # Parse every sheet in parallel, then normalize sequentially in sheet order
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(load_query_from_ods, input_file, sheet_name)
+            for sheet_name in query_sheets
+        ]
+
+    for sheet_name, future in zip(query_sheets, futures):
         try:
             print(f"  Processing sheet: {sheet_name}")
 
             # Load query using the ODF parsing logic
-            query_data = load_query_from_ods(input_file, sheet_name)
+            query_data = future.result()
 
             # Only process queries with complete information
             if not query_data['expected_nodes'] or not query_data['start_curies'] or not query_data['end_curies']:
@@ -151,12 +182,15 @@ def normalize_path_file(input_file: str, output_file: str):
     print(f"Processing: {Path(input_file).name}")
 
     # Load the Excel file
-    df = pd.read_excel(input_file)
+    df = pd.read_excel(input_file, engine=EXCEL_ENGINE)
+
+    # Parse each path_curies string once; the parsed lists are reused when
+    # the column is rewritten below
+    parsed_curies = [parse_path_curies(str(s)) for s in df['path_curies']]
 
     # Collect all unique CURIEs from path_curies column
     all_curies = set()
-    for path_curie_str in df['path_curies']:
-        curies = parse_path_curies(str(path_curie_str))
+    for curies in parsed_curies:
         all_curies.update(curies)
 
     print(f"  Total unique CURIEs: {len(all_curies)}")
@@ -169,13 +203,11 @@ def normalize_path_file(input_file: str, output_file: str):
     changes = sum(1 for c, n in normalized.items() if c != n and n is not None)
     print(f"  Changed: {changes}/{len(all_curies)} ({changes/len(all_curies)*100:.1f}%)")
 
-    # Update path_curies column
-    def normalize_path_curies_str(path_curie_str):
-        curies = parse_path_curies(str(path_curie_str))
-        normalized_curies = [normalized.get(c, c) for c in curies if normalized.get(c) is not None]
-        return ' --> '.join(normalized_curies)
-
-    df['path_curies'] = df['path_curies'].apply(normalize_path_curies_str)
+    # Update path_curies column; CURIEs that fail to normalize are dropped
+    df['path_curies'] = [
+        ' --> '.join(normalized[c] for c in curies if normalized.get(c) is not None)
+        for curies in parsed_curies
+    ]
 
     # Save to output
     df.to_excel(output_file, index=False)
@@ -0,0 +1,72 @@
+"""Distinct-type counting kernel for the node-type filters.
+
+Uses numba when it is installed; otherwise an equivalent vectorized numpy
+implementation is used. Both take:
+
+    type_ids: int16 (num_paths, max_nodes) node type id of each position,
+              -1 past the end of paths shorter than max_nodes
+
+and fill an int64 array with the number of distinct types on each path.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+    prange = range
+
+# Type ids below this fit one bit each in a uint64 mask
+_MASK_BITS = 64
+
+
+def _count_distinct_python(type_ids, out):
+    for i in prange(type_ids.shape[0]):
+        count = 0
+        for j in range(type_ids.shape[1]):
+            type_id = type_ids[i, j]
+            if type_id < 0:
+                continue
+            seen = False
+            for k in range(j):
+                if type_ids[i, k] == type_id:
+                    seen = True
+                    break
+            if not seen:
+                count += 1
+        out[i] = count
+
+
+def _count_distinct_numpy(type_ids, out):
+    if type_ids.size and type_ids.max() < _MASK_BITS:
+        # Few types (the usual case): OR one bit per type into a uint64
+        # mask per path and count the set bits
+        bits = np.zeros(type_ids.shape, dtype=np.uint64)
+        np.left_shift(np.uint64(1), type_ids.astype(np.uint64), out=bits, where=type_ids >= 0)
+        out[:] = np.bitwise_count(np.bitwise_or.reduce(bits, axis=1))
+        return
+    ordered = np.sort(type_ids, axis=1)
+    first = np.ones(ordered.shape, dtype=bool)
+    first[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    out[:] = (first & (ordered >= 0)).sum(axis=1)
+
+
+if njit is not None:
+    _count_distinct = njit(parallel=True, cache=True)(_count_distinct_python)
+else:
+    _count_distinct = _count_distinct_numpy
+
+
+def count_distinct(type_ids: np.ndarray) -> np.ndarray:
+    """
+    Count the distinct node types on each path.
+
+    Args:
+        type_ids: int16 array of shape (num_paths, max_nodes), -1 padded
+
+    Returns:
+        int64 array with one count per path
+    """
+    out = np.empty(type_ids.shape[0], dtype=np.int64)
+    _count_distinct(type_ids, out)
+    return out
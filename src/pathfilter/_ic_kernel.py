@@ -0,0 +1,92 @@
+"""Threshold kernel for information content (IC) filters.
+
+IC values are first quantized against the thresholds being evaluated (see
+quantize): a node's level is the number of thresholds its IC reaches, so
+"IC >= threshold" becomes "level > rank of threshold" and the comparison
+is exact, unlike scaling IC into a fixed integer range.
+
+Uses numba when it is installed; otherwise an equivalent vectorized numpy
+implementation is used. Both take:
+
+    levels: uint8 (num_paths, num_nodes) level of each checked node,
+            ABSENT_LEVEL where a path has no node at that position
+    ranks:  int64 rank of each threshold (number of smaller thresholds)
+
+and fill a bool (num_paths, num_thresholds) matrix that is True where the
+lowest level on the path is above the rank, i.e. where the matching
+create_min_ic_filter filter would keep the path.
+"""
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+    prange = range
+
+# Level of a missing position; above every rank, so it never fails
+ABSENT_LEVEL = np.iinfo(np.uint8).max
+
+
+def _ic_pass_python(levels, ranks, out):
+    for i in prange(levels.shape[0]):
+        lowest = ABSENT_LEVEL
+        for j in range(levels.shape[1]):
+            if levels[i, j] < lowest:
+                lowest = levels[i, j]
+        for t in range(ranks.shape[0]):
+            out[i, t] = lowest > ranks[t]
+
+
+def _ic_pass_numpy(levels, ranks, out):
+    lowest = levels.min(axis=1, initial=ABSENT_LEVEL)
+    out[:] = lowest[:, None] > ranks[None, :]
+
+
+if njit is not None:
+    _ic_pass = njit(parallel=True, cache=True)(_ic_pass_python)
+else:
+    _ic_pass = _ic_pass_numpy
+
+
+def quantize(ic_values: np.ndarray, thresholds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize IC values to uint8 levels against a set of thresholds.
+
+    NaN and inf sort after every threshold, so they reach the top level
+    and pass every threshold, as in create_min_ic_filter.
+
+    Args:
+        ic_values: float64 array of IC values
+        thresholds: float64 array of min_ic values
+
+    Returns:
+        (levels, ranks): uint8 level of each value and int64 rank of each
+        threshold; a value passes a threshold when its level > the rank
+
+    Raises:
+        ValueError: If there are too many thresholds for uint8 levels
+    """
+    if len(thresholds) >= ABSENT_LEVEL:
+        raise ValueError(f"At most {ABSENT_LEVEL - 1} IC thresholds can be quantized")
+    ordered = np.sort(thresholds)
+    levels = np.searchsorted(ordered, ic_values, side="right").astype(np.uint8)
+    ranks = np.searchsorted(ordered, thresholds, side="left").astype(np.int64)
+    return levels, ranks
+
+
+def ic_pass(levels: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """
+    Evaluate several min-IC thresholds over all paths at once.
+
+    Args:
+        levels: uint8 array of shape (num_paths, num_nodes), from quantize
+        ranks: int64 array of threshold ranks, from quantize
+
+    Returns:
+        Boolean array of shape (num_paths, len(ranks))
+    """
+    out = np.empty((levels.shape[0], ranks.shape[0]), dtype=bool)
+    _ic_pass(levels, ranks, out)
+    return out
@@ -0,0 +1,64 @@
+"""Expected-node hit kernel for path matching.
+
+Uses numba when it is installed; otherwise an equivalent vectorized numpy
+implementation is used. Both take:
+
+    flat_ids: int32 CURIE ids of all paths, concatenated
+    offsets:  int64 (num_paths + 1) start of each path in flat_ids; path i
+              is flat_ids[offsets[i]:offsets[i + 1]]
+    expected: bool bitset over CURIE ids, True for expected nodes
+
+and fill a bool array that is True for paths with at least one expected
+node.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+    prange = range
+
+
+def _any_hit_python(flat_ids, offsets, expected, out):
+    for i in prange(offsets.shape[0] - 1):
+        hit = False
+        for k in range(offsets[i], offsets[i + 1]):
+            if expected[flat_ids[k]]:
+                hit = True
+                break
+        out[i] = hit
+
+
+def _any_hit_numpy(flat_ids, offsets, expected, out):
+    if flat_ids.shape[0] == 0:
+        out[:] = False
+        return
+    hits = expected[flat_ids].astype(np.int32)
+    # reduceat needs in-range offsets; empty paths are zeroed afterwards
+    starts = np.minimum(offsets[:-1], flat_ids.shape[0] - 1)
+    out[:] = np.add.reduceat(hits, starts) > 0
+    out[offsets[1:] == offsets[:-1]] = False
+
+
+if njit is not None:
+    _any_hit = njit(parallel=True, cache=True)(_any_hit_python)
+else:
+    _any_hit = _any_hit_numpy
+
+
+def any_hit(flat_ids: np.ndarray, offsets: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """
+    Check which paths contain an expected node.
+
+    Args:
+        flat_ids: int32 array of every path's CURIE ids, concatenated
+        offsets: int64 array of num_paths + 1 path boundaries in flat_ids
+        expected: Boolean bitset indexed by CURIE id
+
+    Returns:
+        Boolean array with one entry per path
+    """
+    out = np.empty(offsets.shape[0] - 1, dtype=bool)
+    _any_hit(flat_ids, offsets, expected, out)
+    return out
@@ -0,0 +1,45 @@
+"""Counting kernel for metapath enrichment.
+
+Uses numba when it is installed; otherwise an equivalent vectorized numpy
+implementation is used. Both take the same flat arrays:
+
+    metapath_per_pair: int64 metapath slot of each (path, metapath) pair
+    path_of_pair:      int64 path index of each (path, metapath) pair
+    path_hit:          bool, one entry per path, True if the path contains
+                       an expected node (computed once by the caller)
+
+and return (metapath_total, metapath_hits) as int64 arrays of length
+num_metapaths.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _compute_python(metapath_per_pair, path_of_pair, path_hit, num_metapaths):
+    total = np.zeros(num_metapaths, dtype=np.int64)
+    hits = np.zeros(num_metapaths, dtype=np.int64)
+    for j in range(len(metapath_per_pair)):
+        mp = metapath_per_pair[j]
+        total[mp] += 1
+        if path_hit[path_of_pair[j]]:
+            hits[mp] += 1
+    return total, hits
+
+
+def _compute_numpy(metapath_per_pair, path_of_pair, path_hit, num_metapaths):
+    total = np.bincount(metapath_per_pair, minlength=num_metapaths).astype(np.int64)
+    hits = np.bincount(
+        metapath_per_pair[path_hit[path_of_pair]],
+        minlength=num_metapaths
+    ).astype(np.int64)
+    return total, hits
+
+
+if njit is not None:
+    compute = njit(cache=True)(_compute_python)
+else:
+    compute = _compute_numpy
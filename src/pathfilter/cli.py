@@ -2,11 +2,13 @@
 import argparse
 import sys
 import csv
+from itertools import combinations
 from pathlib import Path as FilePath
 from typing import List, Optional
 
 from pathfilter.query_loader import load_all_queries, Query
 from pathfilter.path_loader import load_paths_for_query
+from pathfilter.matching import compute_path_matches
 from pathfilter.filters import (
     FilterFunction,
     no_dupe_types,
@@ -24,7 +26,6 @@ from pathfilter.filters import (
     create_max_degree_filter,
     create_max_path_count_filter
 )
-from itertools import combinations
 from pathfilter.evaluation import (
     evaluate_filter_strategy,
     evaluate_multiple_strategies,
@@ -75,44 +76,35 @@ def generate_all_filter_combinations(
         }
 
     # Separate node filters (IC, degree) from path-based filters
-    node_filters = {name: func for name, func in filter_dict.items()
-                   if name.startswith("min_ic_") or name.startswith("max_degree_")}
-    path_filters = {name: func for name, func in filter_dict.items()
-                   if not (name.startswith("min_ic_") or name.startswith("max_degree_"))}
+    node_items = [(name, func) for name, func in filter_dict.items()
+                  if name.startswith("min_ic_") or name.startswith("max_degree_")]
+    path_items = [(name, func) for name, func in filter_dict.items()
+                  if not (name.startswith("min_ic_") or name.startswith("max_degree_"))]
+
+    max_size = max_combination_size if max_combination_size is not None else len(path_items)
 
     strategies = {}
 
     # Baseline: no filtering
     strategies["none"] = [all_paths]
 
-    # Individual filters (both path and IC)
+    # Individual filters (both path and node), in filter_dict order
     for name, filter_func in filter_dict.items():
         strategies[name] = [filter_func]
 
-    # All combinations of path filters (size 1 to N)
-    path_filter_names = list(path_filters.keys())
-    max_size = max_combination_size if max_combination_size is not None else len(path_filter_names)
-
-    # Generate all path filter combinations (including single filters)
-    path_combinations = []
-    for n in range(1, max_size + 1):
-        path_combinations.extend(combinations(path_filter_names, n))
-
-    # For each path filter combination, create:
-    # 1. Path filters only (for n >= 2, since n=1 is already in individual filters)
-    # 2. Path filters + each node filter
-    for combo in path_combinations:
-        if len(combo) >= 2:
-            # Add path-only combination
-            strategy_name = "+".join(combo)
-            strategy_filters = [path_filters[name] for name in combo]
-            strategies[strategy_name] = strategy_filters
-
-        # Add variants with each node filter (for all combo sizes)
-        for node_name, node_func in node_filters.items():
-            strategy_name_with_node = "+".join(combo) + "+" + node_name
-            combo_filters = [path_filters[name] for name in combo]
-            strategies[strategy_name_with_node] = combo_filters + [node_func]
+    # Each path filter combination is emitted on its own (size >= 2; single
+    # filters are already listed above) and with exactly one node filter, so
+    # node filters are never combined with each other. Combinations are
+    # generated lazily, by size and then in lexicographic order.
+    for size in range(1, min(max_size, len(path_items)) + 1):
+        for combo in combinations(path_items, size):
+            combo_names = [name for name, _ in combo]
+            combo_filters = [func for _, func in combo]
+
+            if size >= 2:
+                strategies["+".join(combo_names)] = combo_filters
+            for node_name, node_func in node_items:
+                strategies["+".join(combo_names + [node_name])] = combo_filters + [node_func]
 
     return strategies
 
@@ -134,9 +126,9 @@ def parse_filter_names(filter_spec: str) -> List[FilterFunction]:
 
     # Handle special cases
     if filter_spec == "default":
-        return DEFAULT_FILTERS
+        return list(DEFAULT_FILTERS)
     elif filter_spec == "strict":
-        return STRICT_FILTERS
+        return list(STRICT_FILTERS)
     elif filter_spec == "none" or filter_spec == "all_paths":
         return [all_paths]
 
@@ -179,10 +171,11 @@ def evaluate_query(
         print(f"Warning: No paths found for query {query.name}")
         return None
 
-    # Get expected nodes (already normalized in the input data)
-    expected_nodes = set()
-    for curies_list in query.expected_nodes.values():
-        expected_nodes.update(curies_list)
+    # Get expected nodes (already normalized in the input data). A frozenset
+    # is built once here and shared, unchanged, by every strategy below.
+    expected_nodes = frozenset(
+        curie for curies_list in query.expected_nodes.values() for curie in curies_list
+    )
 
     if not expected_nodes:
         print(f"Warning: No expected nodes for query {query.name}")
@@ -193,10 +186,13 @@ def evaluate_query(
         # Optimized: evaluate all combinations using caching
         results = evaluate_multiple_strategies(paths, expected_nodes, individual_filters)
     elif filter_strategies is not None:
-        # Custom: evaluate each strategy separately
+        # Custom: evaluate each strategy separately, matching expected nodes once
+        baseline = compute_path_matches(paths, expected_nodes)
         results = []
         for strategy_name, filters in filter_strategies.items():
-            metrics = evaluate_filter_strategy(paths, expected_nodes, filters, strategy_name)
+            metrics = evaluate_filter_strategy(
+                paths, expected_nodes, filters, strategy_name, baseline=baseline
+            )
             results.append(metrics)
     else:
         raise ValueError("Must provide either individual_filters or filter_strategies")
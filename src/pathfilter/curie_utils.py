@@ -2,6 +2,28 @@
 import re
 from typing import List
 
+# Patterns are compiled once at import rather than looked up on every call.
+
+# A single CURIE: PREFIX:ID, prefix starting with an uppercase letter, both
+# sides limited to alphanumerics, dots, underscores and hyphens
+_CURIE_PATTERN = r'[A-Z][A-Za-z0-9._-]*:[A-Za-z0-9._-]+'
+_VALID_CURIE_RE = re.compile(_CURIE_PATTERN)
+
+# Annotated strings ("CURIE -> text CURIE -> text"): match CURIEs preceded by
+# start, whitespace, lowercase letter, or digit. Lowercase letter handles
+# "geneAraPort:123" -> extracts "AraPort:123" (lookbehind, not included in match)
+_ANNOTATED_CURIE_RE = re.compile(r'(?:^|(?<=[\s\da-z]))(' + _CURIE_PATTERN + ')')
+
+# Concatenated CURIEs: PREFIX:ID, where the (non-greedy) ID stops before the
+# next uppercase-letter + word chars + colon that starts a new CURIE
+_CONCATENATED_CURIE_RE = re.compile(r'[A-Z][A-Za-z0-9._-]*:[A-Za-z0-9._-]+?(?=[A-Z][A-Za-z]*:|$)')
+
+# Cell values (after str() and strip()) that mean "no CURIEs"
+_EMPTY_VALUES = frozenset({'', 'nan'})
+
+# Common CURIE prefixes that may appear glued to preceding annotation text
+_KNOWN_PREFIXES = ('NCBIGene', 'MONDO', 'CHEBI', 'UMLS', 'GO', 'PR', 'UniProtKB', 'ENSEMBL', 'NCIT', 'AraPort')
+
 
 def is_valid_curie(curie: str) -> bool:
     """
@@ -20,29 +42,12 @@ def is_valid_curie(curie: str) -> bool:
     Returns:
         True if valid CURIE, False otherwise
     """
-    if not curie or not isinstance(curie, str):
-        return False
-
-    # Must contain exactly one colon
-    if curie.count(':') != 1:
-        return False
-
-    prefix, id_part = curie.split(':')
-
-    # Prefix must be non-empty and start with uppercase
-    if not prefix or not prefix[0].isupper():
+    if not isinstance(curie, str):
         return False
 
-    # ID part must be non-empty
-    if not id_part:
-        return False
-
-    # Both parts should only contain valid CURIE characters
-    valid_pattern = r'^[A-Za-z0-9._-]+$'
-    if not re.match(valid_pattern, prefix) or not re.match(valid_pattern, id_part):
-        return False
-
-    return True
+    # The allowed character sets exclude ':', so a full match also means
+    # exactly one colon with a non-empty prefix and ID
+    return _VALID_CURIE_RE.fullmatch(curie) is not None
 
 
 def parse_concatenated_curies(curie_string: str) -> List[str]:
@@ -80,10 +85,13 @@ def parse_concatenated_curies(curie_string: str) -> List[str]:
     Returns:
         List of individual CURIE strings (validated)
     """
-    if not curie_string or curie_string.strip() == '' or str(curie_string) == 'nan':
+    # curie_string != curie_string catches float NaN from empty spreadsheet cells
+    if curie_string is None or curie_string != curie_string:
         return []
 
     curie_string = str(curie_string).strip()
+    if curie_string in _EMPTY_VALUES:
+        return []
 
     # Strip annotations: remove any text after " -> " markers
     # This handles cases like "NCBIGene:2739 -> human geneAraPort:AT3G14420 -> Arabidopsis gene"
@@ -95,13 +103,9 @@ def parse_concatenated_curies(curie_string: str) -> List[str]:
 
         # Extract all CURIEs from each part
         all_curies = []
-        # Match CURIEs that are preceded by start, whitespace, lowercase letter, or digit
-        # Lowercase letter handles "geneAraPort:123" -> extracts "AraPort:123"
-        # Use lookbehind for lowercase but don't include it in match
-        curie_pattern = r'(?:^|(?<=[\s\da-z]))([A-Z][A-Za-z0-9._-]*:[A-Za-z0-9._-]+)'
         for part in parts:
             # Find all CURIEs in this part
-            matches = re.finditer(curie_pattern, part)
+            matches = _ANNOTATED_CURIE_RE.finditer(part)
             # Extract the capturing group (group 1)
             curies_in_part = [m.group(1) for m in matches]
 
@@ -116,12 +120,11 @@ def parse_concatenated_curies(curie_string: str) -> List[str]:
                 # Pattern: look for a common CURIE prefix at the end
                 # Common prefixes: NCBIGene, MONDO, CHEBI, UMLS, GO, PR, UniProtKB, ENSEMBL, etc.
                 # Check if the curie prefix contains a known prefix
-                known_prefixes = ['NCBIGene', 'MONDO', 'CHEBI', 'UMLS', 'GO', 'PR', 'UniProtKB', 'ENSEMBL', 'NCIT', 'AraPort']
                 prefix = curie.split(':')[0]
 
                 # If the prefix ends with a known prefix, extract just that part
                 matched_known = False
-                for known in known_prefixes:
+                for known in _KNOWN_PREFIXES:
                     if prefix.endswith(known) and len(prefix) > len(known):
                         # Extract just the known prefix part
                         real_curie = known + ':' + curie.split(':')[1]
@@ -140,14 +143,8 @@ def parse_concatenated_curies(curie_string: str) -> List[str]:
             validated = [c for c in all_curies if is_valid_curie(c)]
             return validated
 
-    # Pattern for a CURIE: PREFIX:ID
-    # PREFIX: uppercase letter followed by letters/numbers/dots/underscores/hyphens (non-greedy)
-    # ID: anything that's not an uppercase letter starting a new prefix
-    # We use a lookahead to stop before the next CURIE starts
-    # A new CURIE starts with: uppercase letter + more word chars + colon
-    curie_pattern = r'[A-Z][A-Za-z0-9._-]*:[A-Za-z0-9._-]+?(?=[A-Z][A-Za-z]*:|$)'
-
-    matches = re.findall(curie_pattern, curie_string)
+    # Split into PREFIX:ID matches, each stopping where the next CURIE starts
+    matches = _CONCATENATED_CURIE_RE.findall(curie_string)
 
     # Validate all matches
     validated_matches = [m for m in matches if is_valid_curie(m)]
@@ -159,7 +156,9 @@ def parse_path_curies(path_curie_string: str) -> List[str]:
     """
     Parse a path_curies string into individual node CURIEs.
 
-    Path curies are separated by ' --> ' (space-arrow-space).
+    Path curies are separated by ' --> ' (space-arrow-space); whitespace
+    around each CURIE is stripped. An arrow without the surrounding spaces
+    is not a separator.
 
     Example:
         >>> parse_path_curies("CHEBI:15647 --> NCBIGene:100133941 --> NCBIGene:4907 --> UNII:31YO63LBSN")
@@ -174,8 +173,15 @@ def parse_path_curies(path_curie_string: str) -> List[str]:
     if not path_curie_string or str(path_curie_string).strip() == '':
         return []
 
-    # Split on the arrow separator
     curies = path_curie_string.split(' --> ')
-
-    # Strip whitespace from each CURIE
+    # Fast path for the canonical "A --> B --> C" form written by the path
+    # files: when the only whitespace is the spaces of the separators (no
+    # tabs or newlines, which isprintable() rejects, and one space on each
+    # side of every arrow), no part needs stripping
+    if (path_curie_string.isprintable()
+            and path_curie_string.count(' ') == 2 * (len(curies) - 1)
+            and all(curies)):
+        return curies
+
+    # Split on the arrow separator and strip whitespace from each CURIE
     return [c.strip() for c in curies if c.strip()]
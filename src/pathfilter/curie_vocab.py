@@ -0,0 +1,81 @@
+"""Integer encoding of CURIEs for vectorized matching.
+
+Every CURIE seen while loading paths is assigned a stable int32 id. Paths
+then carry their CURIEs as a compact numpy array, and membership tests
+against a set of expected nodes become a bitset lookup instead of a
+Python string hash per CURIE.
+"""
+from typing import Dict, Iterable, List
+import numpy as np
+
+
+class Vocab:
+    """Maps CURIE strings to dense int32 ids."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, curie: str) -> bool:
+        return curie in self._ids
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return a copy of the CURIE -> id mapping (e.g. to send to worker processes)."""
+        return dict(self._ids)
+
+    def restore(self, ids: Dict[str, int]) -> None:
+        """
+        Replace the mapping with a snapshot taken from another Vocab.
+
+        Used to make ids in a worker process agree with the parent process.
+
+        Args:
+            ids: Mapping returned by snapshot()
+        """
+        self._ids = dict(ids)
+
+    def encode(self, curies: List[str]) -> np.ndarray:
+        """
+        Encode CURIEs as int32 ids, assigning new ids to unseen CURIEs.
+
+        Args:
+            curies: List of CURIE strings
+
+        Returns:
+            int32 array with one id per input CURIE
+        """
+        ids = self._ids
+        encoded = np.empty(len(curies), dtype=np.int32)
+        for i, curie in enumerate(curies):
+            curie_id = ids.get(curie)
+            if curie_id is None:
+                curie_id = len(ids)
+                ids[curie] = curie_id
+            encoded[i] = curie_id
+        return encoded
+
+    def bitset(self, curies: Iterable[str]) -> np.ndarray:
+        """
+        Build a boolean lookup table marking the given CURIEs.
+
+        CURIEs that have never been encoded cannot appear in any encoded
+        path, so they are skipped rather than added to the vocabulary.
+
+        Args:
+            curies: CURIEs to mark (e.g. expected nodes)
+
+        Returns:
+            Boolean array of length len(self), True at the ids of known CURIEs
+        """
+        ids = self._ids
+        bitset = np.zeros(len(ids), dtype=bool)
+        known = [ids[curie] for curie in curies if curie in ids]
+        if known:
+            bitset[known] = True
+        return bitset
+
+
+# Shared vocabulary so ids are comparable across path files and queries
+CURIE_VOCAB = Vocab()
@@ -1,17 +1,26 @@
 """Evaluation metrics for path filtering."""
-from dataclasses import dataclass
-from typing import List, Set, Optional
-from pathfilter.path_loader import Path
-from pathfilter.filters import FilterFunction, apply_filters
-from pathfilter.matching import (
-    count_paths_with_expected_nodes,
-    get_expected_nodes_found_in_paths
-)
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import AbstractSet, List, Optional
+import numpy as np
+from pathfilter.path_loader import Path, PathBatch
+from pathfilter.filters import FilterFunction, all_paths, batch_ic_pass, compute_filter_mask
+from pathfilter.matching import compute_path_matches, PathMatchResult
 
 
-@dataclass
+def _ratio(numerator: float, denominator: float) -> float:
+    """Divide, returning 0.0 when the denominator is zero."""
+    return numerator / denominator if denominator else 0.0
+
+
+@dataclass(frozen=True, slots=True)
 class FilterMetrics:
-    """Metrics for evaluating a filter strategy on a set of paths."""
+    """
+    Metrics for evaluating a filter strategy on a set of paths.
+
+    The derived rates are computed once when the metrics are created, since
+    reports read each of them for every strategy.
+    """
 
     filter_name: str  # Name of the filter strategy
     total_paths_before: int  # Total paths before filtering
@@ -21,80 +30,53 @@ class FilterMetrics:
     expected_nodes_found_before: int  # Number of unique expected nodes found before
     expected_nodes_found_after: int  # Number of unique expected nodes found after
 
-    @property
-    def recall(self) -> float:
-        """
-        Recall: fraction of expected paths that were kept.
-
-        recall = expected_paths_after / expected_paths_before
-        """
-        if self.expected_paths_before == 0:
-            return 0.0
-        return self.expected_paths_after / self.expected_paths_before
-
-    @property
-    def precision_before(self) -> float:
-        """
-        Precision before filtering: fraction of paths with expected nodes.
-
-        precision = expected_paths / total_paths
-        """
-        if self.total_paths_before == 0:
-            return 0.0
-        return self.expected_paths_before / self.total_paths_before
-
-    @property
-    def precision_after(self) -> float:
-        """
-        Precision after filtering: fraction of paths with expected nodes.
-
-        precision = expected_paths / total_paths
-        """
-        if self.total_paths_after == 0:
-            return 0.0
-        return self.expected_paths_after / self.total_paths_after
-
-    @property
-    def enrichment(self) -> float:
-        """
-        Enrichment: improvement in precision from filtering.
-
-        enrichment = precision_after / precision_before
-
-        Values > 1.0 indicate filtering improved precision.
-        """
-        if self.precision_before == 0:
-            return 0.0
-        return self.precision_after / self.precision_before
-
-    @property
-    def retention_rate(self) -> float:
-        """
-        Retention rate: fraction of paths kept after filtering.
-
-        retention = total_paths_after / total_paths_before
-        """
-        if self.total_paths_before == 0:
-            return 0.0
-        return self.total_paths_after / self.total_paths_before
-
-    @property
-    def expected_nodes_recall(self) -> float:
-        """
-        Recall for expected nodes: fraction of unique expected nodes still found.
-
-        node_recall = expected_nodes_found_after / expected_nodes_found_before
-        """
-        if self.expected_nodes_found_before == 0:
-            return 0.0
-        return self.expected_nodes_found_after / self.expected_nodes_found_before
+    # Recall: fraction of expected paths that were kept
+    # recall = expected_paths_after / expected_paths_before
+    recall: float = field(init=False, repr=False, compare=False)
+
+    # Precision before filtering: fraction of paths with expected nodes
+    # precision = expected_paths / total_paths
+    precision_before: float = field(init=False, repr=False, compare=False)
+
+    # Precision after filtering: fraction of paths with expected nodes
+    # precision = expected_paths / total_paths
+    precision_after: float = field(init=False, repr=False, compare=False)
+
+    # Enrichment: improvement in precision from filtering
+    # enrichment = precision_after / precision_before
+    # Values > 1.0 indicate filtering improved precision.
+    enrichment: float = field(init=False, repr=False, compare=False)
+
+    # Retention rate: fraction of paths kept after filtering
+    # retention = total_paths_after / total_paths_before
+    retention_rate: float = field(init=False, repr=False, compare=False)
+
+    # Recall for expected nodes: fraction of unique expected nodes still found
+    # node_recall = expected_nodes_found_after / expected_nodes_found_before
+    expected_nodes_recall: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        precision_before = _ratio(self.expected_paths_before, self.total_paths_before)
+        precision_after = _ratio(self.expected_paths_after, self.total_paths_after)
+
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        set_field = object.__setattr__
+        set_field(self, 'recall', _ratio(self.expected_paths_after, self.expected_paths_before))
+        set_field(self, 'precision_before', precision_before)
+        set_field(self, 'precision_after', precision_after)
+        set_field(self, 'enrichment', _ratio(precision_after, precision_before))
+        set_field(self, 'retention_rate', _ratio(self.total_paths_after, self.total_paths_before))
+        set_field(self, 'expected_nodes_recall', _ratio(
+            self.expected_nodes_found_after, self.expected_nodes_found_before
+        ))
 
 
 def evaluate_filter_strategy(
     paths: List[Path],
-    expected_nodes: Set[str],
+    expected_nodes: AbstractSet[str],
     filters: List[FilterFunction],
-    strategy_name: str
+    strategy_name: str,
+    baseline: Optional[PathMatchResult] = None
 ) -> FilterMetrics:
     """
     Evaluate a filter strategy on a set of paths.
@@ -103,25 +85,51 @@ def evaluate_filter_strategy(
 
     Args:
         paths: List of Path objects to evaluate (pre-normalized)
-        expected_nodes: Set of expected node CURIEs (pre-normalized)
+        expected_nodes: Set of expected node CURIEs (pre-normalized). Pass a
+                        frozenset when evaluating many strategies; it is then
+                        used as is instead of being copied per call.
         filters: List of filter functions to apply
         strategy_name: Name for this filter strategy
+        baseline: Optional result of compute_path_matches(paths, expected_nodes).
+                  Pass it when evaluating several strategies on the same paths
+                  so expected-node matching is done only once.
 
     Returns:
         FilterMetrics with evaluation results
     """
+    expected_nodes = frozenset(expected_nodes)
+
     # Metrics before filtering
     total_before = len(paths)
-    expected_before = count_paths_with_expected_nodes(paths, expected_nodes)
-    nodes_before = len(get_expected_nodes_found_in_paths(paths, expected_nodes))
+    if baseline is None:
+        baseline = compute_path_matches(paths, expected_nodes)
+    expected_before = baseline.hit_count
+    nodes_before = len(baseline.found_nodes)
+
+    # all_paths keeps everything, so a strategy made only of it (the "none"
+    # baseline) or an empty path list keeps the baseline counts unchanged
+    filters = [filter_func for filter_func in filters if filter_func is not all_paths]
+    if not filters or not paths:
+        return FilterMetrics(
+            filter_name=strategy_name,
+            total_paths_before=total_before,
+            total_paths_after=total_before,
+            expected_paths_before=expected_before,
+            expected_paths_after=expected_before,
+            expected_nodes_found_before=nodes_before,
+            expected_nodes_found_after=nodes_before
+        )
 
-    # Apply filters
-    filtered_paths = apply_filters(paths, filters)
+    # Apply filters (a path is kept only if ALL filters pass)
+    kept = compute_filter_mask(paths, filters)
 
-    # Metrics after filtering
-    total_after = len(filtered_paths)
-    expected_after = count_paths_with_expected_nodes(filtered_paths, expected_nodes)
-    nodes_after = len(get_expected_nodes_found_in_paths(filtered_paths, expected_nodes))
+    # Metrics after filtering, reusing the baseline hit mask
+    kept_hits = np.flatnonzero(kept & baseline.hit_mask)
+    total_after = int(kept.sum())
+    expected_after = len(kept_hits)
+    nodes_after = len(set().union(
+        *(paths[i].path_curies_set & expected_nodes for i in kept_hits)
+    ))
 
     return FilterMetrics(
         filter_name=strategy_name,
@@ -134,20 +142,42 @@ def evaluate_filter_strategy(
     )
 
 
+def _pack_filter_rows(filter_mask: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Pack each row of a (paths x filters) boolean matrix into a uint64.
+
+    Bit i of a path's value is set when the path passes filter i.
+
+    Args:
+        filter_mask: Boolean array of shape (num_paths, num_filters)
+
+    Returns:
+        uint64 array with one value per path, or None if there are more
+        filters than fit in 64 bits
+    """
+    num_filters = filter_mask.shape[1]
+    if num_filters > 64:
+        return None
+    bit_values = np.left_shift(np.uint64(1), np.arange(num_filters, dtype=np.uint64))
+    return np.bitwise_or.reduce(
+        np.where(filter_mask, bit_values, np.uint64(0)), axis=1
+    ).astype(np.uint64)
+
+
 def evaluate_multiple_strategies(
     paths: List[Path],
-    expected_nodes: Set[str],
+    expected_nodes: AbstractSet[str],
     individual_filters: dict[str, FilterFunction],
     max_combination_size: Optional[int] = None
 ) -> List[FilterMetrics]:
     """
-    Evaluate all combinations of filters using optimized caching approach.
+    Evaluate all combinations of filters using a precomputed filter matrix.
 
     Instead of re-applying filters for every combination, this function:
-    1. Applies each filter once, caching which paths pass
-    2. Computes combinations using set intersections (fast!)
+    1. Applies each filter once, storing a boolean (paths x filters) matrix
+    2. Reduces each combination with a row-wise AND over its filter columns
 
-    This is dramatically faster: O(N*F) instead of O(N*F*C) where:
+    This is dramatically faster: O(N*F) filter calls instead of O(N*F*C) where:
     - N = number of paths
     - F = number of individual filters
     - C = number of combinations (exponential in F)
@@ -163,21 +193,73 @@ def evaluate_multiple_strategies(
     Returns:
         List of FilterMetrics, one for each combination
     """
-    from itertools import combinations as combo_generator
+    # One frozenset shared by every strategy; frozenset() of a frozenset
+    # returns it unchanged
+    expected_nodes = frozenset(expected_nodes)
 
-    # Step 1: Apply each filter once and cache passing paths
-    filter_cache = {}
-    for filter_name, filter_func in individual_filters.items():
-        passing_paths = set()
-        for i, path in enumerate(paths):
-            if filter_func(path):
-                passing_paths.add(i)  # Store index, not object
-        filter_cache[filter_name] = passing_paths
+    # Step 1: Apply each filter once, one column per filter
+    filter_names = list(individual_filters.keys())
+    filter_column = {name: col for col, name in enumerate(filter_names)}
+    filter_mask = np.empty((len(paths), len(filter_names)), dtype=bool)
+
+    # min-IC filters over the same IC data share one score lookup and are
+    # evaluated together by the threshold kernel; filters with a .batch
+    # version run vectorized over a PathBatch; the rest run per path
+    ic_groups = {}  # id(ic_data) -> (ic_data, [columns], [thresholds])
+    batch = None
+    for col, filter_func in enumerate(individual_filters.values()):
+        ic_data = getattr(filter_func, "ic_data", None)
+        batch_func = getattr(filter_func, "batch", None)
+        if filter_func is all_paths:
+            filter_mask[:, col] = True
+        elif ic_data is not None:
+            group = ic_groups.setdefault(id(ic_data), (ic_data, [], []))
+            group[1].append(col)
+            group[2].append(filter_func.min_ic)
+        elif batch_func is not None:
+            if batch is None:
+                batch = PathBatch.from_paths(paths)
+            filter_mask[:, col] = batch_func(batch)
+        else:
+            filter_mask[:, col] = np.fromiter(
+                (filter_func(path) for path in paths), dtype=bool, count=len(paths)
+            )
+
+    for ic_data, columns, thresholds in ic_groups.values():
+        if batch is None:
+            batch = PathBatch.from_paths(paths)
+        filter_mask[:, columns] = batch_ic_pass(batch, ic_data, thresholds)
 
     # Baseline metrics (no filtering)
     total_before = len(paths)
-    expected_before = count_paths_with_expected_nodes(paths, expected_nodes)
-    nodes_before = len(get_expected_nodes_found_in_paths(paths, expected_nodes))
+    matches_before = compute_path_matches(paths, expected_nodes)
+    hit_mask = matches_before.hit_mask
+    expected_before = matches_before.hit_count
+    nodes_before = len(matches_before.found_nodes)
+
+    # Which expected nodes each hit path contains, as a (hit paths x found
+    # nodes) boolean matrix built once. Found nodes after filtering are then
+    # a column-wise any() over the kept rows, not a set union per strategy.
+    hit_indices = np.flatnonzero(hit_mask)
+    node_column = {node: col for col, node in enumerate(matches_before.found_nodes)}
+    hit_node_matrix = np.zeros((len(hit_indices), len(node_column)), dtype=bool)
+    for row, i in enumerate(hit_indices):
+        columns = [node_column[node] for node in paths[i].path_curies_set & expected_nodes]
+        hit_node_matrix[row, columns] = True
+
+    def strategy_metrics(strategy_name: str, kept: np.ndarray) -> FilterMetrics:
+        """Metrics for the paths selected by a boolean keep mask."""
+        kept_hit_rows = kept[hit_indices]
+        found_after = int(hit_node_matrix[kept_hit_rows].any(axis=0).sum())
+        return FilterMetrics(
+            filter_name=strategy_name,
+            total_paths_before=total_before,
+            total_paths_after=int(kept.sum()),
+            expected_paths_before=expected_before,
+            expected_paths_after=int(kept_hit_rows.sum()),
+            expected_nodes_found_before=nodes_before,
+            expected_nodes_found_after=found_after
+        )
 
     results = []
 
@@ -192,86 +274,49 @@ def evaluate_multiple_strategies(
         expected_nodes_found_after=nodes_before
     ))
 
-    # Step 2: Generate all combinations using set intersections
+    # Step 2: Generate all combinations by AND-ing filter columns
     # Separate node filters (IC, degree, path_count) from path filters
     # Node filters are never combined with each other
-    filter_names = list(individual_filters.keys())
     node_filters = [name for name in filter_names
                    if name.startswith("min_ic_") or name.startswith("max_degree_") or name.startswith("max_path_count_")]
     path_filters = [name for name in filter_names
                    if not (name.startswith("min_ic_") or name.startswith("max_degree_") or name.startswith("max_path_count_"))]
 
-    # Add individual node filters
-    for node_filter_name in node_filters:
-        passing_indices = filter_cache[node_filter_name]
-        filtered_paths = [paths[i] for i in passing_indices]
+    # Each path's filter results packed into one integer, so a combination
+    # is a single AND + compare per path instead of a column gather
+    path_bits = _pack_filter_rows(filter_mask)
 
-        total_after = len(filtered_paths)
-        expected_after = count_paths_with_expected_nodes(filtered_paths, expected_nodes)
-        nodes_after = len(get_expected_nodes_found_in_paths(filtered_paths, expected_nodes))
+    def combination_kept(combo_bits: int) -> np.ndarray:
+        """Boolean mask of paths passing every filter whose column bit is set."""
+        if path_bits is None:
+            columns = [col for col in range(len(filter_names)) if (combo_bits >> col) & 1]
+            return filter_mask[:, columns].all(axis=1)
+        combo_bits = np.uint64(combo_bits)
+        return (path_bits & combo_bits) == combo_bits
 
-        results.append(FilterMetrics(
-            filter_name=node_filter_name,
-            total_paths_before=total_before,
-            total_paths_after=total_after,
-            expected_paths_before=expected_before,
-            expected_paths_after=expected_after,
-            expected_nodes_found_before=nodes_before,
-            expected_nodes_found_after=nodes_after
-        ))
+    # Add individual node filters
+    node_bits = [1 << filter_column[name] for name in node_filters]
+    for node_filter_name, node_bit in zip(node_filters, node_bits):
+        results.append(strategy_metrics(node_filter_name, combination_kept(node_bit)))
 
     max_size = max_combination_size if max_combination_size is not None else len(path_filters)
 
-    # Path filter combinations (singles, pairs, triples, etc.)
-    for n in range(1, max_size + 1):
-        for combo in combo_generator(path_filters, n):
-
-            # Intersection of all filters in this combination
-            passing_indices = filter_cache[combo[0]].copy()
-            for filter_name in combo[1:]:
-                passing_indices &= filter_cache[filter_name]
-
-            # Build list of filtered paths
-            filtered_paths = [paths[i] for i in passing_indices]
-
-            # Calculate metrics
-            total_after = len(filtered_paths)
-            expected_after = count_paths_with_expected_nodes(filtered_paths, expected_nodes)
-            nodes_after = len(get_expected_nodes_found_in_paths(filtered_paths, expected_nodes))
-
-            strategy_name = "+".join(combo)
-            results.append(FilterMetrics(
-                filter_name=strategy_name,
-                total_paths_before=total_before,
-                total_paths_after=total_after,
-                expected_paths_before=expected_before,
-                expected_paths_after=expected_after,
-                expected_nodes_found_before=nodes_before,
-                expected_nodes_found_after=nodes_after
-            ))
+    # Path filter combinations (singles, pairs, triples, etc.), each as the
+    # OR of its filters' column bits
+    path_items = [(name, 1 << filter_column[name]) for name in path_filters]
+    for n in range(1, min(max_size, len(path_items)) + 1):
+        for combo in combinations(path_items, n):
+            combo_name = "+".join(name for name, _ in combo)
+            combo_bits = sum(bit for _, bit in combo)
+
+            # Paths passing every filter in this combination
+            results.append(strategy_metrics(combo_name, combination_kept(combo_bits)))
 
             # Also evaluate this combination with each node filter
-            for node_filter_name in node_filters:
-                # Intersect with node filter
-                node_passing_indices = passing_indices & filter_cache[node_filter_name]
-
-                # Build list of filtered paths
-                node_filtered_paths = [paths[i] for i in node_passing_indices]
-
-                # Calculate metrics
-                node_total_after = len(node_filtered_paths)
-                node_expected_after = count_paths_with_expected_nodes(node_filtered_paths, expected_nodes)
-                node_nodes_after = len(get_expected_nodes_found_in_paths(node_filtered_paths, expected_nodes))
-
-                node_strategy_name = "+".join(combo) + "+" + node_filter_name
-                results.append(FilterMetrics(
-                    filter_name=node_strategy_name,
-                    total_paths_before=total_before,
-                    total_paths_after=node_total_after,
-                    expected_paths_before=expected_before,
-                    expected_paths_after=node_expected_after,
-                    expected_nodes_found_before=nodes_before,
-                    expected_nodes_found_after=node_nodes_after
+            for node_filter_name, node_bit in zip(node_filters, node_bits):
+                results.append(strategy_metrics(
+                    combo_name + "+" + node_filter_name,
+                    combination_kept(combo_bits | node_bit)
                 ))
 
     return results
@@ -281,15 +326,20 @@ def format_metrics_table(metrics_list: List[FilterMetrics]) -> str:
     """
     Format a list of metrics as a readable table.
 
+    The strategy column is widened to fit the longest strategy name, so
+    combination names do not push the other columns out of line.
+
     Args:
         metrics_list: List of FilterMetrics to format
 
     Returns:
         String with formatted table
     """
+    name_width = max([20] + [len(m.filter_name) for m in metrics_list])
+
     # Header
     header = (
-        f"{'Strategy':<20} "
+        f"{'Strategy':<{name_width}} "
         f"{'Paths':<12} "
         f"{'Expected':<12} "
         f"{'Recall':<8} "
@@ -297,20 +347,16 @@ def format_metrics_table(metrics_list: List[FilterMetrics]) -> str:
         f"{'Enrichment':<10} "
         f"{'Nodes':<8}"
     )
-    separator = "-" * len(header)
-
-    lines = [header, separator]
-
-    for m in metrics_list:
-        line = (
-            f"{m.filter_name:<20} "
-            f"{m.total_paths_after:>6}/{m.total_paths_before:<5} "
-            f"{m.expected_paths_after:>6}/{m.expected_paths_before:<5} "
-            f"{m.recall:>7.2%} "
-            f"{m.precision_after:>9.2%} "
-            f"{m.enrichment:>9.2f}x "
-            f"{m.expected_nodes_found_after:>3}/{m.expected_nodes_found_before:<3}"
-        )
-        lines.append(line)
 
-    return "\n".join(lines)
+    rows = [
+        f"{m.filter_name:<{name_width}} "
+        f"{m.total_paths_after:>6}/{m.total_paths_before:<5} "
+        f"{m.expected_paths_after:>6}/{m.expected_paths_before:<5} "
+        f"{m.recall:>7.2%} "
+        f"{m.precision_after:>9.2%} "
+        f"{m.enrichment:>9.2f}x "
+        f"{m.expected_nodes_found_after:>3}/{m.expected_nodes_found_before:<3}"
+        for m in metrics_list
+    ]
+
+    return "\n".join([header, "-" * len(header), *rows])
@@ -3,13 +3,62 @@
 Each filter function takes a Path object and returns True if the path should be kept,
 False if it should be filtered out.
 """
-from pathfilter.path_loader import Path
-from typing import Callable, Dict, List
+from pathfilter.path_loader import Path, PathBatch, parse_hop_predicates, split_categories
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import compress
+from typing import Callable, Dict, List, Optional, TextIO, Union
+import os
+import pickle
+import numpy as np
+from pathfilter.curie_vocab import CURIE_VOCAB
+from pathfilter import _category_kernel, _ic_kernel
 
 
 # Type alias for filter functions
 FilterFunction = Callable[[Path], bool]
 
+# Paths sampled by order_by_selectivity to estimate rejection rates
+PROFILE_SAMPLE_SIZE = 1000
+
+# Composed filter chains kept by compose_filters; bounded because factory
+# filters (IC, degree, path count) hold their node data in closures
+COMPOSED_CACHE_SIZE = 64
+
+# Node types treated as the same type by the duplicate-type filters:
+# chemical types are all ChemicalEntity, Protein is Gene
+_EQUIVALENT_TYPE = {
+    "biolink:SmallMolecule": "biolink:ChemicalEntity",
+    "biolink:MolecularMixture": "biolink:ChemicalEntity",
+    "biolink:ComplexMolecularMixture": "biolink:ChemicalEntity",
+    "biolink:Protein": "biolink:Gene",
+}
+
+# Type equivalence classes for no_abab
+_ABAB_TYPE_CLASS = {
+    # Disease/PhenotypicFeature equivalence
+    "biolink:Disease": "CLASS_DISEASE",
+    "biolink:PhenotypicFeature": "CLASS_DISEASE",
+    # Chemical equivalence
+    "biolink:SmallMolecule": "CLASS_CHEMICAL",
+    "biolink:ChemicalEntity": "CLASS_CHEMICAL",
+    "biolink:MolecularMixture": "CLASS_CHEMICAL",
+    "biolink:ComplexMolecularMixture": "CLASS_CHEMICAL",
+    # Gene/Protein equivalence
+    "biolink:Gene": "CLASS_GENE",
+    "biolink:Protein": "CLASS_GENE",
+}
+
+# Leading node-type pairs rejected by no_chemical_start
+_CHEMICAL_STARTS = frozenset({
+    ("biolink:Disease", "biolink:SmallMolecule"),
+    ("biolink:Disease", "biolink:ChemicalEntity"),
+    ("biolink:Disease", "biolink:MolecularMixture"),
+})
+
+# Trailing node-type pair rejected by no_end_pheno
+_PHENO_END = ("biolink:PhenotypicFeature", "biolink:SmallMolecule")
+
 
 def no_dupe_types(path: Path) -> bool:
     """
@@ -26,19 +75,15 @@ def no_dupe_types(path: Path) -> bool:
     Returns:
         True if path has 4 unique types, False otherwise
     """
-    types = path.categories.split(" --> ")
-    normalized_types = []
+    # Depends only on the category chain, so computed once per distinct chain
+    return _chain_has_unique_types(path.categories)
 
-    for tp in types:
-        if tp in ["biolink:ChemicalEntity", "biolink:SmallMolecule",
-                  "biolink:MolecularMixture", "biolink:ComplexMolecularMixture"]:
-            normalized_types.append("biolink:ChemicalEntity")
-        elif tp in ["biolink:Protein"]:
-            normalized_types.append("biolink:Gene")
-        else:
-            normalized_types.append(tp)
 
-    n_unique = len(set(normalized_types))
+@lru_cache(maxsize=None)
+def _chain_has_unique_types(categories: str) -> bool:
+    """no_dupe_types for a categories string."""
+    types = split_categories(categories)
+    n_unique = len({_EQUIVALENT_TYPE.get(tp, tp) for tp in types})
     return n_unique == 4
 
 
@@ -52,18 +97,13 @@ def no_expression(path: Path) -> bool:
     Returns:
         True if path does not contain expressed_in, False otherwise
     """
-    # Check all predicate fields
-    predicates = [
-        path.first_hop_predicates,
-        path.second_hop_predicates,
-        path.third_hop_predicates
-    ]
-
-    for pred in predicates:
-        if "expressed_in" in pred:
-            return False
-
-    return True
+    # Substring checks on the raw predicate strings; these measure faster
+    # than walking the parsed hop_predicates, and the first hit short-circuits
+    return not (
+        "expressed_in" in path.first_hop_predicates
+        or "expressed_in" in path.second_hop_predicates
+        or "expressed_in" in path.third_hop_predicates
+    )
 
 
 def no_related_to(path: Path) -> bool:
@@ -76,19 +116,57 @@ def no_related_to(path: Path) -> bool:
     Returns:
         True if path does not contain related_to, False otherwise
     """
-    # Check all predicate fields
-    predicates = [
-        path.categories,
-        path.first_hop_predicates,
-        path.second_hop_predicates,
-        path.third_hop_predicates
-    ]
+    # Substring checks on the raw strings, the same test no_related_to_batch
+    # applies per distinct string
+    return not (
+        "{'biolink:related_to'}" in path.categories
+        or "{'biolink:related_to'}" in path.first_hop_predicates
+        or "{'biolink:related_to'}" in path.second_hop_predicates
+        or "{'biolink:related_to'}" in path.third_hop_predicates
+    )
 
-    for pred in predicates:
-        if "{'biolink:related_to'}" in pred:
-            return False
 
-    return True
+def no_expression_batch(batch: PathBatch) -> np.ndarray:
+    """
+    Vectorized no_expression over all paths of a batch.
+
+    Args:
+        batch: PathBatch to check
+
+    Returns:
+        Boolean array, True for paths that do not contain expressed_in
+    """
+    has = batch.string_flags("expressed_in")
+    return ~(
+        has[batch.first_hop_predicates]
+        | has[batch.second_hop_predicates]
+        | has[batch.third_hop_predicates]
+    )
+
+
+def no_related_to_batch(batch: PathBatch) -> np.ndarray:
+    """
+    Vectorized no_related_to over all paths of a batch.
+
+    Args:
+        batch: PathBatch to check
+
+    Returns:
+        Boolean array, True for paths that do not contain related_to
+    """
+    has = batch.string_flags("{'biolink:related_to'}")
+    return ~(
+        has[batch.first_hop_predicates]
+        | has[batch.second_hop_predicates]
+        | has[batch.third_hop_predicates]
+        | has[batch.categories]
+    )
+
+
+# Filters with a vectorized version expose it as .batch; compute_filter_mask
+# and evaluate_multiple_strategies use it instead of calling per path
+no_expression.batch = no_expression_batch
+no_related_to.batch = no_related_to_batch
 
 
 def no_end_pheno(path: Path) -> bool:
@@ -101,7 +179,7 @@ def no_end_pheno(path: Path) -> bool:
     Returns:
         True if path does not end with this pattern, False otherwise
     """
-    return not path.categories.endswith("biolink:PhenotypicFeature --> biolink:SmallMolecule")
+    return path.categories_tuple[-2:] != _PHENO_END
 
 
 def no_chemical_start(path: Path) -> bool:
@@ -114,17 +192,99 @@ def no_chemical_start(path: Path) -> bool:
     Returns:
         True if path does not start with Disease->Chemical, False otherwise
     """
-    starts = [
-        "biolink:Disease --> biolink:SmallMolecule",
-        "biolink:Disease --> biolink:ChemicalEntity",
-        "biolink:Disease --> biolink:MolecularMixture"
-    ]
+    return path.categories_tuple[:2] not in _CHEMICAL_STARTS
 
-    for start in starts:
-        if path.categories.startswith(start):
-            return False
 
-    return True
+def _type_classes(batch: PathBatch, equivalent: Dict[str, str],
+                  drop: Optional[str] = None) -> np.ndarray:
+    """
+    Re-encode batch.category_ids so equivalent node types share an id.
+
+    Args:
+        batch: PathBatch to encode
+        equivalent: Mapping of node type -> type it is treated as
+        drop: Optional type (after mapping) encoded as -1, like padding
+
+    Returns:
+        int16 array shaped like batch.category_ids, -1 padding kept
+    """
+    classes: Dict[str, int] = {}
+    lookup = np.array([
+        -1 if equivalent.get(tp, tp) == drop
+        else classes.setdefault(equivalent.get(tp, tp), len(classes))
+        for tp in batch.category_types
+    ], dtype=np.int16)
+    if len(lookup) == 0:
+        return batch.category_ids
+    return np.where(batch.category_ids >= 0, lookup[batch.category_ids], -1).astype(np.int16)
+
+
+def _pair_mask(first: np.ndarray, second: np.ndarray, batch: PathBatch, pairs) -> np.ndarray:
+    """Boolean mask of paths whose (first, second) node type ids are one of pairs."""
+    type_id = {tp: k for k, tp in enumerate(batch.category_types)}
+    # Pair lookup table indexed by both ids in one gather. The extra last
+    # row and column stay False, and are what padding (-1) indexes
+    size = len(batch.category_types) + 1
+    table = np.zeros((size, size), dtype=bool)
+    for a, b in pairs:
+        if a in type_id and b in type_id:
+            table[type_id[a], type_id[b]] = True
+    return table[first, second]
+
+
+def no_dupe_types_batch(batch: PathBatch) -> np.ndarray:
+    """
+    Vectorized no_dupe_types over all paths of a batch.
+
+    Args:
+        batch: PathBatch to check
+
+    Returns:
+        Boolean array, True for paths with 4 unique (normalized) types
+    """
+    return _category_kernel.count_distinct(_type_classes(batch, _EQUIVALENT_TYPE)) == 4
+
+
+def no_end_pheno_batch(batch: PathBatch) -> np.ndarray:
+    """
+    Vectorized no_end_pheno over all paths of a batch.
+
+    Args:
+        batch: PathBatch to check
+
+    Returns:
+        Boolean array, True for paths that do not end PhenotypicFeature -> SmallMolecule
+    """
+    rows = np.arange(len(batch))
+    counts = batch.category_counts
+    if batch.category_ids.shape[1] < 2:
+        return np.ones(len(batch), dtype=bool)
+    # Rows with fewer than two nodes index wrapped columns; has_pair masks them
+    has_pair = counts >= 2
+    last = batch.category_ids[rows, counts - 1]
+    before_last = batch.category_ids[rows, counts - 2]
+    return ~(has_pair & _pair_mask(before_last, last, batch, [_PHENO_END]))
+
+
+def no_chemical_start_batch(batch: PathBatch) -> np.ndarray:
+    """
+    Vectorized no_chemical_start over all paths of a batch.
+
+    Args:
+        batch: PathBatch to check
+
+    Returns:
+        Boolean array, True for paths that do not start with Disease->Chemical
+    """
+    if batch.category_ids.shape[1] < 2:
+        return np.ones(len(batch), dtype=bool)
+    ids = batch.category_ids
+    return ~_pair_mask(ids[:, 0], ids[:, 1], batch, _CHEMICAL_STARTS)
+
+
+no_dupe_types.batch = no_dupe_types_batch
+no_end_pheno.batch = no_end_pheno_batch
+no_chemical_start.batch = no_chemical_start_batch
 
 
 def no_repeat_predicates(path: Path) -> bool:
@@ -137,23 +297,59 @@ def no_repeat_predicates(path: Path) -> bool:
     Returns:
         True if all predicates are unique, False if any predicate repeats
     """
-    # Collect all predicates from the three hops
-    all_predicates = []
+    first, second, third = path.hop_predicates
 
-    for pred_str in [path.first_hop_predicates, path.second_hop_predicates, path.third_hop_predicates]:
-        # pred_str is a string representation of a set like "{'biolink:affects'}"
-        # Extract the predicate(s) from the set notation
-        # Handle both single predicates and multiple predicates per hop
-        if pred_str and pred_str != "set()":
-            # Remove set notation and quotes, split on commas
-            cleaned = pred_str.strip("{}").replace("'", "").replace('"', '')
-            predicates = [p.strip() for p in cleaned.split(',')]
-            all_predicates.extend(predicates)
+    # Common case: one predicate per hop, so three comparisons suffice
+    if len(first) == 1 and len(second) == 1 and len(third) == 1:
+        a, b, c = first[0], second[0], third[0]
+        return a != b and a != c and b != c
+
+    # Collect all predicates from the three hops (parsed once per Path)
+    all_predicates = [
+        predicate for hop in path.hop_predicates for predicate in hop
+    ]
 
     # Check for duplicates
     return len(all_predicates) == len(set(all_predicates))
 
 
+def no_repeat_predicates_batch(batch: PathBatch) -> np.ndarray:
+    """
+    Vectorized no_repeat_predicates over all paths of a batch.
+
+    Each distinct hop string holding exactly one predicate gets a predicate
+    id, so paths with one predicate per hop are checked with three array
+    comparisons. The few paths with empty or multi-predicate hops are
+    checked one by one.
+
+    Args:
+        batch: PathBatch to check
+
+    Returns:
+        Boolean array, True for paths whose predicates are all unique
+    """
+    hops = (batch.first_hop_predicates, batch.second_hop_predicates, batch.third_hop_predicates)
+    predicate_index: Dict[str, int] = {}
+    single_id = np.full(len(batch.strings), -1, dtype=np.int64)
+    for string_id in np.unique(np.concatenate(hops)):
+        predicates = parse_hop_predicates(batch.strings[string_id])
+        if len(predicates) == 1:
+            single_id[string_id] = predicate_index.setdefault(predicates[0], len(predicate_index))
+
+    a, b, c = (single_id[hop] for hop in hops)
+    keep = (a != b) & (a != c) & (b != c)
+    for i in np.flatnonzero((a < 0) | (b < 0) | (c < 0)):
+        all_predicates = [
+            predicate for hop in hops
+            for predicate in parse_hop_predicates(batch.strings[hop[i]])
+        ]
+        keep[i] = len(all_predicates) == len(set(all_predicates))
+    return keep
+
+
+no_repeat_predicates.batch = no_repeat_predicates_batch
+
+
 def no_abab(path: Path) -> bool:
     """
     Filter out paths with ABAB alternating type patterns.
@@ -172,36 +368,29 @@ def no_abab(path: Path) -> bool:
     Returns:
         True if path does not have ABAB pattern, False if it does
     """
-    types = path.categories.split(" --> ")
+    # Depends only on the category chain, so computed once per distinct chain
+    return not _chain_is_abab(path.categories)
+
+
+@lru_cache(maxsize=None)
+def _chain_is_abab(categories: str) -> bool:
+    """True if a categories string has an ABAB type pattern (see no_abab)."""
+    types = split_categories(categories)
 
     # Must have exactly 4 nodes for ABAB pattern
     if len(types) != 4:
-        return True
+        return False
 
     # Normalize types according to equivalence classes
-    def normalize_type(tp: str) -> str:
-        # Disease/PhenotypicFeature equivalence
-        if tp in ["biolink:Disease", "biolink:PhenotypicFeature"]:
-            return "CLASS_DISEASE"
-        # Chemical equivalence
-        elif tp in ["biolink:SmallMolecule", "biolink:ChemicalEntity",
-                    "biolink:MolecularMixture", "biolink:ComplexMolecularMixture"]:
-            return "CLASS_CHEMICAL"
-        # Gene/Protein equivalence
-        elif tp in ["biolink:Gene", "biolink:Protein"]:
-            return "CLASS_GENE"
-        else:
-            return tp
-
-    normalized = [normalize_type(tp) for tp in types]
+    type_class = _ABAB_TYPE_CLASS.get
+    t0, t1, t2, t3 = types
+    a = type_class(t0, t0)
+    b = type_class(t1, t1)
 
     # Check for ABAB pattern: positions 0==2 and 1==3, but 0!=1
-    is_abab = (normalized[0] == normalized[2] and
-               normalized[1] == normalized[3] and
-               normalized[0] != normalized[1])
-
-    # Return True to keep (not ABAB), False to filter (is ABAB)
-    return not is_abab
+    return (a != b and
+            type_class(t2, t2) == a and
+            type_class(t3, t3) == b)
 
 
 def no_dupe_but_gene(path: Path) -> bool:
@@ -219,17 +408,15 @@ def no_dupe_but_gene(path: Path) -> bool:
     Returns:
         True if path has no duplicate non-Gene types, False otherwise
     """
-    types = path.categories.split(" --> ")
-    normalized_types = []
+    # Depends only on the category chain, so computed once per distinct chain
+    return _chain_has_unique_non_gene_types(path.categories)
+
 
-    for tp in types:
-        if tp in ["biolink:ChemicalEntity", "biolink:SmallMolecule",
-                  "biolink:MolecularMixture", "biolink:ComplexMolecularMixture"]:
-            normalized_types.append("biolink:ChemicalEntity")
-        elif tp in ["biolink:Protein"]:
-            normalized_types.append("biolink:Gene")
-        else:
-            normalized_types.append(tp)
+@lru_cache(maxsize=None)
+def _chain_has_unique_non_gene_types(categories: str) -> bool:
+    """no_dupe_but_gene for a categories string."""
+    types = split_categories(categories)
+    normalized_types = [_EQUIVALENT_TYPE.get(tp, tp) for tp in types]
 
     # Filter out Gene types, check if remaining types are unique
     non_gene_types = [t for t in normalized_types if t != "biolink:Gene"]
@@ -255,17 +442,15 @@ def no_nonconsecutive_dupe(path: Path) -> bool:
     Returns:
         True if no type appears at non-consecutive positions, False otherwise
     """
-    types = path.categories.split(" --> ")
-    normalized_types = []
+    # Depends only on the category chain, so computed once per distinct chain
+    return _chain_has_consecutive_dupes_only(path.categories)
 
-    for tp in types:
-        if tp in ["biolink:ChemicalEntity", "biolink:SmallMolecule",
-                  "biolink:MolecularMixture", "biolink:ComplexMolecularMixture"]:
-            normalized_types.append("biolink:ChemicalEntity")
-        elif tp in ["biolink:Protein"]:
-            normalized_types.append("biolink:Gene")
-        else:
-            normalized_types.append(tp)
+
+@lru_cache(maxsize=None)
+def _chain_has_consecutive_dupes_only(categories: str) -> bool:
+    """no_nonconsecutive_dupe for a categories string."""
+    types = split_categories(categories)
+    normalized_types = [_EQUIVALENT_TYPE.get(tp, tp) for tp in types]
 
     # For each type, check if all occurrences are consecutive
     type_positions = {}  # type -> [positions]
@@ -286,6 +471,67 @@ def no_nonconsecutive_dupe(path: Path) -> bool:
     return True
 
 
+def no_abab_batch(batch: PathBatch) -> np.ndarray:
+    """
+    Vectorized no_abab over all paths of a batch.
+
+    Args:
+        batch: PathBatch to check
+
+    Returns:
+        Boolean array, True for paths without an ABAB type pattern
+    """
+    if batch.category_ids.shape[1] < 4:
+        return np.ones(len(batch), dtype=bool)
+    classes = _type_classes(batch, _ABAB_TYPE_CLASS)
+    is_abab = (
+        (batch.category_counts == 4)
+        & (classes[:, 0] == classes[:, 2])
+        & (classes[:, 1] == classes[:, 3])
+        & (classes[:, 0] != classes[:, 1])
+    )
+    return ~is_abab
+
+
+def no_dupe_but_gene_batch(batch: PathBatch) -> np.ndarray:
+    """
+    Vectorized no_dupe_but_gene over all paths of a batch.
+
+    Args:
+        batch: PathBatch to check
+
+    Returns:
+        Boolean array, True for paths with no duplicate non-Gene types
+    """
+    # Gene/Protein positions are dropped like padding, then every remaining
+    # position must hold a distinct type
+    classes = _type_classes(batch, _EQUIVALENT_TYPE, drop="biolink:Gene")
+    return _category_kernel.count_distinct(classes) == (classes >= 0).sum(axis=1)
+
+
+def no_nonconsecutive_dupe_batch(batch: PathBatch) -> np.ndarray:
+    """
+    Vectorized no_nonconsecutive_dupe over all paths of a batch.
+
+    Args:
+        batch: PathBatch to check
+
+    Returns:
+        Boolean array, True for paths whose repeated types are all consecutive
+    """
+    # Every type appears in one consecutive run exactly when the number of
+    # runs equals the number of distinct types
+    classes = _type_classes(batch, _EQUIVALENT_TYPE)
+    run_starts = classes >= 0
+    run_starts[:, 1:] &= classes[:, 1:] != classes[:, :-1]
+    return run_starts.sum(axis=1) == _category_kernel.count_distinct(classes)
+
+
+no_abab.batch = no_abab_batch
+no_dupe_but_gene.batch = no_dupe_but_gene_batch
+no_nonconsecutive_dupe.batch = no_nonconsecutive_dupe_batch
+
+
 def all_paths(path: Path) -> bool:
     """
     Accept all paths (no filtering).
@@ -299,7 +545,115 @@ def all_paths(path: Path) -> bool:
     return True
 
 
-def apply_filters(paths: List[Path], filters: List[FilterFunction]) -> List[Path]:
+def compose_filters(filters: List[FilterFunction]) -> FilterFunction:
+    """
+    Combine filters into one predicate that keeps a path only if all do.
+
+    Filters are called in order and stop at the first rejection. The
+    predicate is generated once as a single `and` chain,
+    "lambda path: f0(path) and f1(path) and ...", with the filters bound
+    as defaults (fast locals), so no generator or loop runs per path as
+    with all(). Generated predicates are cached per filter sequence, so
+    running the same strategy again (e.g. for each query) reuses one.
+
+    Args:
+        filters: List of filter functions
+
+    Returns:
+        Single filter function
+    """
+    if not filters:
+        return all_paths
+    if len(filters) == 1:
+        return filters[0]
+    return _compose_chain(tuple(filters))
+
+
+@lru_cache(maxsize=COMPOSED_CACHE_SIZE)
+def _compose_chain(filters) -> FilterFunction:
+    """Generate the `and`-chain predicate for compose_filters."""
+    names = [f"f{k}" for k in range(len(filters))]
+    source = (
+        f"lambda path, {', '.join(f'{n}={n}' for n in names)}: "
+        + " and ".join(f"{n}(path)" for n in names)
+    )
+    return eval(source, dict(zip(names, filters)))
+
+
+def order_by_selectivity(paths: List[Path], filters: List[FilterFunction],
+                         sample_size: int = PROFILE_SAMPLE_SIZE) -> List[FilterFunction]:
+    """
+    Reorder filters so those rejecting the most paths run first.
+
+    Each filter is run on an evenly spaced sample of the paths; filters are
+    then sorted by descending rejection rate (ties keep their given order).
+    With short-circuiting, later filters are then called on fewer paths.
+
+    Args:
+        paths: List of Path objects
+        filters: List of filter functions
+        sample_size: Maximum number of paths to profile on
+
+    Returns:
+        The same filters, most selective first
+    """
+    if len(filters) < 2 or not paths:
+        return list(filters)
+    sample = paths[::max(1, len(paths) // sample_size)][:sample_size]
+    rejected = [sum(not filter_func(path) for path in sample) for filter_func in filters]
+    order = sorted(range(len(filters)), key=lambda k: -rejected[k])
+    return [filters[k] for k in order]
+
+
+def compute_filter_mask(paths: List[Path], filters: List[FilterFunction],
+                        profile: bool = False) -> np.ndarray:
+    """
+    Evaluate filters over paths as a boolean keep mask.
+
+    A path is kept only if ALL filters return True. Filters with a .batch
+    version are evaluated first, over a PathBatch of all paths at once,
+    since they are cheap and shrink the set of paths left to check. The
+    remaining filters are composed into one predicate and called in a
+    single pass over the paths still kept; as with all(), a path's later
+    filters are not called once one rejects it. Filter order does not
+    change the result.
+
+    Args:
+        paths: List of Path objects
+        filters: List of filter functions
+        profile: If True, reorder the per-path filters by rejection rate on
+            a sample first (see order_by_selectivity)
+
+    Returns:
+        Boolean array with one entry per path, True if the path is kept
+    """
+    keep = np.ones(len(paths), dtype=bool)
+    # all_paths keeps everything; no need to call it per path
+    filters = [f for f in filters if f is not all_paths]
+    if len(paths) == 0 or not filters:
+        return keep
+
+    batch_funcs = [f.batch for f in filters if getattr(f, "batch", None) is not None]
+    path_filters = [f for f in filters if getattr(f, "batch", None) is None]
+
+    if batch_funcs:
+        batch = PathBatch.from_paths(paths)
+        for batch_func in batch_funcs:
+            keep &= batch_func(batch)
+
+    remaining = np.flatnonzero(keep)
+    if path_filters and len(remaining) > 0:
+        if profile:
+            path_filters = order_by_selectivity([paths[i] for i in remaining], path_filters)
+        predicate = compose_filters(path_filters)
+        keep[remaining] = np.fromiter(
+            (predicate(paths[i]) for i in remaining), dtype=bool, count=len(remaining)
+        )
+    return keep
+
+
+def apply_filters(paths: List[Path], filters: List[FilterFunction],
+                  profile: bool = False) -> List[Path]:
     """
     Apply a list of filter functions to paths.
 
@@ -308,29 +662,96 @@ def apply_filters(paths: List[Path], filters: List[FilterFunction]) -> List[Path
     Args:
         paths: List of Path objects
         filters: List of filter functions
+        profile: If True, run the most selective filters first (the result
+            is the same; see order_by_selectivity)
+
+    Returns:
+        Filtered list of Path objects
+    """
+    return list(compress(paths, compute_filter_mask(paths, filters, profile=profile)))
+
+
+# Per-path predicate used by apply_filters_parallel worker processes
+_worker_predicate: Optional[FilterFunction] = None
+
+
+def _init_filter_worker(vocab_ids: Dict[str, int], path_filters: List[FilterFunction]) -> None:
+    """Give a worker process the parent's CURIE ids and the composed per-path filters."""
+    global _worker_predicate
+    CURIE_VOCAB.restore(vocab_ids)
+    _worker_predicate = compose_filters(path_filters)
+
+
+def _filter_chunk(chunk: List[Path]) -> List[bool]:
+    """Evaluate the worker's per-path filters over one chunk of paths."""
+    return [_worker_predicate(path) for path in chunk]
+
+
+def _picklable(obj) -> bool:
+    """Return True if obj can be sent to a worker process."""
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def apply_filters_parallel(paths: List[Path], filters: List[FilterFunction],
+                           max_workers: Optional[int] = None,
+                           chunksize: Optional[int] = None) -> List[Path]:
+    """
+    Apply filters like apply_filters, with per-path filters run in worker processes.
+
+    Filters with a .batch version run in this process first (numpy does
+    the work there, so extra processes would only add pickling cost). The
+    paths they keep are split into chunks that worker processes check
+    against the remaining per-path filters. Those filters must be
+    picklable, i.e. module-level functions; if any is not (a filter built
+    by a factory without a .batch version, say), everything runs in this
+    process instead. The result is the same as apply_filters.
+
+    Args:
+        paths: List of Path objects
+        filters: List of filter functions
+        max_workers: Number of worker processes (None = os.cpu_count(),
+                     1 = run serially in this process)
+        chunksize: Paths per task (None = spread over 4 tasks per worker)
 
     Returns:
         Filtered list of Path objects
     """
-    filtered = []
+    path_filters = [f for f in filters if getattr(f, "batch", None) is None]
+    if max_workers == 1 or not path_filters or not _picklable(path_filters):
+        return apply_filters(paths, filters)
+
+    batch_filters = [f for f in filters if getattr(f, "batch", None) is not None]
+    candidates = apply_filters(paths, batch_filters) if batch_filters else list(paths)
+    if len(candidates) == 0:
+        return candidates
 
-    for path in paths:
-        # Path must pass all filters
-        passes_all = all(filter_func(path) for filter_func in filters)
-        if passes_all:
-            filtered.append(path)
+    workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(candidates) // (workers * 4))
+    chunks = [candidates[i:i + chunksize] for i in range(0, len(candidates), chunksize)]
 
-    return filtered
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_filter_worker,
+        initargs=(CURIE_VOCAB.snapshot(), path_filters)
+    ) as executor:
+        keep = [kept for chunk_keep in executor.map(_filter_chunk, chunks) for kept in chunk_keep]
+    return list(compress(candidates, keep))
 
 
 # Node characteristic-based filters
 
-def load_node_characteristics(node_degrees_file: str) -> tuple[Dict[str, float], Dict[str, int], Dict[str, Dict[str, int]]]:
+def load_node_characteristics(node_degrees_file: Union[str, TextIO]) -> tuple[Dict[str, float], Dict[str, int], Dict[str, Dict[str, int]]]:
     """
     Load information content, node degree, and path count data from TSV file.
 
     Args:
-        node_degrees_file: Path to node characteristics TSV file (e.g., node_path_counts_with_degrees.tsv)
+        node_degrees_file: Path to node characteristics TSV file (e.g., node_path_counts_with_degrees.tsv),
+                           or an open text stream with the same contents
 
     Returns:
         Tuple of (ic_data, degree_data, path_count_data) where:
@@ -340,40 +761,26 @@ def load_node_characteristics(node_degrees_file: str) -> tuple[Dict[str, float],
     """
     import pandas as pd
 
-    ic_data = {}
-    degree_data = {}
+    # Parse the needed columns straight to typed arrays; empty cells are NaN
+    df = pd.read_csv(
+        node_degrees_file, sep='\t',
+        usecols=['Query', 'CURIE', 'Path_Count', 'Node_degree', 'Information_content'],
+        dtype={'Query': str, 'CURIE': str, 'Path_Count': np.float64,
+               'Node_degree': np.float64, 'Information_content': np.float64},
+    )
+
+    # Information content and node degree are global: the first row for
+    # each node wins. Missing IC = 100.0 (very specific, passes all
+    # filters); missing degree = 0 (passes all max_degree filters)
+    first = df.drop_duplicates('CURIE')
+    ic_data = dict(zip(first['CURIE'], first['Information_content'].fillna(100.0).tolist()))
+    degree_data = dict(zip(first['CURIE'], first['Node_degree'].fillna(0).astype(np.int64).tolist()))
+
+    # Path count is per query; a later row for the same node replaces an earlier one
     path_count_data = {}  # {query: {node_id: count}}
-    df = pd.read_csv(node_degrees_file, sep='\t')
-
-    for _, row in df.iterrows():
-        node_id = row['CURIE']
-        query = row['Query']
-
-        # Information content (global)
-        if node_id not in ic_data:
-            ic_value = row['Information_content']
-            if pd.isna(ic_value) or ic_value == '':
-                ic_data[node_id] = 100.0  # Very specific, passes all filters
-            else:
-                ic_data[node_id] = float(ic_value)
-
-        # Node degree (global)
-        if node_id not in degree_data:
-            degree_value = row['Node_degree']
-            if pd.isna(degree_value) or degree_value == '':
-                degree_data[node_id] = 0  # No connections, passes all max_degree filters
-            else:
-                degree_data[node_id] = int(degree_value)
-
-        # Path count (per query)
-        if query not in path_count_data:
-            path_count_data[query] = {}
-
-        path_count_value = row['Path_Count']
-        if pd.isna(path_count_value) or path_count_value == '':
-            path_count_data[query][node_id] = 0
-        else:
-            path_count_data[query][node_id] = int(path_count_value)
+    path_counts = df['Path_Count'].fillna(0).astype(np.int64)
+    for query, rows in df.groupby('Query', sort=False, dropna=False).indices.items():
+        path_count_data[query] = dict(zip(df['CURIE'].iloc[rows], path_counts.iloc[rows].tolist()))
 
     return ic_data, degree_data, path_count_data
 
@@ -386,6 +793,9 @@ def create_min_ic_filter(ic_data: Dict[str, float], min_ic: float) -> FilterFunc
     Start and end nodes are query-specific, so their IC doesn't help filter.
 
     Factory function that creates a filter with the IC data in a closure.
+    The nodes below the threshold are collected once here, so checking a
+    path is set membership rather than an IC lookup and comparison per
+    node; ic_data should not be modified after the filter is created.
 
     Args:
         ic_data: Dictionary mapping node_id to information_content
@@ -394,6 +804,14 @@ def create_min_ic_filter(ic_data: Dict[str, float], min_ic: float) -> FilterFunc
     Returns:
         Filter function that rejects paths with any intermediate node IC < min_ic
     """
+    # NaN compares False, so NaN nodes are never rejected (as before)
+    rejected_nodes = frozenset(
+        node_id for node_id, ic_value in ic_data.items() if ic_value < min_ic
+    )
+    # Nodes not in ic_data count as 100.0, so they only fail above that
+    reject_unknown = 100.0 < min_ic
+    check_known_only = not reject_unknown
+
     def min_ic_filter(path: Path) -> bool:
         """
         Filter out paths where ANY INTERMEDIATE node has information content below threshold.
@@ -407,19 +825,93 @@ def create_min_ic_filter(ic_data: Dict[str, float], min_ic: float) -> FilterFunc
         Returns:
             True if all intermediate nodes have IC >= min_ic, False otherwise
         """
+        curies = path.path_curies
+        # Common case: both intermediate positions present and unknown nodes
+        # pass, so two set lookups decide it without slicing or looping
+        if check_known_only and len(curies) >= 3:
+            return curies[1] not in rejected_nodes and curies[2] not in rejected_nodes
         # Only check intermediate nodes (positions 1 and 2)
-        for node_id in path.path_curies[1:3]:
+        for node_id in curies[1:3]:
+            if node_id in rejected_nodes:
+                return False
             # Default to 100.0 if node not found (assume specific/rare)
-            ic_value = ic_data.get(node_id, 100.0)
-            if ic_value < min_ic:
+            if reject_unknown and node_id not in ic_data:
                 return False
         return True
 
+    def min_ic_batch(batch: PathBatch) -> np.ndarray:
+        """Vectorized min_ic_filter over all paths of a batch."""
+        return batch_ic_pass(batch, ic_data, [min_ic])[:, 0]
+
     # Set a descriptive name for the filter function
     min_ic_filter.__name__ = f"min_ic_{int(min_ic)}"
+    # Expose the inputs so batch evaluation can vectorize IC thresholds
+    min_ic_filter.ic_data = ic_data
+    min_ic_filter.min_ic = min_ic
+    min_ic_filter.batch = min_ic_batch
     return min_ic_filter
 
 
+def _intermediate_node_values(batch: PathBatch, node_values: Dict[str, float],
+                              default: float, absent: float) -> np.ndarray:
+    """
+    Gather a per-node value for each intermediate position of a batch.
+
+    node_values is looked up once per distinct intermediate node rather
+    than once per path position.
+
+    Args:
+        batch: PathBatch of the paths to look up
+        node_values: Dictionary mapping node_id to a value
+        default: Value of nodes not in node_values
+        absent: Value of positions a short path does not have
+
+    Returns:
+        float64 array of shape (len(batch), 2)
+    """
+    values = np.fromiter(
+        (node_values.get(node_id, default) for node_id in batch.intermediate_nodes),
+        dtype=np.float64, count=len(batch.intermediate_nodes)
+    )
+    # Append the absent value so -1 (absent position) gathers it
+    return np.append(values, absent)[batch.intermediate_ids]
+
+
+def batch_ic_pass(batch: PathBatch, ic_data: Dict[str, float], thresholds) -> np.ndarray:
+    """
+    Evaluate several min-IC filters over the same IC data at once.
+
+    Each distinct intermediate node's IC is quantized to a uint8 level
+    against the thresholds (see _ic_kernel.quantize), so the per-path
+    array is one byte per position rather than a float64 score, with
+    exactly the same results as the create_min_ic_filter filters.
+
+    Args:
+        batch: PathBatch of the paths to check
+        ic_data: Dictionary mapping node_id to information_content
+        thresholds: min_ic value of each filter
+
+    Returns:
+        Boolean array of shape (len(batch), len(thresholds)), True where the
+        filter with that threshold keeps the path
+    """
+    node_ic = np.fromiter(
+        (ic_data.get(node_id, 100.0) for node_id in batch.intermediate_nodes),
+        dtype=np.float64, count=len(batch.intermediate_nodes)
+    )
+    node_levels, ranks = _ic_kernel.quantize(node_ic, np.asarray(thresholds, dtype=np.float64))
+    # Append the absent level so -1 (absent position) gathers it
+    levels = np.append(node_levels, np.uint8(_ic_kernel.ABSENT_LEVEL))[batch.intermediate_ids]
+    return _ic_kernel.ic_pass(levels, ranks)
+
+
+def _max_value_batch(batch: PathBatch, node_values: Dict[str, float], max_value: float) -> np.ndarray:
+    """Paths with no intermediate node value above max_value (missing nodes count as 0)."""
+    values = _intermediate_node_values(batch, node_values, 0, -np.inf)
+    # NaN compares False, so NaN nodes are never rejected, as in the per-path filters
+    return ~(values > max_value).any(axis=1)
+
+
 def create_max_path_count_filter(path_count_data: Dict[str, int], max_path_count: int) -> FilterFunction:
     """
     Create a filter that rejects paths containing any INTERMEDIATE node with path_count above threshold.
@@ -449,16 +941,27 @@ def create_max_path_count_filter(path_count_data: Dict[str, int], max_path_count
         Returns:
             True if all intermediate nodes have path_count <= max_path_count, False otherwise
         """
+        curies = path.path_curies
+        # Common case: both intermediate positions present, checked without
+        # slicing (written as "not >" so NaN passes, like the loop below)
+        if len(curies) >= 3:
+            return not (path_count_data.get(curies[1], 0) > max_path_count
+                        or path_count_data.get(curies[2], 0) > max_path_count)
         # Only check intermediate nodes (positions 1 and 2)
-        for node_id in path.path_curies[1:3]:
+        for node_id in curies[1:3]:
             # Default to 0 if node not found (assume no paths)
             path_count_value = path_count_data.get(node_id, 0)
             if path_count_value > max_path_count:
                 return False
         return True
 
+    def max_path_count_batch(batch: PathBatch) -> np.ndarray:
+        """Vectorized max_path_count_filter over all paths of a batch."""
+        return _max_value_batch(batch, path_count_data, max_path_count)
+
     # Set a descriptive name for the filter function
     max_path_count_filter.__name__ = f"max_path_count_{max_path_count}"
+    max_path_count_filter.batch = max_path_count_batch
     return max_path_count_filter
 
 
@@ -491,20 +994,34 @@ def create_max_degree_filter(degree_data: Dict[str, int], max_degree: int) -> Fi
         Returns:
             True if all intermediate nodes have degree <= max_degree, False otherwise
         """
+        curies = path.path_curies
+        # Common case: both intermediate positions present, checked without
+        # slicing (written as "not >" so NaN passes, like the loop below)
+        if len(curies) >= 3:
+            return not (degree_data.get(curies[1], 0) > max_degree
+                        or degree_data.get(curies[2], 0) > max_degree)
         # Only check intermediate nodes (positions 1 and 2)
-        for node_id in path.path_curies[1:3]:
+        for node_id in curies[1:3]:
             # Default to 0 if node not found (assume no connections)
             degree_value = degree_data.get(node_id, 0)
             if degree_value > max_degree:
                 return False
         return True
 
+    def max_degree_batch(batch: PathBatch) -> np.ndarray:
+        """Vectorized max_degree_filter over all paths of a batch."""
+        return _max_value_batch(batch, degree_data, max_degree)
+
     # Set a descriptive name for the filter function
     max_degree_filter.__name__ = f"max_degree_{max_degree}"
+    max_degree_filter.batch = max_degree_batch
     return max_degree_filter
 
 
-# Pre-defined filter sets
-DEFAULT_FILTERS = [no_dupe_types, no_expression, no_related_to]
-STRICT_FILTERS = [no_dupe_types, no_expression, no_related_to, no_end_pheno]
-NO_FILTERS = [all_paths]
+# Pre-defined filter sets. Tuples, so callers cannot change them in place;
+# every filter here has a .batch version, which compute_filter_mask runs
+# over all paths, so their order does not affect cost (use
+# order_by_selectivity for per-path filters)
+DEFAULT_FILTERS = (no_dupe_types, no_expression, no_related_to)
+STRICT_FILTERS = (no_dupe_types, no_expression, no_related_to, no_end_pheno)
+NO_FILTERS = (all_paths,)
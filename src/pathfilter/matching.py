@@ -2,14 +2,22 @@
 
 This module assumes all CURIEs in paths and expected nodes are already normalized.
 No API calls are made - matching is done via simple set operations.
+
+Paths produced by the loader also carry int32 CURIE ids (see curie_vocab);
+for those, the batch functions below test every path at once with a
+bitset lookup instead of hashing each CURIE string.
 """
-from typing import Set, List
+from dataclasses import dataclass
+from typing import AbstractSet, FrozenSet, Set, List, Optional
+import numpy as np
 from pathfilter.path_loader import Path
+from pathfilter.curie_vocab import CURIE_VOCAB
+from pathfilter import _match_kernel
 
 
 def does_path_contain_expected_node(
     path: Path,
-    expected_nodes: Set[str]
+    expected_nodes: AbstractSet[str]
 ) -> bool:
     """
     Check if a path contains any of the expected nodes.
@@ -27,15 +35,123 @@ def does_path_contain_expected_node(
         True if the path contains at least one expected node, False otherwise
     """
     # Simple set intersection - no normalization needed!
-    for curie in path.path_curies:
-        if curie in expected_nodes:
-            return True
-    return False
+    return not path.path_curies_set.isdisjoint(expected_nodes)
+
+
+def _expected_node_mask(
+    paths: List[Path],
+    expected_nodes: FrozenSet[str]
+) -> Optional[np.ndarray]:
+    """
+    Vectorized version of does_path_contain_expected_node over many paths.
+
+    All path CURIE ids are concatenated and each path's span is checked
+    against a bitset of the expected nodes (see _match_kernel).
+
+    Args:
+        paths: List of Path objects
+        expected_nodes: Set of pre-normalized expected node CURIEs
+
+    Returns:
+        Boolean array (one entry per path), or None if any path lacks
+        encoded CURIE ids and the caller should fall back to set lookups
+    """
+    if any(path.path_curies_ids is None for path in paths):
+        return None
+
+    if not paths:
+        return np.zeros(0, dtype=bool)
+
+    offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter((len(path.path_curies_ids) for path in paths), dtype=np.int64, count=len(paths)),
+        out=offsets[1:]
+    )
+    flat_ids = np.concatenate([path.path_curies_ids for path in paths])
+    return _match_kernel.any_hit(flat_ids, offsets, CURIE_VOCAB.bitset(expected_nodes))
+
+
+def compute_hit_mask(
+    paths: List[Path],
+    expected_nodes: AbstractSet[str]
+) -> np.ndarray:
+    """
+    Compute, once per path, whether it contains an expected node.
+
+    Uses the vectorized bitset lookup when every path has encoded CURIE
+    ids, otherwise the per-path set lookup.
+
+    ASSUMES: Data is pre-normalized.
+
+    Args:
+        paths: List of Path objects with pre-normalized CURIEs
+        expected_nodes: Set of pre-normalized expected node CURIEs
+
+    Returns:
+        Boolean array with one entry per path
+    """
+    expected_nodes = frozenset(expected_nodes)
+
+    hit_mask = _expected_node_mask(paths, expected_nodes)
+    if hit_mask is None:
+        hit_mask = np.fromiter(
+            (does_path_contain_expected_node(path, expected_nodes) for path in paths),
+            dtype=bool,
+            count=len(paths)
+        )
+    return hit_mask
+
+
+@dataclass
+class PathMatchResult:
+    """Result of matching a list of paths against expected nodes."""
+
+    hit_mask: np.ndarray  # Boolean, True where the path contains an expected node
+    found_nodes: Set[str]  # Expected nodes that appear in at least one path
+
+    @property
+    def hit_count(self) -> int:
+        """Number of paths containing at least one expected node."""
+        return int(self.hit_mask.sum())
+
+
+def compute_path_matches(
+    paths: List[Path],
+    expected_nodes: AbstractSet[str]
+) -> PathMatchResult:
+    """
+    Match paths against expected nodes in a single scan.
+
+    Callers that need more than one of the hit mask, hit count and found
+    nodes should call this once rather than the individual helpers below.
+
+    ASSUMES: Data is pre-normalized.
+
+    Args:
+        paths: List of Path objects with pre-normalized CURIEs
+        expected_nodes: Set of pre-normalized expected node CURIEs
+
+    Returns:
+        PathMatchResult with the per-path hit mask and the found nodes
+    """
+    # One frozenset (with its cached hash) is shared by every lookup below;
+    # frozenset() of a frozenset returns it unchanged
+    expected_nodes = frozenset(expected_nodes)
+
+    hit_mask = compute_hit_mask(paths, expected_nodes)
+
+    # Only paths that hit can contribute found nodes
+    found_nodes = set()
+    for path, hit in zip(paths, hit_mask):
+        if hit:
+            found_nodes |= path.path_curies_set & expected_nodes
+
+    return PathMatchResult(hit_mask=hit_mask, found_nodes=found_nodes)
 
 
 def filter_paths_with_expected_nodes(
     paths: List[Path],
-    expected_nodes: Set[str]
+    expected_nodes: AbstractSet[str]
 ) -> List[Path]:
     """
     Filter paths to only those containing expected nodes.
@@ -49,15 +165,13 @@ def filter_paths_with_expected_nodes(
     Returns:
         List of Path objects that contain at least one expected node
     """
-    return [
-        path for path in paths
-        if does_path_contain_expected_node(path, expected_nodes)
-    ]
+    result = compute_path_matches(paths, expected_nodes)
+    return [path for path, hit in zip(paths, result.hit_mask) if hit]
 
 
 def count_paths_with_expected_nodes(
     paths: List[Path],
-    expected_nodes: Set[str]
+    expected_nodes: AbstractSet[str]
 ) -> int:
     """
     Count how many paths contain expected nodes.
@@ -71,16 +185,12 @@ def count_paths_with_expected_nodes(
     Returns:
         Number of paths containing at least one expected node
     """
-    count = 0
-    for path in paths:
-        if does_path_contain_expected_node(path, expected_nodes):
-            count += 1
-    return count
+    return compute_path_matches(paths, expected_nodes).hit_count
 
 
 def get_expected_nodes_found_in_paths(
     paths: List[Path],
-    expected_nodes: Set[str]
+    expected_nodes: AbstractSet[str]
 ) -> Set[str]:
     """
     Get the set of expected nodes that are actually found in the paths.
@@ -94,9 +204,4 @@ def get_expected_nodes_found_in_paths(
     Returns:
         Set of expected node CURIEs that appear in at least one path
     """
-    found_nodes = set()
-    for path in paths:
-        for curie in path.path_curies:
-            if curie in expected_nodes:
-                found_nodes.add(curie)
-    return found_nodes
+    return compute_path_matches(paths, expected_nodes).found_nodes
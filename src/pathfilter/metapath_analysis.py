@@ -3,12 +3,14 @@
 This module analyzes how different structural patterns (metapaths) in knowledge graph
 paths correlate with finding expected nodes.
 """
-import ast
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Set, Dict, Tuple
-from collections import defaultdict
-from pathfilter.path_loader import Path
-from pathfilter.matching import does_path_contain_expected_node
+from typing import AbstractSet, List, Set, Dict, Tuple, Optional
+import numpy as np
+from pathfilter.path_loader import Path, parse_metapaths_from_string
+from pathfilter.matching import compute_hit_mask
+from pathfilter.curie_vocab import CURIE_VOCAB
+from pathfilter import _metapath_kernel
 
 
 @dataclass
@@ -22,58 +24,58 @@ class MetapathStats:
     frequency: float
 
 
-def parse_metapaths_from_string(metapaths_str: str) -> List[str]:
+def expand_paths_with_metapaths(paths: List[Path]) -> List[Tuple[Path, str]]:
     """
-    Parse metapaths from the string representation in xlsx files.
+    Expand paths to (path, metapath) tuples.
 
-    The metapaths column contains a string representation of a Python list.
-    Examples:
-        "['metapath1']"
-        "['metapath1', 'metapath2']"
+    Each path may have multiple metapaths. This function expands them so each
+    (path, metapath) combination is represented separately.
 
     Args:
-        metapaths_str: String representation of metapath list from xlsx
+        paths: List of Path objects
 
     Returns:
-        List of metapath strings
+        List of (Path, metapath_string) tuples
     """
-    try:
-        # Use ast.literal_eval to safely parse the string representation
-        metapaths = ast.literal_eval(metapaths_str)
-        if isinstance(metapaths, list):
-            return metapaths
-        else:
-            # If it's not a list, wrap it
-            return [str(metapaths)]
-    except (ValueError, SyntaxError):
-        # If parsing fails, return empty list
-        return []
+    return [(path, metapath) for path in paths for metapath in path.metapaths_list]
 
 
-def expand_paths_with_metapaths(paths: List[Path]) -> List[Tuple[Path, str]]:
+def _count_metapaths(
+    paths: List[Path],
+    path_hit: np.ndarray
+) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
     """
-    Expand paths to (path, metapath) tuples.
-
-    Each path may have multiple metapaths. This function expands them so each
-    (path, metapath) combination is represented separately.
+    Count total and hit paths per metapath.
 
     Args:
         paths: List of Path objects
+        path_hit: Boolean array, True where the path contains an expected node
 
     Returns:
-        List of (Path, metapath_string) tuples
+        Tuple of (metapath_index, metapath_total, metapath_hits): a dict
+        mapping metapath to its slot, and int64 count arrays indexed by slot
     """
-    expanded = []
-    for path in paths:
-        metapaths = parse_metapaths_from_string(path.metapaths)
-        for metapath in metapaths:
-            expanded.append((path, metapath))
-    return expanded
+    # Each metapath gets a dense slot on first sight
+    metapath_index: Dict[str, int] = {}
+    metapath_per_pair = []
+    path_of_pair = []
+    for path_idx, path in enumerate(paths):
+        for metapath in path.metapaths_list:
+            metapath_per_pair.append(metapath_index.setdefault(metapath, len(metapath_index)))
+            path_of_pair.append(path_idx)
+
+    metapath_total, metapath_hits = _metapath_kernel.compute(
+        np.asarray(metapath_per_pair, dtype=np.int64),
+        np.asarray(path_of_pair, dtype=np.int64),
+        path_hit,
+        len(metapath_index)
+    )
+    return metapath_index, metapath_total, metapath_hits
 
 
 def calculate_metapath_enrichment(
     paths: List[Path],
-    expected_nodes: Set[str],
+    expected_nodes: AbstractSet[str],
     query_id: str
 ) -> List[MetapathStats]:
     """
@@ -87,15 +89,12 @@ def calculate_metapath_enrichment(
     Returns:
         List of MetapathStats objects, one per unique metapath
     """
-    # Expand paths to (path, metapath) tuples
-    path_metapath_pairs = expand_paths_with_metapaths(paths)
+    # Whether each path hits is computed once and reused for every count below
+    path_hit = compute_hit_mask(paths, expected_nodes)
 
     # Calculate overall query statistics (baseline)
     total_paths_in_query = len(paths)
-    total_hits_in_query = sum(
-        1 for path in paths
-        if does_path_contain_expected_node(path, expected_nodes)
-    )
+    total_hits_in_query = int(path_hit.sum())
     overall_precision = (
         total_hits_in_query / total_paths_in_query
         if total_paths_in_query > 0
@@ -103,19 +102,14 @@ def calculate_metapath_enrichment(
     )
 
     # Group by metapath and count
-    metapath_total: Dict[str, int] = defaultdict(int)
-    metapath_hits: Dict[str, int] = defaultdict(int)
-
-    for path, metapath in path_metapath_pairs:
-        metapath_total[metapath] += 1
-        if does_path_contain_expected_node(path, expected_nodes):
-            metapath_hits[metapath] += 1
+    metapath_index, metapath_total, metapath_hits = _count_metapaths(paths, path_hit)
 
     # Calculate statistics for each metapath
     stats = []
-    for metapath in sorted(metapath_total.keys()):
-        total = metapath_total[metapath]
-        hits = metapath_hits[metapath]
+    for metapath in sorted(metapath_index):
+        slot = metapath_index[metapath]
+        total = int(metapath_total[slot])
+        hits = int(metapath_hits[slot])
 
         precision = hits / total if total > 0 else 0.0
         enrichment = precision / overall_precision if overall_precision > 0 else 0.0
@@ -133,24 +127,52 @@ def calculate_metapath_enrichment(
     return stats
 
 
+def _init_worker(vocab_ids: Dict[str, int]) -> None:
+    """Give a worker process the parent's CURIE ids so encoded paths decode correctly."""
+    CURIE_VOCAB.restore(vocab_ids)
+
+
 def analyze_all_queries_metapaths(
-    query_data: Dict[str, Tuple[List[Path], Set[str]]]
+    query_data: Dict[str, Tuple[List[Path], Set[str]]],
+    max_workers: Optional[int] = None
 ) -> List[Dict[str, any]]:
     """
     Analyze metapath enrichment for all queries.
 
+    Queries are processed serially by default. Since they are independent,
+    passing max_workers > 1 spreads them over that many worker processes
+    instead (each query's paths are pickled to its worker, so this only
+    pays off for large inputs). Results are returned in query_data order.
+
     Args:
         query_data: Dict mapping query_id to (paths, expected_nodes) tuple
+        max_workers: Number of worker processes; None or 1 runs serially
+                     in this process
 
     Returns:
         List of dicts with columns: query_id, metapath, total_paths, hit_paths,
         precision, enrichment, frequency
     """
-    results = []
+    if max_workers is None or max_workers <= 1 or len(query_data) <= 1:
+        stats_per_query = [
+            calculate_metapath_enrichment(paths, expected_nodes, query_id)
+            for query_id, (paths, expected_nodes) in query_data.items()
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(CURIE_VOCAB.snapshot(),)
+        ) as executor:
+            futures = [
+                executor.submit(calculate_metapath_enrichment, paths, expected_nodes, query_id)
+                for query_id, (paths, expected_nodes) in query_data.items()
+            ]
+            stats_per_query = [future.result() for future in futures]
 
-    for query_id, (paths, expected_nodes) in query_data.items():
-        stats_list = calculate_metapath_enrichment(paths, expected_nodes, query_id)
+    results = []
 
+    for query_id, stats_list in zip(query_data, stats_per_query):
         for stats in stats_list:
             results.append({
                 'query_id': query_id,
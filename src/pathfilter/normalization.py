@@ -1,37 +1,171 @@
 """Node normalization using the Node Normalizer API."""
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import List, Dict, Optional, Set
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Set, Tuple
 from functools import lru_cache
 
+try:
+    import orjson  # optional: faster parsing of large API responses
+except ImportError:
+    orjson = None
+
 
 # Node Normalizer API endpoint
 NODE_NORMALIZER_URL = "https://nodenormalization-sri.renci.org/get_normalized_nodes"
 
-
-def normalize_curies(curies: List[str]) -> Dict[str, Optional[str]]:
+# Shared session so every request reuses one keep-alive connection pool.
+# Lookups are idempotent, so POSTs are retried on transient failures.
+_session = requests.Session()
+_session.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+_session.mount("https://", HTTPAdapter(
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"POST"})
+    )
+))
+
+# Normalization results are kept on disk so repeated runs skip the API.
+# Set PATHFILTER_CACHE_DIR to move the cache, or to an empty string to disable it.
+# PATHFILTER_CACHE_DIR only affects this cache: the parsed path file cache in
+# path_loader is off by default and has its own PATHFILTER_FRAME_CACHE_DIR.
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pathfilter")
+CACHE_EXPIRY_SECONDS = 30 * 86400
+# CURIEs the API did not recognize may be a transient miss, so they are retried sooner
+MISSING_EXPIRY_SECONDS = 86400
+
+# Large lookups are split into batches of this size and sent concurrently
+NORMALIZATION_BATCH_SIZE = 1000
+NORMALIZATION_MAX_WORKERS = 8
+
+# SQLite's default limit on bound parameters per statement is 999
+_SQLITE_MAX_PARAMS = 900
+
+# Results read or written in this process are also held in memory (oldest
+# evicted first), so repeated lookups of the same CURIEs skip SQLite
+MEMORY_CACHE_SIZE = 100_000
+
+
+class NormalizationCache:
+    """SQLite-backed store of CURIE -> preferred CURIE results."""
+
+    def __init__(self, db_path: str, expiry_seconds: float = CACHE_EXPIRY_SECONDS,
+                 missing_expiry_seconds: float = MISSING_EXPIRY_SECONDS):
+        """
+        Open (creating if needed) a cache database.
+
+        Args:
+            db_path: Path to the SQLite file
+            expiry_seconds: Entries older than this are treated as missing
+            missing_expiry_seconds: Same, for None results (CURIEs the API
+                did not recognize)
+        """
+        self.expiry_seconds = expiry_seconds
+        self.missing_expiry_seconds = missing_expiry_seconds
+        # curie -> (preferred, fetched_at), in insertion order
+        self._memory: Dict[str, Tuple[Optional[str], float]] = {}
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS normalized ("
+                "curie TEXT PRIMARY KEY, preferred TEXT, fetched_at REAL NOT NULL)"
+            )
+
+    def get_many(self, curies: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Look up cached results.
+
+        Args:
+            curies: CURIEs to look up
+
+        Returns:
+            Dict with an entry for every CURIE that has an unexpired result.
+            The value may be None (the API did not recognize the CURIE).
+        """
+        now = time.time()
+        oldest = now - self.expiry_seconds
+        oldest_missing = now - self.missing_expiry_seconds
+        found = {}
+
+        remaining = []
+        for curie in curies:
+            entry = self._memory.get(curie)
+            if entry is not None and entry[1] >= (oldest if entry[0] is not None else oldest_missing):
+                found[curie] = entry[0]
+            else:
+                remaining.append(curie)
+
+        for start in range(0, len(remaining), _SQLITE_MAX_PARAMS):
+            chunk = remaining[start:start + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT curie, preferred, fetched_at FROM normalized "
+                f"WHERE fetched_at >= CASE WHEN preferred IS NULL THEN ? ELSE ? END "
+                f"AND curie IN ({placeholders})",
+                [oldest_missing, oldest, *chunk]
+            )
+            for curie, preferred, fetched_at in rows:
+                found[curie] = preferred
+                self._remember(curie, preferred, fetched_at)
+        return found
+
+    def set_many(self, results: Dict[str, Optional[str]]) -> None:
+        """
+        Store normalization results, replacing any existing entries.
+
+        Args:
+            results: Mapping of CURIE to preferred CURIE (or None)
+        """
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO normalized (curie, preferred, fetched_at) VALUES (?, ?, ?)",
+                [(curie, preferred, now) for curie, preferred in results.items()]
+            )
+        for curie, preferred in results.items():
+            self._remember(curie, preferred, now)
+
+    def _remember(self, curie: str, preferred: Optional[str], fetched_at: float) -> None:
+        """Add a result to the in-memory layer, evicting the oldest entry when full."""
+        memory = self._memory
+        memory.pop(curie, None)
+        if len(memory) >= MEMORY_CACHE_SIZE:
+            del memory[next(iter(memory))]
+        memory[curie] = (preferred, fetched_at)
+
+
+_cache: Optional[NormalizationCache] = None
+
+
+def _get_cache() -> Optional[NormalizationCache]:
+    """Open the on-disk cache on first use; None if disabled."""
+    global _cache
+    if _cache is None:
+        cache_dir = os.environ.get("PATHFILTER_CACHE_DIR", DEFAULT_CACHE_DIR)
+        if not cache_dir:
+            return None
+        os.makedirs(cache_dir, exist_ok=True)
+        _cache = NormalizationCache(os.path.join(cache_dir, "normalization.sqlite"))
+    return _cache
+
+
+def _fetch_normalized(curies: List[str]) -> Dict[str, Optional[str]]:
     """
-    Normalize a list of CURIEs to their preferred identifiers.
-
-    Uses the Node Normalizer API with both conflation options set to True.
-    Returns a mapping from input CURIE to its preferred (clique leader) identifier.
+    POST CURIEs to the Node Normalizer and extract preferred identifiers.
 
     Args:
-        curies: List of CURIEs to normalize
+        curies: Unique CURIEs to normalize
 
     Returns:
-        Dictionary mapping input CURIE to preferred CURIE.
-        If a CURIE cannot be normalized, it maps to None.
-
-    Example:
-        >>> normalize_curies(["MESH:D014867", "CHEBI:15377"])
-        {
-            "MESH:D014867": "CHEBI:15377",
-            "CHEBI:15377": "CHEBI:15377"
-        }
+        Dictionary mapping each CURIE to its preferred CURIE or None
     """
-    if not curies:
-        return {}
-
     # Prepare request payload
     payload = {
         "curies": curies,
@@ -40,10 +174,10 @@ def normalize_curies(curies: List[str]) -> Dict[str, Optional[str]]:
     }
 
     try:
-        response = requests.post(NODE_NORMALIZER_URL, json=payload, timeout=30)
+        response = _session.post(NODE_NORMALIZER_URL, json=payload, timeout=30)
         response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as e:
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+    except (requests.RequestException, ValueError) as e:
         # Let it fail - don't hide the error
         raise RuntimeError(f"Node normalization API request failed: {e}")
 
@@ -59,12 +193,79 @@ def normalize_curies(curies: List[str]) -> Dict[str, Optional[str]]:
     return result
 
 
+def _fetch_in_batches(curies: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Fetch normalizations, splitting large requests into concurrent batches.
+
+    Args:
+        curies: Unique CURIEs to normalize
+
+    Returns:
+        Dictionary mapping each CURIE to its preferred CURIE or None
+    """
+    if len(curies) <= NORMALIZATION_BATCH_SIZE:
+        return _fetch_normalized(curies)
+
+    batches = [
+        curies[start:start + NORMALIZATION_BATCH_SIZE]
+        for start in range(0, len(curies), NORMALIZATION_BATCH_SIZE)
+    ]
+    result = {}
+    with ThreadPoolExecutor(max_workers=NORMALIZATION_MAX_WORKERS) as executor:
+        for batch_result in executor.map(_fetch_normalized, batches):
+            result.update(batch_result)
+    return result
+
+
+def normalize_curies(curies: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Normalize a list of CURIEs to their preferred identifiers.
+
+    Uses the Node Normalizer API with both conflation options set to True.
+    Returns a mapping from input CURIE to its preferred (clique leader) identifier.
+    Results are read from and written to the on-disk cache, so only CURIEs
+    not seen in the last CACHE_EXPIRY_SECONDS are sent to the API.
+
+    Args:
+        curies: List of CURIEs to normalize
+
+    Returns:
+        Dictionary mapping input CURIE to preferred CURIE.
+        If a CURIE cannot be normalized, it maps to None.
+
+    Example:
+        >>> normalize_curies(["MESH:D014867", "CHEBI:15377"])
+        {
+            "MESH:D014867": "CHEBI:15377",
+            "CHEBI:15377": "CHEBI:15377"
+        }
+    """
+    if not curies:
+        return {}
+
+    # Duplicates only need to be resolved once
+    unique_curies = list(dict.fromkeys(curies))
+
+    cache = _get_cache()
+    resolved = cache.get_many(unique_curies) if cache is not None else {}
+
+    missing = [curie for curie in unique_curies if curie not in resolved]
+    if missing:
+        fetched = _fetch_in_batches(missing)
+        if cache is not None:
+            cache.set_many(fetched)
+        resolved.update(fetched)
+
+    return {curie: resolved[curie] for curie in unique_curies}
+
+
 @lru_cache(maxsize=10000)
 def normalize_curie(curie: str) -> Optional[str]:
     """
     Normalize a single CURIE to its preferred identifier.
 
-    This function is cached to avoid repeated API calls for the same CURIE.
+    This function is cached in memory, on top of the on-disk cache used by
+    normalize_curies, to avoid repeated lookups for the same CURIE.
 
     Args:
         curie: CURIE to normalize
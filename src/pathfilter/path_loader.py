@@ -1,16 +1,48 @@
 """Load and parse path data from xlsx files."""
-from dataclasses import dataclass
-from typing import List, Optional
+import ast
+import gc
+import hashlib
+import os
+import pickle
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from pathfilter.curie_utils import parse_path_curies
+from pathfilter.curie_vocab import CURIE_VOCAB
 
+# Prefer the Rust calamine reader when installed (pip install python-calamine);
+# otherwise pandas falls back to openpyxl.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
 
-@dataclass
+# When PATHFILTER_FRAME_CACHE_DIR is set, parsed path files are kept in that
+# directory, keyed on the file's absolute path, mtime and size, so unchanged
+# files skip the xlsx parse on later runs. Off when unset or empty; this is
+# independent of PATHFILTER_CACHE_DIR (see normalization.DEFAULT_CACHE_DIR).
+
+# A predicate inside a set string such as "{'biolink:affects', 'biolink:treats'}"
+_PREDICATE_RE = re.compile(r"""[^{}'",\s]+""")
+
+
+@dataclass(frozen=True, slots=True)
 class Path:
-    """Represents a single path between two nodes."""
+    """
+    Represents a single path between two nodes.
+
+    Paths are immutable; use dataclasses.replace() to derive a modified copy
+    so the fields computed in __post_init__ stay consistent.
+    """
 
     path_labels: str  # "asthma -> Artenimol -> ATG12 -> Imatinib"
-    path_curies: List[str]  # ["MONDO:0004979", "CHEBI:...", "NCBIGene:...", "CHEBI:31690"]
+    path_curies: Tuple[str, ...]  # ("MONDO:0004979", "CHEBI:...", "NCBIGene:...", "CHEBI:31690")
     num_paths: int
     categories: str  # "biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:SmallMolecule"
     first_hop_predicates: str  # "{'biolink:treats_or_applied_or_studied_to_treat'}"
@@ -18,12 +50,240 @@ class Path:
     third_hop_predicates: str
     has_gene: bool
     metapaths: str  # List string representation
+    # int32 ids from CURIE_VOCAB, set by the loader; None for hand-built paths
+    path_curies_ids: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    # Parsed, interned form of metapaths, computed once at construction
+    metapaths_list: List[str] = field(init=False, repr=False, compare=False)
+    # path_curies hashed once, for set operations against expected nodes
+    path_curies_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    # categories split into node types once, for the type-based filters
+    categories_tuple: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Predicates of each of the three hops, parsed once from the set strings
+    hop_predicates: Tuple[Tuple[str, ...], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__.
+        # path_curies given as a list is stored as a tuple, so paths are
+        # hashable and cannot be changed through the list
+        if not isinstance(self.path_curies, tuple):
+            object.__setattr__(self, 'path_curies', tuple(self.path_curies))
+        # literal_eval can yield non-str items; only strings can be interned
+        object.__setattr__(self, 'metapaths_list', [
+            sys.intern(metapath) if type(metapath) is str else metapath
+            for metapath in parse_metapaths_from_string(self.metapaths)
+        ])
+        object.__setattr__(self, 'path_curies_set', frozenset(self.path_curies))
+        object.__setattr__(self, 'categories_tuple', split_categories(self.categories))
+        object.__setattr__(self, 'hop_predicates', (
+            parse_hop_predicates(self.first_hop_predicates),
+            parse_hop_predicates(self.second_hop_predicates),
+            parse_hop_predicates(self.third_hop_predicates),
+        ))
+
+
+@dataclass(frozen=True)
+class PathBatch:
+    """
+    Column-wise view of a list of paths, for vectorized filters.
+
+    Category and predicate strings repeat heavily across paths, so each
+    string field is an int32 array (one entry per path, in the order of the
+    paths the batch was built from) indexing the distinct values in
+    strings. A check on those fields runs once per distinct string (see
+    string_flags) and is then gathered per path. Node types are also
+    encoded as small ints: category_ids[i, j] indexes category_types, and
+    is -1 past the end of paths shorter than the longest one. Likewise
+    intermediate_ids[i, k] indexes intermediate_nodes for the CURIE at
+    position k + 1 of path i (the nodes the node-characteristic filters
+    check), and is -1 where the path has no such position.
+    """
+
+    strings: Tuple[str, ...]
+    categories: np.ndarray
+    first_hop_predicates: np.ndarray
+    second_hop_predicates: np.ndarray
+    third_hop_predicates: np.ndarray
+    category_types: Tuple[str, ...]
+    category_ids: np.ndarray  # int16, (num_paths, max_nodes)
+    category_counts: np.ndarray  # int64, nodes on each path
+    intermediate_nodes: Tuple[str, ...]
+    intermediate_ids: np.ndarray  # int32, (num_paths, 2)
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def string_flags(self, text: str) -> np.ndarray:
+        """
+        Check which distinct strings contain text.
+
+        Index the result with a string field to get one flag per path.
+
+        Args:
+            text: Substring to look for
+
+        Returns:
+            Boolean array with one entry per value in strings
+        """
+        return np.fromiter(
+            (text in value for value in self.strings), dtype=bool, count=len(self.strings)
+        )
+
+    @classmethod
+    def from_paths(cls, paths: List[Path]) -> "PathBatch":
+        """
+        Build a batch from Path objects.
+
+        Args:
+            paths: List of Path objects
+
+        Returns:
+            PathBatch holding the string fields and node types of all paths
+        """
+        string_index: Dict[str, int] = {}
+
+        def encode(values) -> np.ndarray:
+            return np.fromiter(
+                (string_index.setdefault(value, len(string_index)) for value in values),
+                dtype=np.int32, count=len(paths)
+            )
+
+        type_index: Dict[str, int] = {}
+        counts = np.fromiter(
+            (len(p.categories_tuple) for p in paths), dtype=np.int64, count=len(paths)
+        )
+        category_ids = np.full((len(paths), int(counts.max(initial=0))), -1, dtype=np.int16)
+        for i, path in enumerate(paths):
+            category_ids[i, :counts[i]] = [
+                type_index.setdefault(category, len(type_index))
+                for category in path.categories_tuple
+            ]
+
+        node_index: Dict[str, int] = {}
+        intermediate_ids = np.full((len(paths), 2), -1, dtype=np.int32)
+        for i, path in enumerate(paths):
+            for k, curie in enumerate(path.path_curies[1:3]):
+                intermediate_ids[i, k] = node_index.setdefault(curie, len(node_index))
+
+        categories = encode(p.categories for p in paths)
+        first_hops = encode(p.first_hop_predicates for p in paths)
+        second_hops = encode(p.second_hop_predicates for p in paths)
+        third_hops = encode(p.third_hop_predicates for p in paths)
+        return cls(
+            strings=tuple(string_index),
+            categories=categories,
+            first_hop_predicates=first_hops,
+            second_hop_predicates=second_hops,
+            third_hop_predicates=third_hops,
+            category_types=tuple(type_index),
+            category_ids=category_ids,
+            category_counts=counts,
+            intermediate_nodes=tuple(node_index),
+            intermediate_ids=intermediate_ids,
+        )
+
+
+@lru_cache(maxsize=None)
+def split_categories(categories: str) -> Tuple[str, ...]:
+    """
+    Split a categories string into its interned node types.
+
+    Only a few hundred distinct category chains occur across all path
+    files, so results are cached and paths with the same chain share
+    one tuple.
+
+    Args:
+        categories: String like "biolink:Disease --> biolink:Gene --> ..."
+
+    Returns:
+        Tuple of interned biolink category strings, one per node
+    """
+    return tuple(sys.intern(category) for category in categories.split(" --> "))
+
+
+@lru_cache(maxsize=None)
+def parse_hop_predicates(pred_str: str) -> Tuple[str, ...]:
+    """
+    Parse a hop's predicate set string into its predicates.
+
+    pred_str is a string representation of a set like "{'biolink:affects'}"
+    or "{'biolink:affects', 'biolink:treats'}"; "set()" and "" are empty.
+    Like split_categories, results are cached: predicate sets repeat across
+    paths, which then share one parsed tuple.
+
+    Args:
+        pred_str: Predicate set string from a path file
+
+    Returns:
+        Tuple of interned predicate strings, in the order they appear
+    """
+    if not pred_str or pred_str == "set()":
+        return ()
+    # Fast path for the canonical repr "{'a', 'b'}": split on the separator,
+    # checking by quote and space counts that no token hides another one
+    if pred_str.startswith("{'") and pred_str.endswith("'}"):
+        predicates = pred_str[2:-2].split("', '")
+        if (pred_str.count("'") == 2 * len(predicates)
+                and pred_str.count(" ") == len(predicates) - 1):
+            return tuple(map(sys.intern, predicates))
+    # Everything between set braces, quotes, commas and whitespace is a predicate
+    return tuple(sys.intern(p) for p in _PREDICATE_RE.findall(pred_str))
+
+
+def parse_metapaths_from_string(metapaths_str: str) -> List[str]:
+    """
+    Parse metapaths from the string representation in xlsx files.
+
+    The metapaths column contains a string representation of a Python list.
+    Examples:
+        "['metapath1']"
+        "['metapath1', 'metapath2']"
+
+    The common case (a list of plainly quoted strings) is split directly;
+    anything else falls back to ast.literal_eval.
+
+    Args:
+        metapaths_str: String representation of metapath list from xlsx
+
+    Returns:
+        List of metapath strings
+    """
+    s = metapaths_str.strip()
+    if len(s) >= 2 and s[0] == '[' and s[-1] == ']':
+        inner = s[1:-1].strip()
+        if not inner:
+            return []
+        quote = inner[0]
+        if quote in ("'", '"') and len(inner) >= 2 and inner[-1] == quote and '\\' not in inner:
+            parts = inner[1:-1].split(f"{quote}, {quote}")
+            # A stray quote means the split was wrong (e.g. no space after a comma)
+            if not any(quote in part for part in parts):
+                return parts
+
+    return _parse_metapaths_literal(metapaths_str)
+
+
+def _parse_metapaths_literal(metapaths_str: str) -> List[str]:
+    """Parse a metapaths string with ast.literal_eval (general fallback)."""
+    try:
+        # Use ast.literal_eval to safely parse the string representation
+        metapaths = ast.literal_eval(metapaths_str)
+        if isinstance(metapaths, list):
+            return metapaths
+        else:
+            # If it's not a list, wrap it
+            return [str(metapaths)]
+    except (ValueError, SyntaxError):
+        # If parsing fails, return empty list
+        return []
 
 
 def load_paths_from_file(file_path: str) -> List[Path]:
     """
     Load all paths from an xlsx file.
 
+    If PATHFILTER_FRAME_CACHE_DIR is set, the parsed file is cached there,
+    so loading an unchanged file again skips the xlsx parse.
+
     Args:
         file_path: Path to the xlsx file containing paths
 
@@ -34,8 +294,71 @@ def load_paths_from_file(file_path: str) -> List[Path]:
         FileNotFoundError: If the file doesn't exist
         ValueError: If the file format is invalid
     """
+    return _paths_from_frame(_read_path_file(file_path))
+
+
+def _frame_cache_file(file_path: str) -> Optional[str]:
+    """Cache file for a path file's parsed frame; None if caching is off or the file is missing."""
+    cache_dir = os.environ.get("PATHFILTER_FRAME_CACHE_DIR")
+    if not cache_dir:
+        return None
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    key = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+    return os.path.join(cache_dir, f"{key}-{stat.st_mtime_ns}-{stat.st_size}.pkl")
+
+
+def _load_cached_frame(cache_file: str) -> Optional[pd.DataFrame]:
+    """Load a cached frame; None if it is missing or unreadable (corrupt, other pandas version)."""
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        df = pd.read_pickle(cache_file)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+        # What a truncated, corrupt or stale (other pandas version) pickle raises
+        df = None
+    if not isinstance(df, pd.DataFrame):
+        # Drop the bad entry; the caller re-parses the xlsx and rewrites it
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
+        return None
+    return df
+
+
+def _store_cached_frame(cache_file: str, df: pd.DataFrame) -> None:
+    """Write a frame to the cache, removing older entries for the same source file."""
+    cache_dir = os.path.dirname(cache_file)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write then rename, so a concurrent reader never sees a partial file
+    partial = f"{cache_file}.{os.getpid()}.tmp"
+    df.to_pickle(partial)
+    os.replace(partial, cache_file)
+
+    # Entries are named {key}-{mtime}-{size}.pkl; any other one with this
+    # key was written for an earlier version of the file
+    key = os.path.basename(cache_file).split("-", 1)[0]
+    for name in os.listdir(cache_dir):
+        if name.startswith(f"{key}-") and name.endswith(".pkl") and name != os.path.basename(cache_file):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def _read_path_file(file_path: str) -> pd.DataFrame:
+    """Read a path xlsx file (or its cached frame) and check it has the required columns."""
+    cache_file = _frame_cache_file(file_path)
+    if cache_file is not None:
+        cached = _load_cached_frame(cache_file)
+        if cached is not None:
+            return cached
+
     try:
-        df = pd.read_excel(file_path)
+        df = pd.read_excel(file_path, engine=EXCEL_ENGINE)
     except FileNotFoundError:
         raise FileNotFoundError(f"Path file not found: {file_path}")
     except Exception as e:
@@ -51,23 +374,55 @@ def load_paths_from_file(file_path: str) -> List[Path]:
     if missing_columns:
         raise ValueError(f"Missing required columns: {missing_columns}")
 
-    paths = []
-    for _, row in df.iterrows():
-        # Parse path_curies into list
-        path_curies_list = parse_path_curies(str(row['path_curies']))
-
-        path = Path(
-            path_labels=str(row['path']),
-            path_curies=path_curies_list,
-            num_paths=int(row['num_paths']),
-            categories=str(row['categories']),
-            first_hop_predicates=str(row['first_hop_predicates']),
-            second_hop_predicates=str(row['second_hop_predicates']),
-            third_hop_predicates=str(row['third_hop_predicates']),
-            has_gene=bool(row['has_gene']),
-            metapaths=str(row['metapaths'])
-        )
-        paths.append(path)
+    if cache_file is not None:
+        _store_cached_frame(cache_file, df)
+    return df
+
+
+def _paths_from_frame(df: pd.DataFrame) -> List[Path]:
+    """Build Path objects from the rows of a validated path file."""
+    # Pull each column out once instead of boxing a Series per row
+    labels = df['path'].astype(str).tolist()
+    curie_strings = df['path_curies'].astype(str).tolist()
+    num_paths = df['num_paths'].astype(np.int64).tolist()
+    # Categories and predicate sets repeat across many rows; interning keeps
+    # one copy of each and lets equal strings compare by identity
+    categories = [sys.intern(c) for c in df['categories'].astype(str).tolist()]
+    first_hops = [sys.intern(p) for p in df['first_hop_predicates'].astype(str).tolist()]
+    second_hops = [sys.intern(p) for p in df['second_hop_predicates'].astype(str).tolist()]
+    third_hops = [sys.intern(p) for p in df['third_hop_predicates'].astype(str).tolist()]
+    has_gene = df['has_gene'].astype(bool).tolist()
+    metapaths = df['metapaths'].astype(str).tolist()
+
+    # Each Path allocates several tuples and a frozenset, none of them in
+    # reference cycles. Pause the cyclic collector while building them, or
+    # it rescans the growing list of paths over and over
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        paths = []
+        for i in range(len(df)):
+            # Parse path_curies into a tuple. The same CURIEs (the query's
+            # endpoints, common genes and chemicals) recur across rows, so
+            # intern them too: paths then share one string per CURIE
+            curies = tuple(map(sys.intern, parse_path_curies(curie_strings[i])))
+
+            path = Path(
+                path_labels=labels[i],
+                path_curies=curies,
+                num_paths=num_paths[i],
+                categories=categories[i],
+                first_hop_predicates=first_hops[i],
+                second_hop_predicates=second_hops[i],
+                third_hop_predicates=third_hops[i],
+                has_gene=has_gene[i],
+                metapaths=metapaths[i],
+                path_curies_ids=CURIE_VOCAB.encode(curies)
+            )
+            paths.append(path)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
 
     return paths
 
@@ -93,3 +448,40 @@ def load_paths_for_query(query, paths_dir: str) -> Optional[List[Path]]:
         return None
 
     return load_paths_from_file(path_file)
+
+
+def load_all_paths_parallel(queries, paths_dir: str,
+                            max_workers: Optional[int] = None) -> Dict[str, Optional[List[Path]]]:
+    """
+    Load the paths for many queries, reading their files in worker processes.
+
+    Parsing the xlsx files dominates load time and each file is independent,
+    so the files are read concurrently. Path objects are still built here,
+    in this process, so their CURIE ids come from this process's CURIE_VOCAB.
+
+    Args:
+        queries: Query objects to load paths for
+        paths_dir: Directory containing path xlsx files
+        max_workers: Number of worker processes (None = os.cpu_count(),
+                     1 = read the files serially in this process)
+
+    Returns:
+        Dict of query name -> list of Path objects, or None for queries
+        with no path file (as load_paths_for_query)
+    """
+    from pathfilter.query_loader import find_path_file_for_query
+
+    path_files = {query.name: find_path_file_for_query(query, paths_dir) for query in queries}
+    to_read = list(dict.fromkeys(f for f in path_files.values() if f))
+
+    if max_workers == 1 or len(to_read) <= 1:
+        frames = map(_read_path_file, to_read)
+        paths_by_file = {f: _paths_from_frame(df) for f, df in zip(to_read, frames)}
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            paths_by_file = {
+                f: _paths_from_frame(df)
+                for f, df in zip(to_read, executor.map(_read_path_file, to_read))
+            }
+
+    return {name: paths_by_file[f] if f else None for name, f in path_files.items()}
@@ -1,11 +1,18 @@
 """Load and parse Pathfinder query definitions from normalized JSON."""
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, FrozenSet
 from pathlib import Path
 import json
+import os
 
+try:
+    import orjson  # optional: faster parsing of the normalized queries file
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Query:
     """Represents a Pathfinder test query with expected results."""
 
@@ -45,8 +52,12 @@ def load_all_queries(queries_file: str) -> List[Query]:
         queries_path = json_path
 
     # Load from JSON
-    with open(queries_path, 'r') as f:
-        queries_data = json.load(f)
+    if orjson is not None:
+        with open(queries_path, 'rb') as f:
+            queries_data = orjson.loads(f.read())
+    else:
+        with open(queries_path, 'r') as f:
+            queries_data = json.load(f)
 
     # Convert to Query objects
     queries = []
@@ -64,6 +75,31 @@ def load_all_queries(queries_file: str) -> List[Query]:
     return queries
 
 
+@lru_cache(maxsize=64)
+def _list_dir_at(paths_dir: str, mtime_ns: int) -> FrozenSet[str]:
+    """List a directory's file names; mtime_ns is only part of the cache key."""
+    return frozenset(os.listdir(paths_dir))
+
+
+def _list_dir(paths_dir: str) -> FrozenSet[str]:
+    """
+    List a directory's file names, reusing the listing while it is unchanged.
+
+    The cached listing is keyed on the directory's modification time, so
+    files added or removed later (or a directory created later) are seen.
+
+    Args:
+        paths_dir: Directory to list
+
+    Returns:
+        Frozen set of file names (empty if the directory does not exist)
+    """
+    try:
+        return _list_dir_at(paths_dir, os.stat(paths_dir).st_mtime_ns)
+    except FileNotFoundError:
+        return frozenset()
+
+
 def find_path_file_for_query(query: Query, paths_dir: str) -> Optional[str]:
     """
     Find the path file corresponding to a query.
@@ -78,6 +114,7 @@ def find_path_file_for_query(query: Query, paths_dir: str) -> Optional[str]:
         Path to the matching xlsx file, or None if not found
     """
     paths_path = Path(paths_dir)
+    filenames = _list_dir(str(paths_path))
 
     # Try all combinations of start and end CURIEs
     for start_curie in query.start_curies:
@@ -93,8 +130,7 @@ def find_path_file_for_query(query: Query, paths_dir: str) -> Optional[str]:
             ]
 
             for pattern in patterns:
-                file_path = paths_path / pattern
-                if file_path.exists():
-                    return str(file_path)
+                if pattern in filenames:
+                    return str(paths_path / pattern)
 
     return None
@@ -0,0 +1,17 @@
+"""Shared test setup."""
+import pytest
+
+from pathfilter import normalization
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point the on-disk caches at a per-test directory instead of the user's home."""
+    monkeypatch.setenv("PATHFILTER_CACHE_DIR", str(tmp_path / "pathfilter_cache"))
+    # The path file cache is opt-in; tests that use it enable it themselves
+    monkeypatch.delenv("PATHFILTER_FRAME_CACHE_DIR", raising=False)
+    # Drop any already-open normalization cache so it is reopened under tmp_path
+    monkeypatch.setattr(normalization, "_cache", None)
+    yield
+    if normalization._cache is not None:
+        normalization._cache._conn.close()
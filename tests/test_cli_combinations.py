@@ -99,6 +99,40 @@ class TestFilterCombinations:
         # Expected: 2^3 * (1 + 2) = 8 * 3 = 24
         assert len(strategies) == 24
 
+    def test_strategy_order(self):
+        """Baseline first, then every single filter in input order, then combinations with their node variants."""
+        filter_dict = {
+            "a": dummy_filter_a,
+            "b": dummy_filter_b,
+            "min_ic_30": dummy_ic_30,
+        }
+
+        strategies = generate_all_filter_combinations(filter_dict)
+
+        assert list(strategies) == [
+            "none",
+            "a", "b", "min_ic_30",
+            "a+min_ic_30",
+            "b+min_ic_30",
+            "a+b", "a+b+min_ic_30",
+        ]
+
+    def test_same_size_combinations_in_lexicographic_order(self):
+        """Combinations of one size follow itertools.combinations order."""
+        def dummy_filter_d(path):
+            return True
+
+        filter_dict = {
+            "a": dummy_filter_a,
+            "b": dummy_filter_b,
+            "c": dummy_filter_c,
+            "d": dummy_filter_d,
+        }
+
+        strategies = generate_all_filter_combinations(filter_dict, max_combination_size=2)
+
+        assert list(strategies)[5:] == ["a+b", "a+c", "a+d", "b+c", "b+d", "c+d"]
+
     def test_no_redundant_ic_combinations(self):
         """Ensure no combinations like 'min_ic_30+min_ic_50'."""
         filters = {
@@ -114,6 +148,20 @@ class TestFilterCombinations:
             ic_count = strategy_name.count("min_ic_")
             assert ic_count <= 1, f"Strategy name '{strategy_name}' contains {ic_count} IC filters"
 
+    def test_two_path_one_ic_filter(self):
+        """Smoke test of the count formula with P=2, I=1."""
+        filters = {
+            "filter_a": dummy_filter_a,
+            "filter_b": dummy_filter_b,
+            "min_ic_30": dummy_ic_30,
+        }
+
+        strategies = generate_all_filter_combinations(filters)
+
+        # Expected: 2^2 * (1 + 1) = 8
+        assert len(strategies) == 8
+
+    @pytest.mark.slow
     def test_six_path_three_ic_filters(self):
         """Test with realistic 6 path + 3 IC filters (like actual CLI)."""
         filters = {
@@ -0,0 +1,109 @@
+"""Tests for integer CURIE encoding and vectorized matching."""
+import numpy as np
+from pathfilter import _match_kernel
+from pathfilter.curie_vocab import Vocab, CURIE_VOCAB
+from pathfilter.path_loader import Path
+from pathfilter.matching import (
+    filter_paths_with_expected_nodes,
+    count_paths_with_expected_nodes
+)
+
+
+def make_encoded_path(curies):
+    """Create a Path whose CURIEs are encoded with the shared vocabulary."""
+    return Path(
+        path_labels="test",
+        path_curies=curies,
+        num_paths=1,
+        categories="test",
+        first_hop_predicates="test",
+        second_hop_predicates="test",
+        third_hop_predicates="test",
+        has_gene=False,
+        metapaths="['test']",
+        path_curies_ids=CURIE_VOCAB.encode(curies)
+    )
+
+
+class TestVocab:
+    """Tests for the Vocab class."""
+
+    def test_encode_assigns_stable_ids(self):
+        """Same CURIE always gets the same id."""
+        vocab = Vocab()
+        first = vocab.encode(["A:1", "B:2", "A:1"])
+        second = vocab.encode(["B:2"])
+
+        assert first.dtype == np.int32
+        assert list(first) == [0, 1, 0]
+        assert list(second) == [1]
+        assert len(vocab) == 2
+
+    def test_encode_empty(self):
+        """Encoding an empty list returns an empty array."""
+        vocab = Vocab()
+        assert len(vocab.encode([])) == 0
+
+    def test_bitset_marks_known_curies(self):
+        """Bitset is True only at ids of the given CURIEs."""
+        vocab = Vocab()
+        vocab.encode(["A:1", "B:2", "C:3"])
+        bitset = vocab.bitset({"B:2"})
+
+        assert list(bitset) == [False, True, False]
+
+    def test_bitset_skips_unknown_curies(self):
+        """CURIEs never encoded are ignored and not added to the vocab."""
+        vocab = Vocab()
+        vocab.encode(["A:1"])
+        bitset = vocab.bitset({"Z:9"})
+
+        assert not bitset.any()
+        assert "Z:9" not in vocab
+
+
+class TestEncodedMatching:
+    """Tests for matching on paths with encoded CURIE ids."""
+
+    def test_count_encoded_paths(self):
+        """Vectorized count matches the number of paths with expected nodes."""
+        paths = [
+            make_encoded_path(["TEST:a1", "TEST:a2", "TEST:a3"]),
+            make_encoded_path(["TEST:a1", "TEST:b2", "TEST:b3"]),
+            make_encoded_path(["TEST:c1", "TEST:a2"]),
+        ]
+
+        assert count_paths_with_expected_nodes(paths, {"TEST:a2"}) == 2
+        assert count_paths_with_expected_nodes(paths, {"TEST:unseen"}) == 0
+
+    def test_filter_encoded_paths_preserves_order(self):
+        """Vectorized filter returns matching paths in input order."""
+        paths = [
+            make_encoded_path(["TEST:d1", "TEST:d2"]),
+            make_encoded_path(["TEST:e1", "TEST:e2"]),
+            make_encoded_path(["TEST:d1", "TEST:e2"]),
+        ]
+
+        result = filter_paths_with_expected_nodes(paths, {"TEST:e2"})
+        assert result == [paths[1], paths[2]]
+
+    def test_empty_paths_do_not_match(self):
+        """Paths without CURIEs never match, including a trailing one."""
+        paths = [
+            make_encoded_path(["TEST:f1"]),
+            make_encoded_path([]),
+        ]
+
+        assert count_paths_with_expected_nodes(paths, {"TEST:f1"}) == 1
+
+    def test_any_hit_kernels_agree(self):
+        """The loop and numpy kernels give the same hits, empty paths included."""
+        flat_ids = np.array([0, 1, 2, 3, 4, 1], dtype=np.int32)
+        offsets = np.array([0, 2, 2, 5, 6], dtype=np.int64)
+        expected = np.array([False, False, False, True, False])
+
+        for kernel in (_match_kernel._any_hit_python, _match_kernel._any_hit_numpy):
+            out = np.empty(4, dtype=bool)
+            kernel(flat_ids, offsets, expected, out)
+            assert out.tolist() == [False, False, True, False]
+        assert _match_kernel.any_hit(flat_ids[:0], np.zeros(3, dtype=np.int64), expected).tolist() == [False, False]
@@ -1,14 +1,31 @@
 """Tests for evaluation metrics."""
+import numpy as np
 import pytest
+from dataclasses import replace
 from pathfilter.evaluation import (
     FilterMetrics,
     evaluate_filter_strategy,
     evaluate_multiple_strategies,
-    format_metrics_table
+    format_metrics_table,
+    _pack_filter_rows
 )
 from pathfilter.filters import no_dupe_types, all_paths
+from pathfilter.matching import compute_path_matches
 from pathfilter.path_loader import Path
-from pathfilter.normalization import normalize_curies
+
+
+# Static fields shared by every test path; make_path only swaps the varying ones
+_TEMPLATE_PATH = Path(
+    path_labels="A -> B -> C -> D",
+    path_curies=("ID1", "ID2", "ID3", "ID4"),
+    num_paths=1,
+    categories="A --> B --> C --> D",
+    first_hop_predicates="{'biolink:affects'}",
+    second_hop_predicates="{'biolink:affects'}",
+    third_hop_predicates="{'biolink:affects'}",
+    has_gene=True,
+    metapaths="['test']"
+)
 
 
 def make_path(categories="A --> B --> C --> D", curies=None,
@@ -17,17 +34,14 @@ def make_path(categories="A --> B --> C --> D", curies=None,
               third_hop_predicates="{'biolink:affects'}"):
     """Helper to create test paths."""
     if curies is None:
-        curies = ["ID1", "ID2", "ID3", "ID4"]
-    return Path(
-        path_labels="A -> B -> C -> D",
+        curies = _TEMPLATE_PATH.path_curies
+    return replace(
+        _TEMPLATE_PATH,
         path_curies=curies,
-        num_paths=1,
         categories=categories,
         first_hop_predicates=first_hop_predicates,
         second_hop_predicates=second_hop_predicates,
-        third_hop_predicates=third_hop_predicates,
-        has_gene=True,
-        metapaths="['test']"
+        third_hop_predicates=third_hop_predicates
     )
 
 
@@ -127,12 +141,35 @@ class TestFilterMetrics:
         assert metrics.retention_rate == 0.0
         assert metrics.expected_nodes_recall == 0.0
 
+    def test_metrics_are_frozen(self):
+        """Counts cannot be changed after the derived rates are computed."""
+        from dataclasses import FrozenInstanceError
+
+        metrics = FilterMetrics(
+            filter_name="test",
+            total_paths_before=100,
+            total_paths_after=50,
+            expected_paths_before=20,
+            expected_paths_after=15,
+            expected_nodes_found_before=5,
+            expected_nodes_found_after=4
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            metrics.total_paths_after = 10
+        assert metrics.retention_rate == 0.5
+        assert not hasattr(metrics, '__dict__')
+
 
 class TestEvaluateFilterStrategy:
     """Tests for evaluating filter strategies."""
 
     def test_no_filter_evaluation(self):
         """Test evaluation with no filtering."""
+        # Imported here so only this (network) test loads requests and the
+        # normalization cache
+        from pathfilter.normalization import normalize_curies
+
         paths = [
             make_path(curies=["MONDO:0001", "NCBIGene:3815", "ID3", "ID4"]),
             make_path(curies=["ID1", "ID2", "ID3", "ID4"]),
@@ -175,6 +212,45 @@ class TestEvaluateFilterStrategy:
         assert metrics.total_paths_after == 1
         assert metrics.retention_rate == 0.5
 
+    def test_all_paths_keeps_baseline_counts(self):
+        """A strategy of only all_paths reports the baseline counts after filtering."""
+        paths = [
+            make_path(curies=["MONDO:0001", "NCBIGene:3815", "ID3", "ID4"]),
+            make_path(curies=["ID1", "ID2", "ID3", "ID4"]),
+        ]
+
+        metrics = evaluate_filter_strategy(paths, {"NCBIGene:3815"}, [all_paths], "none")
+
+        assert metrics.total_paths_after == metrics.total_paths_before == 2
+        assert metrics.expected_paths_after == metrics.expected_paths_before == 1
+        assert metrics.expected_nodes_found_after == metrics.expected_nodes_found_before == 1
+
+    def test_precomputed_baseline(self):
+        """Passing the baseline matches gives the same metrics as computing them."""
+        paths = [
+            make_path(
+                categories="biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity",
+                curies=["MONDO:1", "CHEBI:1", "NCBIGene:1", "UBERON:1"]
+            ),
+            make_path(
+                categories="biolink:Disease --> biolink:Disease --> biolink:Gene --> biolink:SmallMolecule",
+                curies=["MONDO:1", "MONDO:2", "NCBIGene:2", "CHEBI:2"]
+            ),
+        ]
+        expected_set = {"NCBIGene:1", "NCBIGene:2"}
+        baseline = compute_path_matches(paths, expected_set)
+
+        metrics = evaluate_filter_strategy(
+            paths, expected_set, [no_dupe_types], "no_dupe_types", baseline=baseline
+        )
+
+        assert metrics == evaluate_filter_strategy(
+            paths, expected_set, [no_dupe_types], "no_dupe_types"
+        )
+        assert metrics.expected_paths_before == 2
+        assert metrics.expected_paths_after == 1
+        assert metrics.expected_nodes_found_after == 1
+
 
 class TestEvaluateMultipleStrategies:
     """Tests for evaluating multiple strategies with optimized caching."""
@@ -245,6 +321,130 @@ class TestEvaluateMultipleStrategies:
         assert "no_expression" in filter_names
         assert "no_dupe_types+no_expression" in filter_names
 
+    def test_result_order(self):
+        """Results follow the original order: none, node filters, then combinations by size in combinations order."""
+        from pathfilter.filters import no_expression, no_related_to, no_abab
+
+        paths = [make_path()]
+        individual_filters = {
+            "no_dupe_types": no_dupe_types,
+            "no_expression": no_expression,
+            "no_related_to": no_related_to,
+            "no_abab": no_abab,
+            "min_ic_30": all_paths,
+        }
+
+        results = evaluate_multiple_strategies(paths, set(), individual_filters, max_combination_size=2)
+
+        names = [r.filter_name for r in results]
+        assert names[:2] == ["none", "min_ic_30"]
+        pairs = [name for name in names if name.count("+") == 1 and "min_ic" not in name]
+        assert pairs == [
+            "no_dupe_types+no_expression", "no_dupe_types+no_related_to", "no_dupe_types+no_abab",
+            "no_expression+no_related_to", "no_expression+no_abab", "no_related_to+no_abab",
+        ]
+        assert names[2:4] == ["no_dupe_types", "no_dupe_types+min_ic_30"]
+
+    def test_matches_single_strategy_evaluation(self):
+        """Every combination gives the same metrics as evaluating it on its own."""
+        from pathfilter.filters import no_expression
+
+        paths = [
+            make_path(
+                categories="biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity",
+                curies=["MONDO:1", "CHEBI:1", "NCBIGene:1", "UBERON:1"]
+            ),
+            make_path(
+                categories="biolink:Disease --> biolink:Disease --> biolink:Gene --> biolink:SmallMolecule",
+                curies=["MONDO:1", "MONDO:2", "NCBIGene:2", "CHEBI:2"]
+            ),
+            make_path(
+                categories="biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity",
+                curies=["MONDO:1", "CHEBI:3", "NCBIGene:1", "UBERON:2"],
+                first_hop_predicates="{'biolink:expressed_in'}"
+            ),
+        ]
+        individual_filters = {
+            "no_dupe_types": no_dupe_types,
+            "no_expression": no_expression
+        }
+        expected_set = {"NCBIGene:1", "NCBIGene:2"}
+
+        results = evaluate_multiple_strategies(paths, expected_set, individual_filters)
+
+        for result in results:
+            filters = [individual_filters[name] for name in result.filter_name.split("+")
+                       if name != "none"]
+            assert result == evaluate_filter_strategy(
+                paths, expected_set, filters, result.filter_name
+            )
+
+    def test_each_filter_called_once_per_path(self):
+        """Filter results are computed once and reused by every combination."""
+        calls = {"a": 0, "b": 0, "c": 0}
+
+        def counting_filter(name, keep):
+            def filter_func(path):
+                calls[name] += 1
+                return keep
+            return filter_func
+
+        paths = [make_path(), make_path(), make_path()]
+        individual_filters = {
+            "a": counting_filter("a", True),
+            "b": counting_filter("b", False),
+            "c": counting_filter("c", True),
+        }
+
+        results = evaluate_multiple_strategies(paths, set(), individual_filters)
+
+        # none + 7 non-empty combinations of 3 path filters
+        assert len(results) == 8
+        assert calls == {"a": 3, "b": 3, "c": 3}
+
+    def test_ic_filters_match_single_strategy_evaluation(self):
+        """Batch-evaluated IC filters give the same metrics as the filter functions."""
+        from pathfilter.filters import create_min_ic_filter
+
+        ic_data = {"CHEBI:1": 25.0, "NCBIGene:1": 60.0, "CHEBI:2": 80.0}
+        paths = [
+            make_path(curies=["MONDO:1", "CHEBI:1", "NCBIGene:1", "UBERON:1"]),
+            make_path(curies=["MONDO:1", "CHEBI:2", "NCBIGene:1", "UBERON:1"]),
+            make_path(curies=["MONDO:1", "CHEBI:2", "NCBIGene:2", "UBERON:1"]),
+        ]
+        individual_filters = {
+            "no_dupe_types": no_dupe_types,
+            "min_ic_30": create_min_ic_filter(ic_data, 30.0),
+            "min_ic_70": create_min_ic_filter(ic_data, 70.0),
+        }
+        expected_set = {"NCBIGene:1", "NCBIGene:2"}
+
+        results = evaluate_multiple_strategies(paths, expected_set, individual_filters)
+
+        by_name = {result.filter_name: result for result in results}
+        assert by_name["min_ic_30"].total_paths_after == 2
+        assert by_name["min_ic_70"].total_paths_after == 1
+        for result in results:
+            filters = [individual_filters[name] for name in result.filter_name.split("+")
+                       if name != "none"]
+            assert result == evaluate_filter_strategy(
+                paths, expected_set, filters, result.filter_name
+            )
+
+
+class TestPackFilterRows:
+    """Tests for packing filter results into per-path bitmasks."""
+
+    def test_bits_follow_filter_columns(self):
+        """Bit i is set when the path passes filter i."""
+        filter_mask = np.array([[True, False, True], [False, False, False]])
+
+        assert list(_pack_filter_rows(filter_mask)) == [0b101, 0]
+
+    def test_too_many_filters(self):
+        """More than 64 filters cannot be packed and fall back to None."""
+        assert _pack_filter_rows(np.ones((1, 65), dtype=bool)) is None
+
 
 class TestFormatMetricsTable:
     """Tests for formatting metrics."""
@@ -284,3 +484,17 @@ class TestFormatMetricsTable:
         """Test formatting empty list."""
         table = format_metrics_table([])
         assert "Strategy" in table  # Should have header
+
+    def test_long_strategy_names_stay_aligned(self):
+        """The strategy column widens so the counts line up in every row."""
+        metrics_list = [
+            FilterMetrics("none", 100, 100, 20, 20, 5, 5),
+            FilterMetrics("no_dupe_types+no_expression+no_related_to+min_ic_30",
+                          100, 40, 20, 12, 5, 4),
+        ]
+
+        lines = format_metrics_table(metrics_list).split("\n")
+
+        assert len(lines) == 4
+        assert lines[2].index("/") == lines[3].index("/")
+        assert lines[0].index("Paths") < lines[2].index("/")
@@ -1,7 +1,8 @@
 """Tests for filter functions."""
+import io
 import pytest
-import tempfile
-import os
+from functools import lru_cache
+import numpy as np
 from pathfilter.filters import (
     no_dupe_types,
     no_expression,
@@ -14,23 +15,39 @@ from pathfilter.filters import (
     no_nonconsecutive_dupe,
     all_paths,
     apply_filters,
+    apply_filters_parallel,
+    compose_filters,
+    order_by_selectivity,
     load_node_characteristics,
     create_min_ic_filter,
     create_max_degree_filter,
+    batch_ic_pass,
     DEFAULT_FILTERS,
     STRICT_FILTERS
 )
-from pathfilter.path_loader import Path
+from pathfilter.path_loader import Path, PathBatch
+from pathfilter import _category_kernel, _ic_kernel
+
+
+# Shared default; path_curies is a tuple, so no copy is needed per path
+_DEFAULT_CURIES = ("ID1", "ID2", "ID3", "ID4")
 
 
 def make_path(categories="A --> B --> C --> D",
               first_hop="{'biolink:affects'}",
               second_hop="{'biolink:affects'}",
-              third_hop="{'biolink:affects'}"):
-    """Helper to create test paths."""
+              third_hop="{'biolink:affects'}",
+              curies=_DEFAULT_CURIES):
+    """Helper to create test paths; equal arguments return the same (frozen) Path."""
+    return _cached_path(categories, first_hop, second_hop, third_hop, tuple(curies))
+
+
+@lru_cache(maxsize=None)
+def _cached_path(categories, first_hop, second_hop, third_hop, curies):
+    """Build a test path once per distinct set of arguments."""
     return Path(
         path_labels="A -> B -> C -> D",
-        path_curies=["ID1", "ID2", "ID3", "ID4"],
+        path_curies=curies,
         num_paths=1,
         categories=categories,
         first_hop_predicates=first_hop,
@@ -41,20 +58,34 @@ def make_path(categories="A --> B --> C --> D",
     )
 
 
+def even_id(path):
+    """Module-level (so picklable) filter keeping paths whose first CURIE is ID:<even>."""
+    return int(path.path_curies[0][3:]) % 2 == 0
+
+
+@pytest.fixture(scope="module")
+def good_path():
+    """Path with four distinct node types, built once; Paths are frozen, so sharing is safe."""
+    return make_path("biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity")
+
+
+@pytest.fixture(scope="module")
+def dupe_path():
+    """Path whose first two nodes are both Disease, built once."""
+    return make_path("biolink:Disease --> biolink:Disease --> biolink:Gene --> biolink:SmallMolecule")
+
+
 class TestNoDupeTypes:
     """Tests for no_dupe_types filter."""
 
-    def test_four_unique_types_pass(self):
+    def test_four_unique_types_pass(self, good_path):
         """Path with 4 unique types should pass."""
-        path = make_path("biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:Protein")
-        # Note: Protein normalizes to Gene, SmallMolecule stays, so we need truly different types
-        path = make_path("biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity")
-        assert no_dupe_types(path) is True
+        # Note: Protein normalizes to Gene, so the fixture uses truly different types
+        assert no_dupe_types(good_path) is True
 
-    def test_duplicate_types_fail(self):
+    def test_duplicate_types_fail(self, dupe_path):
         """Path with duplicate types should fail."""
-        path = make_path("biolink:Disease --> biolink:Disease --> biolink:Gene --> biolink:SmallMolecule")
-        assert no_dupe_types(path) is False
+        assert no_dupe_types(dupe_path) is False
 
     def test_chemical_normalization(self):
         """ChemicalEntity and SmallMolecule should be treated as same type."""
@@ -114,6 +145,11 @@ class TestNoRelatedTo:
         path = make_path(first_hop="{'biolink:related_to'}")
         assert no_related_to(path) is False
 
+    def test_non_canonical_related_to_pass(self):
+        """Only the exact "{'biolink:related_to'}" string is rejected."""
+        assert no_related_to(make_path(first_hop='{"biolink:related_to"}')) is True
+        assert no_related_to(make_path(second_hop="{ 'biolink:related_to' }")) is True
+
     def test_related_to_in_categories_fail(self):
         """Path with related_to in categories should fail."""
         path = make_path(categories="biolink:Disease --> {'biolink:related_to'} --> biolink:Gene --> biolink:Drug")
@@ -170,29 +206,18 @@ class TestAllPaths:
 class TestApplyFilters:
     """Tests for applying multiple filters."""
 
-    def test_single_filter(self):
+    def test_single_filter(self, good_path, dupe_path):
         """Test applying a single filter."""
-        paths = [
-            make_path("biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity"),
-            make_path("biolink:Disease --> biolink:Disease --> biolink:Gene --> biolink:SmallMolecule"),
-        ]
-
-        filtered = apply_filters(paths, [no_dupe_types])
-        assert len(filtered) == 1
+        filtered = apply_filters([good_path, dupe_path], [no_dupe_types])
+        assert filtered == [good_path]
 
-    def test_multiple_filters(self):
+    def test_multiple_filters(self, good_path, dupe_path):
         """Test applying multiple filters."""
         paths = [
             # Passes both filters
-            make_path(
-                "biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity",
-                first_hop="{'biolink:affects'}"
-            ),
+            good_path,
             # Fails no_dupe_types
-            make_path(
-                "biolink:Disease --> biolink:Disease --> biolink:Gene --> biolink:SmallMolecule",
-                first_hop="{'biolink:affects'}"
-            ),
+            dupe_path,
             # Fails no_expression
             make_path(
                 "biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity",
@@ -209,7 +234,7 @@ class TestApplyFilters:
         filtered = apply_filters(paths, [all_paths])
         assert len(filtered) == 5
 
-    def test_default_filters(self):
+    def test_default_filters(self, dupe_path):
         """Test using DEFAULT_FILTERS."""
         paths = [
             # Good path
@@ -220,14 +245,158 @@ class TestApplyFilters:
                 third_hop="{'biolink:located_in'}"
             ),
             # Has duplicate types
-            make_path(
-                "biolink:Disease --> biolink:Disease --> biolink:Gene --> biolink:SmallMolecule"
-            ),
+            dupe_path,
         ]
 
         filtered = apply_filters(paths, DEFAULT_FILTERS)
         assert len(filtered) == 1
 
+    def test_rejected_paths_not_rechecked(self):
+        """Later filters only see paths kept so far; order is preserved."""
+        paths = [make_path(curies=[f"ID:{i}", "B", "C", "D"]) for i in range(4)]
+        seen = []
+
+        def reject_odd(path):
+            return int(path.path_curies[0].split(":")[1]) % 2 == 0
+
+        def record(path):
+            seen.append(path.path_curies[0])
+            return True
+
+        filtered = apply_filters(paths, [reject_odd, record])
+
+        assert filtered == [paths[0], paths[2]]
+        assert seen == ["ID:0", "ID:2"]
+
+    def test_batch_filters_match_per_path(self):
+        """Vectorized filter versions agree with the per-path functions."""
+        paths = [
+            make_path(),
+            make_path(first_hop="{'biolink:expressed_in'}"),
+            make_path(third_hop="{'biolink:affects', 'biolink:expressed_in'}"),
+            make_path(second_hop="{'biolink:related_to'}"),
+            make_path(second_hop="{'biolink:related_to', 'biolink:affects'}"),
+            make_path(categories="A --> {'biolink:related_to'} --> C --> D"),
+            # Non-canonical spellings of the same hop are not matched
+            make_path(first_hop='{"biolink:related_to"}'),
+            make_path(third_hop="{ 'biolink:related_to' }"),
+        ]
+        batch = PathBatch.from_paths(paths)
+
+        for filter_func in (no_expression, no_related_to):
+            expected = [filter_func(path) for path in paths]
+            assert filter_func.batch(batch).tolist() == expected
+            assert apply_filters(paths, [filter_func]) == [
+                path for path, keep in zip(paths, expected) if keep
+            ]
+
+    @pytest.mark.parametrize("count", [0, 1, 2, 3, 5])
+    def test_compose_filters(self, count):
+        """A composed predicate ANDs its filters and stops at the first rejection."""
+        calls = []
+
+        def make_filter(k):
+            def filter_func(path):
+                calls.append(k)
+                return k != 1
+            return filter_func
+
+        filters = [make_filter(k) for k in range(count)]
+        predicate = compose_filters(filters)
+
+        assert predicate(make_path()) is (count < 2)
+        assert calls == list(range(min(count, 2)))
+        # The same filter sequence reuses the generated predicate
+        assert compose_filters(list(filters)) is predicate
+
+    def test_order_by_selectivity(self):
+        """Filters rejecting more sampled paths are moved to the front."""
+        paths = [make_path(curies=(f"ID:{i}", "B", "C", "D")) for i in range(10)]
+
+        def reject_none(path):
+            return True
+
+        def reject_half(path):
+            return int(path.path_curies[0][3:]) % 2 == 0
+
+        def reject_most(path):
+            return path.path_curies[0] == "ID:0"
+
+        filters = [reject_none, reject_half, reject_most]
+
+        assert order_by_selectivity(paths, filters) == [reject_most, reject_half, reject_none]
+        assert apply_filters(paths, filters, profile=True) == apply_filters(paths, filters)
+
+    def test_batch_filters_run_first(self):
+        """Per-path filters are only called on paths the batch filters kept."""
+        paths = [make_path(), make_path(first_hop="{'biolink:expressed_in'}")]
+        seen = []
+
+        def record(path):
+            seen.append(path)
+            return True
+
+        assert apply_filters(paths, [record, no_expression]) == [paths[0]]
+        assert seen == [paths[0]]
+
+    def test_parallel_equivalence(self):
+        """apply_filters_parallel keeps the same paths, in order, as apply_filters."""
+        paths = [
+            make_path(
+                first_hop="{'biolink:expressed_in'}" if i % 5 == 0 else "{'biolink:treats'}",
+                second_hop="{'biolink:located_in'}" if i % 3 == 0 else "{'biolink:affects'}",
+                third_hop="{'biolink:causes'}" if i % 2 else "{'biolink:affects'}",
+                curies=(f"ID:{i}", "B", "C", "D"),
+            )
+            for i in range(40)
+        ]
+        filters = [no_expression, no_repeat_predicates, even_id]
+        expected = apply_filters(paths, filters)
+        assert 0 < len(expected) < len(paths)
+
+        assert apply_filters_parallel(paths, filters, max_workers=2, chunksize=3) == expected
+        assert apply_filters_parallel(paths, filters, max_workers=1) == expected
+
+        # Closures cannot be sent to workers, so these run in this process
+        def reject_odd(path):
+            return even_id(path)
+
+        assert apply_filters_parallel(paths, [reject_odd], max_workers=2) == paths[::2]
+
+    def test_batch_type_filters_match_per_path(self):
+        """Vectorized node-type filters agree with the per-path functions."""
+        paths = [
+            make_path("biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity"),
+            make_path("biolink:Disease --> biolink:ChemicalEntity --> biolink:Protein --> biolink:Gene"),
+            make_path("biolink:Disease --> biolink:Gene --> biolink:PhenotypicFeature --> biolink:SmallMolecule"),
+            make_path("biolink:Disease --> biolink:MolecularMixture --> biolink:SmallMolecule"),
+            make_path("biolink:PhenotypicFeature --> biolink:SmallMolecule"),
+            make_path("biolink:Disease"),
+            make_path("biolink:Disease --> biolink:Gene --> biolink:PhenotypicFeature --> biolink:Protein"),
+            make_path("biolink:SmallMolecule --> biolink:Gene --> biolink:Disease --> biolink:ChemicalEntity"),
+            make_path("biolink:Gene --> biolink:Protein --> biolink:Disease --> biolink:AnatomicalEntity"),
+            make_path("biolink:Disease --> biolink:Gene --> biolink:Disease --> biolink:Gene --> biolink:Disease"),
+        ]
+        batch = PathBatch.from_paths(paths)
+
+        for filter_func in (no_dupe_types, no_end_pheno, no_chemical_start,
+                            no_abab, no_dupe_but_gene, no_nonconsecutive_dupe):
+            expected = [filter_func(path) for path in paths]
+            assert filter_func.batch(batch).tolist() == expected, filter_func.__name__
+
+    def test_count_distinct_kernels_agree(self):
+        """Both distinct-type kernels handle repeats and -1 padding."""
+        type_ids = np.array([[0, 1, 2, 3], [0, 1, 0, 1], [2, 2, -1, -1], [-1, -1, -1, -1]],
+                            dtype=np.int16)
+
+        for kernel in (_category_kernel._count_distinct_python, _category_kernel._count_distinct_numpy):
+            out = np.empty(len(type_ids), dtype=np.int64)
+            kernel(type_ids, out)
+            assert out.tolist() == [4, 2, 1, 0], kernel.__name__
+        assert _category_kernel.count_distinct(type_ids).tolist() == [4, 2, 1, 0]
+        # Ids too large for the uint64 bitmask take the sorting fallback
+        assert _category_kernel.count_distinct(type_ids * 100).tolist() == [4, 2, 1, 0]
+
 
 class TestNoRepeatPredicates:
     """Tests for no_repeat_predicates filter."""
@@ -268,14 +437,42 @@ class TestNoRepeatPredicates:
         )
         assert no_repeat_predicates(path) is False
 
+    def test_multi_predicate_hops(self):
+        """Hops with several predicates are checked across all of them."""
+        path = make_path(
+            first_hop="{'biolink:treats', 'biolink:affects'}",
+            second_hop="{'biolink:located_in'}",
+            third_hop="{'biolink:causes', 'biolink:affects'}"
+        )
+        assert no_repeat_predicates(path) is False
+        assert no_repeat_predicates(make_path(
+            first_hop="{'biolink:treats', 'biolink:affects'}",
+            second_hop="{'biolink:located_in'}",
+            third_hop="set()"
+        )) is True
+
+    def test_batch_matches_per_path(self):
+        """The vectorized version agrees with the per-path function."""
+        paths = [
+            make_path(first_hop="{'biolink:treats'}", third_hop="{'biolink:located_in'}"),
+            make_path(),
+            make_path(second_hop="{'biolink:treats'}"),
+            make_path(first_hop="{'biolink:treats', 'biolink:affects'}", second_hop="{'biolink:located_in'}"),
+            make_path(first_hop="{'biolink:treats', 'biolink:causes'}", second_hop="set()"),
+            make_path(first_hop="set()", second_hop="set()", third_hop="{'biolink:treats'}"),
+        ]
+
+        expected = [no_repeat_predicates(path) for path in paths]
+        assert expected == [True, False, False, False, True, True]
+        assert no_repeat_predicates.batch(PathBatch.from_paths(paths)).tolist() == expected
+
 
 class TestNoABAB:
     """Tests for no_abab filter."""
 
-    def test_non_abab_pattern_pass(self):
+    def test_non_abab_pattern_pass(self, good_path):
         """Path without ABAB pattern should pass."""
-        path = make_path("biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity")
-        assert no_abab(path) is True
+        assert no_abab(good_path) is True
 
     def test_abab_disease_gene_fail(self):
         """Disease -> Gene -> Disease -> Gene should fail."""
@@ -351,15 +548,13 @@ class TestNoDupeButGene:
         path = make_path("biolink:Disease --> biolink:ChemicalEntity --> biolink:Gene --> biolink:SmallMolecule")
         assert no_dupe_but_gene(path) is False
 
-    def test_all_different_types_pass(self):
+    def test_all_different_types_pass(self, good_path):
         """Path with all different types should pass."""
-        path = make_path("biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity")
-        assert no_dupe_but_gene(path) is True
+        assert no_dupe_but_gene(good_path) is True
 
-    def test_disease_duplicates_fail(self):
+    def test_disease_duplicates_fail(self, dupe_path):
         """Disease duplicates should fail."""
-        path = make_path("biolink:Disease --> biolink:Disease --> biolink:Gene --> biolink:SmallMolecule")
-        assert no_dupe_but_gene(path) is False
+        assert no_dupe_but_gene(dupe_path) is False
 
     def test_mixed_gene_with_unique_others_pass(self):
         """Multiple genes with unique other types should pass."""
@@ -375,15 +570,13 @@ class TestNoNonconsecutiveDupe:
         path = make_path("biolink:Disease --> biolink:Gene --> biolink:Disease --> biolink:SmallMolecule")
         assert no_nonconsecutive_dupe(path) is False
 
-    def test_consecutive_duplicates_pass(self):
+    def test_consecutive_duplicates_pass(self, dupe_path):
         """Consecutive duplicate types should pass."""
-        path = make_path("biolink:Disease --> biolink:Disease --> biolink:Gene --> biolink:SmallMolecule")
-        assert no_nonconsecutive_dupe(path) is True
+        assert no_nonconsecutive_dupe(dupe_path) is True
 
-    def test_all_different_types_pass(self):
+    def test_all_different_types_pass(self, good_path):
         """Path with all different types should pass."""
-        path = make_path("biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:AnatomicalEntity")
-        assert no_nonconsecutive_dupe(path) is True
+        assert no_nonconsecutive_dupe(good_path) is True
 
     def test_nonconsecutive_chemical_types_fail(self):
         """Non-consecutive chemical types should fail (SmallMolecule and ChemicalEntity are equivalent)."""
@@ -421,13 +614,8 @@ class TestNoNonconsecutiveDupe:
         assert no_nonconsecutive_dupe(path) is True
 
 
-class TestInformationContentFilters:
-    """Tests for information content-based filters."""
-
-    @pytest.fixture
-    def sample_ic_file(self):
-        """Create a temporary node_degrees file for testing."""
-        content = """Query\tCURIE\tName\tPath_Count\tHit_Path_Count\tHit_Path_Fraction\tNode_degree\tInformation_content\tIs_Expected
+# Node characteristics TSV for TestInformationContentFilters
+_IC_TSV = """Query\tCURIE\tName\tPath_Count\tHit_Path_Count\tHit_Path_Fraction\tNode_degree\tInformation_content\tIs_Expected
 PFTQ-1\tMONDO:0004979\tAsthma\t100\t10\t0.1\t100\t75.5\tFalse
 PFTQ-1\tNCBIGene:7124\tTNF\t500\t50\t0.1\t500\t45.2\tFalse
 PFTQ-1\tCHEBI:31690\tImatinib\t50\t5\t0.1\t50\t60.0\tFalse
@@ -435,14 +623,27 @@ PFTQ-1\tMONDO:0005148\tType 2 diabetes\t200\t20\t0.1\t200\t\tFalse
 PFTQ-1\tUniProtKB:P12345\tSomeProtein\t10\t1\t0.1\t10\t100.0\tFalse
 PFTQ-1\tPUBCHEM:12345\tGenericCompound\t5\t1\t0.2\t5\t20.5\tFalse"""
 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.tsv') as f:
-            f.write(content)
-            temp_path = f.name
 
-        yield temp_path
+@pytest.fixture(scope="module")
+def ic_characteristics():
+    """The (ic_data, degree_data, path_count_data) of _IC_TSV, parsed once."""
+    return load_node_characteristics(io.StringIO(_IC_TSV))
+
 
-        # Cleanup
-        os.unlink(temp_path)
+@pytest.fixture(scope="module")
+def ic_filters(ic_characteristics):
+    """One min-IC filter per threshold used below, created once."""
+    ic_data, _, _ = ic_characteristics
+    return {t: create_min_ic_filter(ic_data, min_ic=t) for t in (30.0, 40.0, 50.0, 70.0, 90.0)}
+
+
+class TestInformationContentFilters:
+    """Tests for information content-based filters."""
+
+    @pytest.fixture
+    def sample_ic_file(self):
+        """A node_degrees TSV as an in-memory stream, fresh for each test."""
+        return io.StringIO(_IC_TSV)
 
     def test_load_information_content(self, sample_ic_file):
         """Test loading IC data from TSV file."""
@@ -458,214 +659,100 @@ PFTQ-1\tPUBCHEM:12345\tGenericCompound\t5\t1\t0.2\t5\t20.5\tFalse"""
         # Missing IC should be treated as 100.0
         assert ic_data['MONDO:0005148'] == 100.0
 
-    def test_create_min_ic_filter_pass(self, sample_ic_file):
-        """Test IC filter passes paths where all nodes meet threshold."""
-        ic_data, _, _ = load_node_characteristics(sample_ic_file)
-        filter_func = create_min_ic_filter(ic_data, min_ic=40.0)
-
+    @pytest.mark.parametrize("min_ic, curies, expected", [
         # All nodes have IC >= 40
-        path = Path(
-            path_labels="test",
-            path_curies=["MONDO:0004979", "NCBIGene:7124", "CHEBI:31690", "UniProtKB:P12345"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
-
-        assert filter_func(path) is True
-
-    def test_create_min_ic_filter_fail(self, sample_ic_file):
-        """Test IC filter rejects paths where any node is below threshold."""
-        ic_data, _, _ = load_node_characteristics(sample_ic_file)
-        filter_func = create_min_ic_filter(ic_data, min_ic=50.0)
-
+        (40.0, ["MONDO:0004979", "NCBIGene:7124", "CHEBI:31690", "UniProtKB:P12345"], True),
         # NCBIGene:7124 has IC=45.2, below threshold of 50
-        path = Path(
-            path_labels="test",
-            path_curies=["MONDO:0004979", "NCBIGene:7124", "CHEBI:31690", "UniProtKB:P12345"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
-
-        assert filter_func(path) is False
-
-    def test_create_min_ic_filter_missing_node(self, sample_ic_file):
-        """Test IC filter treats missing nodes as IC=100.0."""
-        ic_data, _, _ = load_node_characteristics(sample_ic_file)
-        filter_func = create_min_ic_filter(ic_data, min_ic=70.0)
-
+        (50.0, ["MONDO:0004979", "NCBIGene:7124", "CHEBI:31690", "UniProtKB:P12345"], False),
         # UNKNOWN:123 not in IC data, should be treated as 100.0
-        # MONDO:0004979 has IC=75.5, UniProtKB:P12345 has IC=100.0, both pass
-        path = Path(
-            path_labels="test",
-            path_curies=["MONDO:0004979", "UNKNOWN:123", "UniProtKB:P12345"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
-
-        assert filter_func(path) is True
-
-    def test_create_min_ic_filter_empty_ic(self, sample_ic_file):
-        """Test IC filter treats empty IC values as 100.0."""
-        ic_data, _, _ = load_node_characteristics(sample_ic_file)
-        filter_func = create_min_ic_filter(ic_data, min_ic=90.0)
-
+        (70.0, ["MONDO:0004979", "UNKNOWN:123", "UniProtKB:P12345"], True),
         # MONDO:0005148 has empty IC, should be treated as 100.0
-        path = Path(
-            path_labels="test",
-            path_curies=["MONDO:0005148", "UniProtKB:P12345"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
-
-        assert filter_func(path) is True
-
-    def test_min_ic_30_threshold(self, sample_ic_file):
-        """Test IC filter with threshold of 30."""
-        ic_data, _, _ = load_node_characteristics(sample_ic_file)
-        filter_func = create_min_ic_filter(ic_data, min_ic=30.0)
-
+        (90.0, ["MONDO:0005148", "UniProtKB:P12345"], True),
         # PUBCHEM:12345 has IC=20.5, below threshold
-        path = Path(
-            path_labels="test",
-            path_curies=["MONDO:0004979", "PUBCHEM:12345", "CHEBI:31690", "NCBIGene:7124"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
-
-        assert filter_func(path) is False
-
-    def test_min_ic_50_threshold(self, sample_ic_file):
-        """Test IC filter with threshold of 50."""
-        ic_data, _, _ = load_node_characteristics(sample_ic_file)
-        filter_func = create_min_ic_filter(ic_data, min_ic=50.0)
-
-        # Intermediate nodes (pos 1, 2) have IC >= 50
-        # CHEBI:31690=60.0, UniProtKB:P12345=100.0 (missing)
-        path_pass = Path(
-            path_labels="test",
-            path_curies=["MONDO:0004979", "CHEBI:31690", "UniProtKB:P12345", "NCBIGene:7124"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
-        assert filter_func(path_pass) is True
-
-        # Intermediate node (pos 1): NCBIGene:7124 has IC=45.2, below threshold
-        path_fail = Path(
-            path_labels="test",
-            path_curies=["MONDO:0004979", "NCBIGene:7124", "CHEBI:31690", "UniProtKB:P12345"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
-        assert filter_func(path_fail) is False
-
-    def test_min_ic_70_threshold(self, sample_ic_file):
-        """Test IC filter with threshold of 70."""
-        ic_data, _, _ = load_node_characteristics(sample_ic_file)
-        filter_func = create_min_ic_filter(ic_data, min_ic=70.0)
-
-        # Intermediate nodes (pos 1, 2): MONDO:0005148=82.1, UniProtKB:P12345=100.0 (missing)
-        path_pass = Path(
-            path_labels="test",
-            path_curies=["PUBCHEM:12345", "MONDO:0005148", "UniProtKB:P12345", "CHEBI:31690"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
-        assert filter_func(path_pass) is True
-
+        (30.0, ["MONDO:0004979", "PUBCHEM:12345", "CHEBI:31690", "NCBIGene:7124"], False),
+        # Intermediate nodes: CHEBI:31690=60.0, UniProtKB:P12345=100.0
+        (50.0, ["MONDO:0004979", "CHEBI:31690", "UniProtKB:P12345", "NCBIGene:7124"], True),
+        # Intermediate nodes: MONDO:0005148=100.0 (empty), UniProtKB:P12345=100.0
+        (70.0, ["PUBCHEM:12345", "MONDO:0005148", "UniProtKB:P12345", "CHEBI:31690"], True),
         # Intermediate node (pos 2): CHEBI:31690 has IC=60.0, below threshold
-        path_fail = Path(
-            path_labels="test",
-            path_curies=["MONDO:0004979", "MONDO:0005148", "CHEBI:31690", "UniProtKB:P12345"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
-        assert filter_func(path_fail) is False
+        (70.0, ["MONDO:0004979", "MONDO:0005148", "CHEBI:31690", "UniProtKB:P12345"], False),
+    ], ids=["pass_40", "fail_50", "missing_node", "empty_ic", "fail_30", "pass_50", "pass_70", "fail_70"])
+    def test_ic_threshold(self, ic_filters, min_ic, curies, expected):
+        """A path is kept only if its intermediate nodes all reach the threshold."""
+        assert ic_filters[min_ic](make_path(curies=curies)) is expected
 
-    def test_filter_function_name(self, sample_ic_file):
+    def test_filter_function_name(self, ic_filters):
         """Test that created filter has descriptive name."""
-        ic_data, _, _ = load_node_characteristics(sample_ic_file)
-        filter_30 = create_min_ic_filter(ic_data, min_ic=30.0)
-        filter_50 = create_min_ic_filter(ic_data, min_ic=50.0)
-        filter_70 = create_min_ic_filter(ic_data, min_ic=70.0)
-
-        assert filter_30.__name__ == "min_ic_30"
-        assert filter_50.__name__ == "min_ic_50"
-        assert filter_70.__name__ == "min_ic_70"
+        assert ic_filters[30.0].__name__ == "min_ic_30"
+        assert ic_filters[50.0].__name__ == "min_ic_50"
+        assert ic_filters[70.0].__name__ == "min_ic_70"
 
-    def test_ic_filter_ignores_start_and_end_nodes(self, sample_ic_file):
+    def test_ic_filter_ignores_start_and_end_nodes(self, ic_filters):
         """Test that IC filter only checks intermediate nodes, not start/end."""
-        ic_data, _, _ = load_node_characteristics(sample_ic_file)
-        filter_func = create_min_ic_filter(ic_data, min_ic=70.0)
+        filter_func = ic_filters[70.0]
 
         # Start node (pos 0) has IC=20.5 (low), end node (pos 3) has IC=45.2 (low)
         # But intermediate nodes (pos 1, 2) have IC=75.5 and 100.0 (high)
         # Should PASS because only intermediate nodes are checked
-        path = Path(
-            path_labels="test",
-            path_curies=["PUBCHEM:12345", "MONDO:0004979", "UniProtKB:P12345", "NCBIGene:7124"],
-            num_paths=1,
-            categories="test",
-            first_hop_predicates="test",
-            second_hop_predicates="test",
-            third_hop_predicates="test",
-            has_gene=True,
-            metapaths="test"
-        )
+        path = make_path(curies=["PUBCHEM:12345", "MONDO:0004979", "UniProtKB:P12345", "NCBIGene:7124"])
         assert filter_func(path) is True  # Passes despite low IC at start/end
 
+    def test_batch_ic_pass_matches_filters(self):
+        """Vectorized IC thresholds agree with the per-path filter functions."""
+        ic_data = {"A:1": 75.5, "B:2": 45.2, "C:3": 20.5, "D:4": float("nan")}
+        paths = [
+            make_path(curies=["X:0", "A:1", "B:2", "X:9"]),
+            make_path(curies=["X:0", "A:1", "UNKNOWN:1", "X:9"]),
+            make_path(curies=["X:0", "C:3", "A:1", "X:9"]),
+            make_path(curies=["X:0", "D:4", "A:1", "X:9"]),
+            make_path(curies=["X:0", "B:2"]),
+            make_path(curies=["X:0"]),
+        ]
+        thresholds = [30.0, 45.2, 50.0, 70.0, 150.0]
+
+        # Intermediate-node IC per path as create_min_ic_filter sees it;
+        # absent positions and NaN never fail a threshold
+        scores = np.array([
+            [ic_data.get(node_id, 100.0) for node_id in path.path_curies[1:3]]
+            + [np.inf] * (2 - len(path.path_curies[1:3]))
+            for path in paths
+        ])
+        scores[np.isnan(scores)] = np.inf
+        expected = np.array([
+            [create_min_ic_filter(ic_data, t)(path) for t in thresholds]
+            for path in paths
+        ])
+        thresholds = np.array(thresholds)
+
+        # Quantized levels compare exactly, including IC equal to a threshold
+        levels, ranks = _ic_kernel.quantize(scores.ravel(), thresholds)
+        levels = levels.reshape(scores.shape)
+        assert levels.dtype == np.uint8
+        for kernel in (_ic_kernel._ic_pass_python, _ic_kernel._ic_pass_numpy):
+            out = np.empty(expected.shape, dtype=bool)
+            kernel(levels, ranks, out)
+            assert (out == expected).all(), kernel.__name__
+        assert (_ic_kernel.ic_pass(levels, ranks) == expected).all()
+
+        batch = PathBatch.from_paths(paths)
+        assert (batch_ic_pass(batch, ic_data, thresholds[::-1]) == expected[:, ::-1]).all()
+        for k, t in enumerate(thresholds):
+            assert (create_min_ic_filter(ic_data, t).batch(batch) == expected[:, k]).all()
+
+    def test_quantize_thresholds(self):
+        """Levels count the thresholds reached; repeated thresholds share a rank."""
+        levels, ranks = _ic_kernel.quantize(
+            np.array([10.0, 50.0, 60.0, np.nan]), np.array([50.0, 30.0, 50.0])
+        )
 
-class TestNodeDegreeFilters:
-    """Tests for node degree-based filters."""
+        assert levels.tolist() == [0, 3, 3, 3]
+        assert ranks.tolist() == [1, 0, 1]
+        with pytest.raises(ValueError):
+            _ic_kernel.quantize(np.zeros(1), np.arange(255.0))
 
-    @pytest.fixture
-    def sample_degree_file(self):
-        """Create a temporary TSV file with node degree and IC data."""
-        content = """Query\tCURIE\tName\tPath_Count\tHit_Path_Count\tHit_Path_Fraction\tNode_degree\tInformation_content\tIs_Expected
+
+# Node characteristics TSV for TestNodeDegreeFilters
+_DEGREE_TSV = """Query\tCURIE\tName\tPath_Count\tHit_Path_Count\tHit_Path_Fraction\tNode_degree\tInformation_content\tIs_Expected
 PFTQ-1\tNODE1\tGene1\t100\t10\t0.1\t50\t60.0\tFalse
 PFTQ-1\tNODE2\tGene2\t200\t20\t0.1\t200\t45.0\tFalse
 PFTQ-1\tNODE3\tGene3\t600\t60\t0.1\t600\t30.0\tFalse
@@ -673,12 +760,20 @@ PFTQ-1\tNODE4\tDisease1\t1200\t120\t0.1\t1200\t80.0\tFalse
 PFTQ-1\tNODE5\tChemical1\t50\t5\t0.1\t\t70.0\tFalse
 PFTQ-1\tNODE6\tGene4\t10\t1\t0.1\t10\t\tFalse"""
 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.tsv') as f:
-            f.write(content)
-            temp_path = f.name
 
-        yield temp_path
-        os.unlink(temp_path)
+@pytest.fixture(scope="module")
+def degree_characteristics():
+    """The (ic_data, degree_data, path_count_data) of _DEGREE_TSV, parsed once."""
+    return load_node_characteristics(io.StringIO(_DEGREE_TSV))
+
+
+class TestNodeDegreeFilters:
+    """Tests for node degree-based filters."""
+
+    @pytest.fixture
+    def sample_degree_file(self):
+        """A TSV with node degree and IC data as an in-memory stream, fresh for each test."""
+        return io.StringIO(_DEGREE_TSV)
 
     def test_load_node_degrees(self, sample_degree_file):
         """Test loading node degrees from file."""
@@ -708,73 +803,73 @@ PFTQ-1\tNODE6\tGene4\t10\t1\t0.1\t10\t\tFalse"""
         # Path count data may be empty for test file without Path_count column
         assert isinstance(path_count_data, dict)
 
-    def test_max_degree_100_filter_accepts_low_degree(self, sample_degree_file):
+    def test_load_from_path(self, tmp_path):
+        """A file path loads the same data as a stream."""
+        file_path = tmp_path / "node_degrees.tsv"
+        file_path.write_text(_DEGREE_TSV)
+
+        assert load_node_characteristics(str(file_path)) == load_node_characteristics(io.StringIO(_DEGREE_TSV))
+
+    def test_max_degree_100_filter_accepts_low_degree(self, degree_characteristics):
         """Test max_degree_100 accepts paths with all nodes having degree <= 100."""
-        _, degree_data, _ = load_node_characteristics(sample_degree_file)
+        _, degree_data, _ = degree_characteristics
         filter_func = create_max_degree_filter(degree_data, max_degree=100)
 
         # Path with degrees: 50, 10, 0 (missing), and unknown node (treated as 0)
-        path_pass = make_path()
-        path_pass.path_curies = ["NODE1", "NODE6", "NODE5", "UNKNOWN"]
+        path_pass = make_path(curies=["NODE1", "NODE6", "NODE5", "UNKNOWN"])
 
         assert filter_func(path_pass) is True
 
-    def test_max_degree_100_filter_rejects_high_degree(self, sample_degree_file):
+    def test_max_degree_100_filter_rejects_high_degree(self, degree_characteristics):
         """Test max_degree_100 rejects paths with any node having degree > 100."""
-        _, degree_data, _ = load_node_characteristics(sample_degree_file)
+        _, degree_data, _ = degree_characteristics
         filter_func = create_max_degree_filter(degree_data, max_degree=100)
 
         # Path with degrees: 50, 200 (> 100), 10, 0
-        path_fail = make_path()
-        path_fail.path_curies = ["NODE1", "NODE2", "NODE6", "NODE5"]
+        path_fail = make_path(curies=["NODE1", "NODE2", "NODE6", "NODE5"])
 
         assert filter_func(path_fail) is False
 
-    def test_max_degree_500_filter(self, sample_degree_file):
+    def test_max_degree_500_filter(self, degree_characteristics):
         """Test max_degree_500 filter with appropriate thresholds."""
-        _, degree_data, _ = load_node_characteristics(sample_degree_file)
+        _, degree_data, _ = degree_characteristics
         filter_func = create_max_degree_filter(degree_data, max_degree=500)
 
         # Path with degrees: 50, 200, 10 (all <= 500)
-        path_pass = make_path()
-        path_pass.path_curies = ["NODE1", "NODE2", "NODE6", "NODE5"]
+        path_pass = make_path(curies=["NODE1", "NODE2", "NODE6", "NODE5"])
         assert filter_func(path_pass) is True
 
         # Path with degrees: 200, 600 (> 500), 50
-        path_fail = make_path()
-        path_fail.path_curies = ["NODE2", "NODE3", "NODE1", "NODE5"]
+        path_fail = make_path(curies=["NODE2", "NODE3", "NODE1", "NODE5"])
         assert filter_func(path_fail) is False
 
-    def test_max_degree_1000_filter(self, sample_degree_file):
+    def test_max_degree_1000_filter(self, degree_characteristics):
         """Test max_degree_1000 filter with high threshold."""
-        _, degree_data, _ = load_node_characteristics(sample_degree_file)
+        _, degree_data, _ = degree_characteristics
         filter_func = create_max_degree_filter(degree_data, max_degree=1000)
 
         # Path with degrees: 50, 200, 600 (all <= 1000)
-        path_pass = make_path()
-        path_pass.path_curies = ["NODE1", "NODE2", "NODE3", "NODE5"]
+        path_pass = make_path(curies=["NODE1", "NODE2", "NODE3", "NODE5"])
         assert filter_func(path_pass) is True
 
         # Path with degrees: 50, 1200 (> 1000), 200
-        path_fail = make_path()
-        path_fail.path_curies = ["NODE1", "NODE4", "NODE2", "NODE5"]
+        path_fail = make_path(curies=["NODE1", "NODE4", "NODE2", "NODE5"])
         assert filter_func(path_fail) is False
 
-    def test_missing_degree_treated_as_zero(self, sample_degree_file):
+    def test_missing_degree_treated_as_zero(self, degree_characteristics):
         """Test that nodes with missing degree data are treated as degree=0."""
-        _, degree_data, _ = load_node_characteristics(sample_degree_file)
+        _, degree_data, _ = degree_characteristics
         filter_func = create_max_degree_filter(degree_data, max_degree=100)
 
         # Path with missing degree (NODE5) and unknown node
-        path_pass = make_path()
-        path_pass.path_curies = ["NODE5", "UNKNOWN_NODE", "NODE1", "NODE6"]
+        path_pass = make_path(curies=["NODE5", "UNKNOWN_NODE", "NODE1", "NODE6"])
 
         # Should pass because missing/unknown degrees are treated as 0
         assert filter_func(path_pass) is True
 
-    def test_degree_filter_function_names(self, sample_degree_file):
+    def test_degree_filter_function_names(self, degree_characteristics):
         """Test that created filters have descriptive names."""
-        _, degree_data, _ = load_node_characteristics(sample_degree_file)
+        _, degree_data, _ = degree_characteristics
         filter_100 = create_max_degree_filter(degree_data, max_degree=100)
         filter_500 = create_max_degree_filter(degree_data, max_degree=500)
         filter_1000 = create_max_degree_filter(degree_data, max_degree=1000)
@@ -783,39 +878,57 @@ PFTQ-1\tNODE6\tGene4\t10\t1\t0.1\t10\t\tFalse"""
         assert filter_500.__name__ == "max_degree_500"
         assert filter_1000.__name__ == "max_degree_1000"
 
-    def test_ic_and_degree_filters_together(self, sample_degree_file):
+    def test_ic_and_degree_filters_together(self, degree_characteristics):
         """Test that IC and degree filters can work together on the same path."""
-        ic_data, degree_data, _ = load_node_characteristics(sample_degree_file)
+        ic_data, degree_data, _ = degree_characteristics
         ic_filter = create_min_ic_filter(ic_data, min_ic=50.0)
         degree_filter = create_max_degree_filter(degree_data, max_degree=100)
 
         # Path that passes both filters
         # Intermediate nodes: NODE1 (IC=60, degree=50), NODE6 (IC=100, degree=10)
-        path_pass = make_path()
-        path_pass.path_curies = ["UNKNOWN", "NODE1", "NODE6", "NODE5"]
+        path_pass = make_path(curies=["UNKNOWN", "NODE1", "NODE6", "NODE5"])
         assert ic_filter(path_pass) is True
         assert degree_filter(path_pass) is True
 
         # Path that fails IC filter (intermediate node has IC < 50)
         # Intermediate node NODE2: IC=45 (<50), degree=200
-        path_fail_ic = make_path()
-        path_fail_ic.path_curies = ["NODE1", "NODE2", "NODE6", "NODE5"]
+        path_fail_ic = make_path(curies=["NODE1", "NODE2", "NODE6", "NODE5"])
         assert ic_filter(path_fail_ic) is False
 
         # Path that fails degree filter (intermediate node has degree > 100)
         # Intermediate node NODE2: IC=45, degree=200 (>100)
-        path_fail_degree = make_path()
-        path_fail_degree.path_curies = ["NODE1", "NODE2", "NODE6", "NODE5"]
+        path_fail_degree = make_path(curies=["NODE1", "NODE2", "NODE6", "NODE5"])
         assert degree_filter(path_fail_degree) is False
 
-    def test_degree_filter_ignores_start_and_end_nodes(self, sample_degree_file):
+    def test_degree_filter_ignores_start_and_end_nodes(self, degree_characteristics):
         """Test that degree filter only checks intermediate nodes, not start/end."""
-        _, degree_data, _ = load_node_characteristics(sample_degree_file)
+        _, degree_data, _ = degree_characteristics
         filter_func = create_max_degree_filter(degree_data, max_degree=100)
 
         # Start node (pos 0) has degree=1200 (high), end node (pos 3) has degree=600 (high)
         # But intermediate nodes (pos 1, 2) have degree=50 and 10 (low)
         # Should PASS because only intermediate nodes are checked
-        path = make_path()
-        path.path_curies = ["NODE4", "NODE1", "NODE6", "NODE3"]
+        path = make_path(curies=["NODE4", "NODE1", "NODE6", "NODE3"])
         assert filter_func(path) is True  # Passes despite high degree at start/end
+
+    def test_batch_matches_per_path(self, degree_characteristics):
+        """Vectorized degree and path count filters agree with the per-path functions."""
+        from pathfilter.filters import create_max_path_count_filter
+
+        _, degree_data, path_count_data = degree_characteristics
+        paths = [
+            make_path(curies=["NODE4", "NODE1", "NODE6", "NODE3"]),
+            make_path(curies=["NODE1", "NODE2", "NODE6", "NODE5"]),
+            make_path(curies=["NODE1", "UNKNOWN", "NODE3", "NODE5"]),
+            make_path(curies=["NODE1", "NODE4"]),
+            make_path(curies=["NODE4"]),
+        ]
+        batch = PathBatch.from_paths(paths)
+
+        for filter_func in (
+            create_max_degree_filter(degree_data, max_degree=100),
+            create_max_degree_filter(degree_data, max_degree=600),
+            create_max_path_count_filter(path_count_data["PFTQ-1"], max_path_count=150),
+        ):
+            expected = [filter_func(path) for path in paths]
+            assert filter_func.batch(batch).tolist() == expected, filter_func.__name__
@@ -1,6 +1,7 @@
 """Tests for path matching logic."""
 import pytest
 from pathfilter.matching import (
+    compute_path_matches,
     does_path_contain_expected_node,
     filter_paths_with_expected_nodes,
     count_paths_with_expected_nodes,
@@ -178,6 +179,31 @@ class TestGetExpectedNodesFoundInPaths:
         assert len(found) == 0
 
 
+class TestComputePathMatches:
+    """Tests for the shared single-scan match result."""
+
+    def test_mask_and_found_nodes(self):
+        """Hit mask and found nodes are computed together."""
+        paths = [
+            Path("A -> B", ["ID1", "NCBIGene:3815"], 1, "cat", "p1", "p2", "p3", True, "mp"),
+            Path("A -> C", ["ID1", "ID5"], 1, "cat", "p1", "p2", "p3", False, "mp"),
+            Path("A -> D", ["CHEBI:15377", "NCBIGene:3815"], 1, "cat", "p1", "p2", "p3", True, "mp"),
+        ]
+
+        result = compute_path_matches(paths, {"NCBIGene:3815", "CHEBI:15377", "MONDO:1"})
+
+        assert list(result.hit_mask) == [True, False, True]
+        assert result.hit_count == 2
+        assert result.found_nodes == {"NCBIGene:3815", "CHEBI:15377"}
+
+    def test_empty_paths(self):
+        """No paths gives an empty mask and no found nodes."""
+        result = compute_path_matches([], {"MONDO:1"})
+
+        assert result.hit_count == 0
+        assert result.found_nodes == set()
+
+
 class TestRealWorldMatching:
     """Tests using real query and path data."""
 
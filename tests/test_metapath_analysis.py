@@ -0,0 +1,167 @@
+"""Tests for metapath enrichment analysis."""
+import numpy as np
+from pathfilter.path_loader import Path, _parse_metapaths_literal
+from pathfilter.curie_vocab import CURIE_VOCAB
+from pathfilter.metapath_analysis import (
+    analyze_all_queries_metapaths,
+    calculate_metapath_enrichment,
+    expand_paths_with_metapaths,
+    parse_metapaths_from_string
+)
+from pathfilter import _metapath_kernel
+
+
+def make_path(curies, metapaths, encoded=False):
+    """Create a Path with given CURIEs and metapaths string."""
+    return Path(
+        path_labels="test",
+        path_curies=curies,
+        num_paths=1,
+        categories="test",
+        first_hop_predicates="test",
+        second_hop_predicates="test",
+        third_hop_predicates="test",
+        has_gene=False,
+        metapaths=metapaths,
+        path_curies_ids=CURIE_VOCAB.encode(curies) if encoded else None
+    )
+
+
+PATH_SPECS = [
+    (["MP:start", "MP:hit", "MP:x", "MP:end"], "['A', 'B']"),
+    (["MP:start", "MP:y", "MP:z", "MP:end"], "['A']"),
+    (["MP:start", "MP:hit", "MP:w", "MP:end"], "['B']"),
+    (["MP:start", "MP:v", "MP:u", "MP:end"], "['C']"),
+]
+
+
+class TestParseMetapaths:
+    """Tests for metapath string parsing and caching on Path."""
+
+    def test_parse_list(self):
+        """List literal is parsed into its elements."""
+        assert parse_metapaths_from_string("['A', 'B']") == ['A', 'B']
+
+    def test_parse_invalid_returns_empty(self):
+        """Unparseable strings give an empty list."""
+        assert parse_metapaths_from_string("not a list [") == []
+
+    def test_fast_path_agrees_with_literal_eval(self):
+        """Hand parser gives the same result as ast.literal_eval."""
+        cases = [
+            "['A -> B']",
+            "['A -> B', 'C -> D']",
+            '["A", "B"]',
+            "['A','B']",
+            "['x -> y, z', 'q']",
+            "['it\\'s', 'b']",
+            "[]",
+            "['a', \"b\"]",
+            "nan",
+        ]
+        for case in cases:
+            assert parse_metapaths_from_string(case) == _parse_metapaths_literal(case), case
+
+    def test_metapaths_list_cached_and_interned(self):
+        """Path parses metapaths once and interns equal strings."""
+        first = make_path(["X:1"], "['Gene -> Disease']")
+        second = make_path(["X:2"], "['Gene -> Disease']")
+
+        assert first.metapaths_list == ['Gene -> Disease']
+        assert first.metapaths_list[0] is second.metapaths_list[0]
+
+    def test_metapaths_list_non_str_items(self):
+        """Non-string items from literal_eval are kept as-is instead of failing."""
+        path = make_path(["X:1"], "['A', 1, None]")
+
+        assert path.metapaths_list == ['A', 1, None]
+
+    def test_expand_uses_cached_list(self):
+        """Each (path, metapath) pair is produced once."""
+        path = make_path(["X:1"], "['A', 'B']")
+        assert expand_paths_with_metapaths([path]) == [(path, 'A'), (path, 'B')]
+
+
+class TestCalculateMetapathEnrichment:
+    """Tests for calculate_metapath_enrichment."""
+
+    def test_counts_per_metapath(self):
+        """Totals and hits are counted per (path, metapath) pair."""
+        paths = [make_path(c, m) for c, m in PATH_SPECS]
+        stats = {s.metapath: s for s in calculate_metapath_enrichment(paths, {"MP:hit"}, "Q")}
+
+        assert (stats['A'].total_paths, stats['A'].hit_paths) == (2, 1)
+        assert (stats['B'].total_paths, stats['B'].hit_paths) == (2, 2)
+        assert (stats['C'].total_paths, stats['C'].hit_paths) == (1, 0)
+        # Overall precision is 2/4, so B (precision 1.0) is enriched 2x
+        assert stats['B'].enrichment == 2.0
+
+    def test_encoded_matches_plain(self):
+        """Int-encoded paths give the same statistics as plain paths."""
+        plain = calculate_metapath_enrichment(
+            [make_path(c, m) for c, m in PATH_SPECS], {"MP:hit"}, "Q"
+        )
+        encoded = calculate_metapath_enrichment(
+            [make_path(c, m, encoded=True) for c, m in PATH_SPECS], {"MP:hit"}, "Q"
+        )
+        assert encoded == plain
+
+    def test_empty_paths(self):
+        """No paths yields no statistics."""
+        assert calculate_metapath_enrichment([], {"MP:hit"}, "Q") == []
+
+
+class TestAnalyzeAllQueriesMetapaths:
+    """Tests for multi-query metapath analysis."""
+
+    def test_parallel_matches_serial(self):
+        """Worker processes give the same rows, in query order, as a serial run."""
+        query_data = {
+            "Q1": ([make_path(c, m, encoded=True) for c, m in PATH_SPECS], {"MP:hit"}),
+            "Q2": ([make_path(c, m, encoded=True) for c, m in PATH_SPECS[:2]], {"MP:y"}),
+        }
+
+        serial = analyze_all_queries_metapaths(query_data, max_workers=1)
+        parallel = analyze_all_queries_metapaths(query_data, max_workers=2)
+
+        assert parallel == serial
+        assert [row['query_id'] for row in serial] == ["Q1"] * 3 + ["Q2"] * 2
+
+    def test_serial_by_default(self, monkeypatch):
+        """No worker pool is started unless max_workers > 1 is requested."""
+        import pathfilter.metapath_analysis as metapath_analysis
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(metapath_analysis, "ProcessPoolExecutor", no_pool)
+        query_data = {
+            "Q1": ([make_path(c, m, encoded=True) for c, m in PATH_SPECS], {"MP:hit"}),
+            "Q2": ([make_path(c, m, encoded=True) for c, m in PATH_SPECS[:2]], {"MP:y"}),
+        }
+
+        rows = analyze_all_queries_metapaths(query_data)
+
+        assert [row['query_id'] for row in rows] == ["Q1"] * 3 + ["Q2"] * 2
+
+
+class TestMetapathKernel:
+    """Tests that both kernel implementations agree."""
+
+    def test_python_and_numpy_agree(self):
+        """Loop kernel and vectorized kernel produce the same counts."""
+        metapath_per_pair = np.array([0, 1, 0, 1, 2], dtype=np.int64)
+        path_of_pair = np.array([0, 0, 1, 2, 3], dtype=np.int64)
+        path_hit = np.array([True, False, False, True])
+
+        python_result = _metapath_kernel._compute_python(
+            metapath_per_pair, path_of_pair, path_hit, 3
+        )
+        numpy_result = _metapath_kernel._compute_numpy(
+            metapath_per_pair, path_of_pair, path_hit, 3
+        )
+
+        for py_arr, np_arr in zip(python_result, numpy_result):
+            assert list(py_arr) == list(np_arr)
+        assert list(numpy_result[0]) == [2, 2, 1]
+        assert list(numpy_result[1]) == [1, 1, 1]
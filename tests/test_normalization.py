@@ -1,6 +1,9 @@
 """Tests for node normalization."""
+import json
 import pytest
+from pathfilter import normalization
 from pathfilter.normalization import (
+    NormalizationCache,
     normalize_curies,
     normalize_curie,
     get_normalized_expected_nodes,
@@ -156,6 +159,153 @@ class TestNormalizePathCuries:
         assert result == []
 
 
+class TestNormalizationCache:
+    """Tests for the on-disk normalization cache (no network)."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Fresh cache database in a temporary directory."""
+        return NormalizationCache(str(tmp_path / "normalization.sqlite"))
+
+    @pytest.fixture
+    def fake_api(self, monkeypatch, cache):
+        """Route normalize_curies through a temp cache and a fake API."""
+        calls = []
+
+        def fake_fetch(curies):
+            calls.append(list(curies))
+            return {curie: (f"PREFERRED:{curie}" if not curie.startswith("BAD:") else None)
+                    for curie in curies}
+
+        monkeypatch.setattr(normalization, "_cache", cache)
+        monkeypatch.setattr(normalization, "_fetch_normalized", fake_fetch)
+        return calls
+
+    def test_set_and_get(self, cache):
+        """Stored results are returned, including None values."""
+        cache.set_many({"A:1": "B:1", "C:2": None})
+
+        assert cache.get_many(["A:1", "C:2", "D:3"]) == {"A:1": "B:1", "C:2": None}
+
+    def test_expired_entries_missing(self, tmp_path):
+        """Entries older than the expiry are treated as missing."""
+        cache = NormalizationCache(str(tmp_path / "n.sqlite"), expiry_seconds=-1)
+        cache.set_many({"A:1": "B:1"})
+
+        assert cache.get_many(["A:1"]) == {}
+
+    def test_missing_results_expire_sooner(self, tmp_path):
+        """None results use the shorter expiry; resolved CURIEs are kept."""
+        cache = NormalizationCache(str(tmp_path / "n.sqlite"), missing_expiry_seconds=-1)
+        cache.set_many({"A:1": "B:1", "C:2": None})
+
+        assert cache.get_many(["A:1", "C:2"]) == {"A:1": "B:1"}
+        # Also checked against SQLite, not just the in-memory layer
+        cache._memory.clear()
+        assert cache.get_many(["A:1", "C:2"]) == {"A:1": "B:1"}
+
+    def test_only_missing_curies_fetched(self, fake_api, cache):
+        """Cached CURIEs are not sent to the API again."""
+        cache.set_many({"A:1": "CACHED:1"})
+
+        result = normalize_curies(["A:1", "B:2"])
+
+        assert result == {"A:1": "CACHED:1", "B:2": "PREFERRED:B:2"}
+        assert fake_api == [["B:2"]]
+
+    def test_results_persisted(self, fake_api):
+        """A second call is served entirely from the cache."""
+        normalize_curies(["A:1", "BAD:2"])
+        result = normalize_curies(["A:1", "BAD:2"])
+
+        assert result == {"A:1": "PREFERRED:A:1", "BAD:2": None}
+        assert len(fake_api) == 1
+
+    def test_duplicates_fetched_once(self, fake_api):
+        """Duplicate input CURIEs are sent to the API only once."""
+        normalize_curies(["A:1", "A:1", "B:2"])
+
+        assert fake_api == [["A:1", "B:2"]]
+
+    def test_large_requests_batched(self, fake_api, monkeypatch):
+        """Requests above the batch size are split and merged back together."""
+        monkeypatch.setattr(normalization, "NORMALIZATION_BATCH_SIZE", 2)
+        curies = [f"A:{i}" for i in range(5)]
+
+        result = normalize_curies(curies)
+
+        assert result == {curie: f"PREFERRED:{curie}" for curie in curies}
+        assert sorted(len(batch) for batch in fake_api) == [1, 2, 2]
+
+    def test_memory_layer_skips_sqlite(self, cache):
+        """Results already seen in this process are served from memory."""
+        cache.set_many({"A:1": "B:1"})
+        with cache._conn:
+            cache._conn.execute("DELETE FROM normalized")
+
+        assert cache.get_many(["A:1"]) == {"A:1": "B:1"}
+
+    def test_memory_layer_evicts_oldest(self, cache, monkeypatch):
+        """The in-memory layer is bounded; evicted entries come back from SQLite."""
+        monkeypatch.setattr(normalization, "MEMORY_CACHE_SIZE", 2)
+        cache.set_many({"A:1": "B:1", "C:2": "D:2", "E:3": "F:3"})
+
+        assert list(cache._memory) == ["C:2", "E:3"]
+        assert cache.get_many(["A:1"]) == {"A:1": "B:1"}
+
+
+class TestFetchNormalized:
+    """Tests for the HTTP layer (no network)."""
+
+    class FakeResponse:
+        """Minimal stand-in for requests.Response."""
+
+        def __init__(self, data):
+            self._data = data
+            self.content = json.dumps(data).encode()
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return self._data
+
+    def test_uses_shared_session(self, monkeypatch):
+        """Requests go through the module-level keep-alive session."""
+        posted = []
+
+        def fake_post(url, json, timeout):
+            posted.append(json["curies"])
+            return self.FakeResponse({"A:1": {"id": {"identifier": "B:1"}}, "C:2": None})
+
+        monkeypatch.setattr(normalization._session, "post", fake_post)
+
+        assert normalization._fetch_normalized(["A:1", "C:2"]) == {"A:1": "B:1", "C:2": None}
+        assert posted == [["A:1", "C:2"]]
+
+    def test_request_error_raised(self, monkeypatch):
+        """Network errors surface as RuntimeError."""
+        import requests
+
+        def failing_post(url, json, timeout):
+            raise requests.ConnectionError("down")
+
+        monkeypatch.setattr(normalization._session, "post", failing_post)
+
+        with pytest.raises(RuntimeError, match="Node normalization API request failed"):
+            normalization._fetch_normalized(["A:1"])
+
+
+    def test_malformed_response_raised(self, monkeypatch):
+        """A response body that is not JSON surfaces as RuntimeError."""
+        response = self.FakeResponse(None)
+        response.content = b"<html>"
+        response.json = lambda: json.loads(response.content)
+        monkeypatch.setattr(normalization._session, "post", lambda url, json, timeout: response)
+
+        with pytest.raises(RuntimeError, match="Node normalization API request failed"):
+            normalization._fetch_normalized(["A:1"])
+
 class TestRealWorldData:
     """Tests using real query data."""
 
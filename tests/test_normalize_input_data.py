@@ -1,6 +1,7 @@
 """Tests for normalize_input_data script (ODF parsing)."""
 import pytest
 import sys
+import pandas as pd
 from pathlib import Path
 
 # Add scripts directory to path so we can import from normalize_input_data
@@ -12,11 +13,19 @@ from normalize_input_data import load_query_from_ods
 # Use actual test data files
 TEST_QUERIES_FILE = "input_data/Pathfinder Test Queries.xlsx.ods"
 
+# Every test here parses the real query ODS file
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(scope="module")
+def ods_workbook():
+    """The query ODS file, opened (and so parsed by odfpy) once for the module."""
+    return pd.ExcelFile(TEST_QUERIES_FILE, engine='odf')
+
 
 class TestLoadQueryFromOds:
     """Tests for loading and parsing queries from ODS file."""
 
-    @pytest.mark.slow
     def test_load_pftq1_query(self):
         """Test loading PFTQ-1-c query."""
         query_data = load_query_from_ods(TEST_QUERIES_FILE, "PFTQ-1-c")
@@ -38,10 +47,9 @@ class TestLoadQueryFromOds:
         assert "NCBIGene:3815" in query_data["expected_nodes"]["CKIT"]
         assert "CHEBI:18295" in query_data["expected_nodes"]["Histamine"]
 
-    @pytest.mark.slow
-    def test_load_pftq4_query(self):
+    def test_load_pftq4_query(self, ods_workbook):
         """Test loading PFTQ-4 query."""
-        query_data = load_query_from_ods(TEST_QUERIES_FILE, "PFTQ-4")
+        query_data = load_query_from_ods(ods_workbook, "PFTQ-4")
 
         assert query_data["name"] == "PFTQ-4"
         assert query_data["start_label"] == "SLC6A20"
@@ -54,22 +62,20 @@ class TestLoadQueryFromOds:
         assert "ACE2" in query_data["expected_nodes"]
         assert "NRF2" in query_data["expected_nodes"]
 
-    @pytest.mark.slow
-    def test_query_without_expected_nodes(self):
+    def test_query_without_expected_nodes(self, ods_workbook):
         """Test that query loads even if some expected nodes lack CURIEs."""
         # PFTQ-20 has some expected nodes with NaN in column C
-        query_data = load_query_from_ods(TEST_QUERIES_FILE, "PFTQ-20")
+        query_data = load_query_from_ods(ods_workbook, "PFTQ-20")
 
         assert query_data["name"] == "PFTQ-20"
         # Should only include expected nodes that have CURIEs
         for label, curies in query_data["expected_nodes"].items():
             assert len(curies) > 0, f"Expected node '{label}' should have CURIEs"
 
-    @pytest.mark.slow
-    def test_handles_concatenated_curies_in_column_c(self):
+    def test_handles_concatenated_curies_in_column_c(self, ods_workbook):
         """Test that the parser correctly handles garbagey concatenated CURIEs in column C."""
         # This is the key test - column C can have various formats that need parsing
-        query_data = load_query_from_ods(TEST_QUERIES_FILE, "PFTQ-1-c")
+        query_data = load_query_from_ods(ods_workbook, "PFTQ-1-c")
 
         # Verify all expected nodes have valid CURIE lists
         for label, curies in query_data["expected_nodes"].items():
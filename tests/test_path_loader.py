@@ -1,8 +1,12 @@
 """Tests for path loader."""
 import pytest
+import pandas as pd
 from pathfilter.path_loader import (
     load_paths_from_file,
     load_paths_for_query,
+    load_all_paths_parallel,
+    parse_hop_predicates,
+    split_categories,
     Path
 )
 from pathfilter.query_loader import Query
@@ -30,7 +34,7 @@ class TestLoadPathsFromFile:
 
         # Check all fields are populated
         assert path.path_labels
-        assert isinstance(path.path_curies, list)
+        assert isinstance(path.path_curies, tuple)
         assert len(path.path_curies) > 0
         assert isinstance(path.num_paths, int)
         assert path.num_paths > 0
@@ -42,7 +46,7 @@ class TestLoadPathsFromFile:
         assert path.metapaths
 
     def test_path_curies_parsed(self):
-        """Test that path_curies are properly parsed into list."""
+        """Test that path_curies are properly parsed into a tuple."""
         paths = load_paths_from_file(TEST_PATH_FILE)
         path = paths[0]
 
@@ -93,6 +97,207 @@ class TestLoadPathsFromFile:
         assert True in has_gene_values  # At least one with gene
 
 
+class TestLoadPathsFromGeneratedFile:
+    """Tests for loading paths from a small generated xlsx file."""
+
+    @pytest.fixture
+    def generated_path_file(self, tmp_path):
+        """Write a two-row path file with all required columns."""
+        df = pd.DataFrame({
+            'path': ["asthma -> water -> IL6 -> imatinib", "asthma -> x -> y -> imatinib"],
+            'num_paths': [2, 1],
+            'categories': [
+                "biolink:Disease --> biolink:SmallMolecule --> biolink:Gene --> biolink:SmallMolecule",
+                "biolink:Disease --> biolink:Gene --> biolink:Gene --> biolink:SmallMolecule",
+            ],
+            'first_hop_predicates': ["{'biolink:affects'}", "{'biolink:related_to'}"],
+            'second_hop_predicates': ["{'biolink:affects'}", "{'biolink:affects'}"],
+            'third_hop_predicates': ["{'biolink:treats'}", "{'biolink:treats'}"],
+            'has_gene': [True, False],
+            'metapaths': ["['m1']", "['m1', 'm2']"],
+            'path_curies': [
+                "MONDO:0004979 --> CHEBI:15377 --> NCBIGene:3569 --> CHEBI:45783",
+                "MONDO:0004979 --> X:1 --> Y:2 --> CHEBI:45783",
+            ],
+        })
+        file_path = tmp_path / "MONDO_0004979_to_CHEBI_45783.xlsx"
+        df.to_excel(file_path, index=False)
+        return str(file_path)
+
+    def test_fields_converted(self, generated_path_file):
+        """Columns are converted to the Path field types."""
+        paths = load_paths_from_file(generated_path_file)
+
+        assert len(paths) == 2
+        first = paths[0]
+        assert first.path_labels == "asthma -> water -> IL6 -> imatinib"
+        assert first.path_curies == ("MONDO:0004979", "CHEBI:15377", "NCBIGene:3569", "CHEBI:45783")
+        assert first.num_paths == 2 and type(first.num_paths) is int
+        assert first.has_gene is True
+        assert paths[1].has_gene is False
+        assert paths[1].metapaths_list == ['m1', 'm2']
+        assert paths[1].categories_tuple == (
+            "biolink:Disease", "biolink:Gene", "biolink:Gene", "biolink:SmallMolecule"
+        )
+        assert paths[1].hop_predicates == (
+            ("biolink:related_to",), ("biolink:affects",), ("biolink:treats",)
+        )
+
+    def test_parse_hop_predicates(self):
+        """Predicate set strings are split into their predicates."""
+        assert parse_hop_predicates("{'biolink:affects', 'biolink:treats'}") == (
+            "biolink:affects", "biolink:treats"
+        )
+        assert parse_hop_predicates("set()") == ()
+        assert parse_hop_predicates("") == ()
+        # Non-canonical spacing and quoting take the regex path
+        assert parse_hop_predicates("{'a','b'}") == ("a", "b")
+        assert parse_hop_predicates("{'a' , 'b c'}") == ("a", "b", "c")
+        assert parse_hop_predicates('{"a", \'b\'}') == ("a", "b")
+        assert parse_hop_predicates("{}") == ()
+
+    def test_categories_shared(self, generated_path_file):
+        """Paths with the same category chain or predicate set share one parsed tuple."""
+        paths = load_paths_from_file(generated_path_file)
+        chain = "biolink:Disease --> biolink:Gene --> biolink:Gene --> biolink:SmallMolecule"
+
+        assert split_categories(chain) is paths[1].categories_tuple
+        assert paths[0].categories_tuple[0] is paths[1].categories_tuple[0]
+        # Same for predicate sets: both second hops are {'biolink:affects'}
+        assert paths[0].hop_predicates[1] is paths[1].hop_predicates[1]
+
+    def test_curies_interned(self, generated_path_file):
+        """A CURIE repeated across rows is one shared string object."""
+        paths = load_paths_from_file(generated_path_file)
+
+        assert paths[0].path_curies[0] is paths[1].path_curies[0]
+        assert paths[0].path_curies[-1] is paths[1].path_curies[-1]
+
+    def test_curie_ids_encoded(self, generated_path_file):
+        """Loaded paths carry int ids; shared CURIEs share ids."""
+        paths = load_paths_from_file(generated_path_file)
+
+        assert len(paths[0].path_curies_ids) == 4
+        assert paths[0].path_curies_ids[0] == paths[1].path_curies_ids[0]
+        assert paths[0].path_curies_ids[1] != paths[1].path_curies_ids[1]
+
+    def test_paths_frozen_with_curie_set(self, generated_path_file):
+        """Loaded paths are immutable and carry a frozenset of their CURIEs."""
+        from dataclasses import FrozenInstanceError, replace
+
+        first = load_paths_from_file(generated_path_file)[0]
+
+        assert first.path_curies_set == frozenset(first.path_curies)
+        with pytest.raises(FrozenInstanceError):
+            first.path_curies = ("X:1",)
+
+        changed = replace(first, path_curies=["X:1", "X:2"])
+        assert changed.path_curies == ("X:1", "X:2")
+        assert changed.path_curies_set == frozenset({"X:1", "X:2"})
+        assert hash(changed) == hash(replace(first, path_curies=("X:1", "X:2")))
+
+    def test_paths_slotted(self, generated_path_file):
+        """Paths use __slots__ (no per-instance __dict__), derived fields included."""
+        first = load_paths_from_file(generated_path_file)[0]
+
+        assert not hasattr(first, '__dict__')
+        assert {'categories_tuple', 'hop_predicates', 'path_curies_set'} <= set(Path.__slots__)
+
+    def test_gc_restored_after_load(self, generated_path_file):
+        """The cyclic GC paused while building paths is re-enabled afterwards."""
+        import gc
+
+        load_paths_from_file(generated_path_file)
+        assert gc.isenabled()
+
+        gc.disable()
+        try:
+            load_paths_from_file(generated_path_file)
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_load_all_paths_parallel(self, generated_path_file, tmp_path):
+        """Files read in worker processes give the same paths, with this process's CURIE ids."""
+        import shutil
+
+        shutil.copy(generated_path_file, tmp_path / "MONDO_0004979_to_CHEBI_99.xlsx")
+        queries = [
+            Query(name="A", start_label="asthma", start_curies=["MONDO:0004979"],
+                  end_label="imatinib", end_curies=["CHEBI:45783"]),
+            Query(name="B", start_label="asthma", start_curies=["MONDO:0004979"],
+                  end_label="other", end_curies=["CHEBI:99"]),
+            Query(name="C", start_label="fake", start_curies=["FAKE:1"],
+                  end_label="fake", end_curies=["FAKE:2"]),
+        ]
+
+        loaded = load_all_paths_parallel(queries, str(tmp_path), max_workers=2)
+
+        expected = load_paths_from_file(generated_path_file)
+        assert loaded["A"] == expected
+        assert loaded["B"] == expected
+        assert loaded["C"] is None
+        assert list(loaded["A"][0].path_curies_ids) == list(expected[0].path_curies_ids)
+
+    def test_frame_cache(self, generated_path_file, tmp_path, monkeypatch):
+        """An unchanged file is reloaded from the frame cache; a changed one is parsed again."""
+        monkeypatch.setenv("PATHFILTER_FRAME_CACHE_DIR", str(tmp_path / "cache"))
+        first = load_paths_from_file(generated_path_file)
+
+        def no_excel(*args, **kwargs):
+            raise AssertionError("xlsx parsed again")
+
+        monkeypatch.setattr(pd, "read_excel", no_excel)
+        assert load_paths_from_file(generated_path_file) == first
+
+        monkeypatch.undo()
+        monkeypatch.setenv("PATHFILTER_FRAME_CACHE_DIR", str(tmp_path / "cache"))
+        df = pd.read_excel(generated_path_file).iloc[:1]
+        df.to_excel(generated_path_file, index=False)
+        assert len(load_paths_from_file(generated_path_file)) == 1
+        # The entry for the old version of the file was replaced, not kept
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+    def test_frame_cache_unreadable_entry(self, generated_path_file, tmp_path, monkeypatch):
+        """A corrupt cache entry is ignored and the xlsx parsed again."""
+        monkeypatch.setenv("PATHFILTER_FRAME_CACHE_DIR", str(tmp_path / "cache"))
+        first = load_paths_from_file(generated_path_file)
+        (entry,) = (tmp_path / "cache").glob("*.pkl")
+        entry.write_bytes(b"not a pickle")
+
+        assert load_paths_from_file(generated_path_file) == first
+        assert entry.read_bytes() != b"not a pickle"
+
+    def test_frame_cache_other_errors_raised(self, generated_path_file, tmp_path, monkeypatch):
+        """Errors other than an unreadable pickle are not hidden."""
+        monkeypatch.setenv("PATHFILTER_FRAME_CACHE_DIR", str(tmp_path / "cache"))
+        load_paths_from_file(generated_path_file)
+
+        def denied(*args, **kwargs):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(pd, "read_pickle", denied)
+        with pytest.raises(PermissionError):
+            load_paths_from_file(generated_path_file)
+
+    def test_frame_cache_off_by_default(self, generated_path_file, tmp_path, monkeypatch):
+        """Without PATHFILTER_FRAME_CACHE_DIR nothing is cached, even with PATHFILTER_CACHE_DIR set."""
+        monkeypatch.delenv("PATHFILTER_FRAME_CACHE_DIR", raising=False)
+        monkeypatch.setenv("PATHFILTER_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setenv("HOME", str(tmp_path))
+        load_paths_from_file(generated_path_file)
+
+        assert not any(tmp_path.rglob("*.pkl"))
+
+    def test_missing_column(self, tmp_path):
+        """A file without required columns raises ValueError."""
+        file_path = tmp_path / "bad.xlsx"
+        pd.DataFrame({'path': ["a -> b"]}).to_excel(file_path, index=False)
+
+        with pytest.raises(ValueError, match="Missing required columns"):
+            load_paths_from_file(str(file_path))
+
+
 class TestLoadPathsForQuery:
     """Tests for loading paths for a specific query."""
 
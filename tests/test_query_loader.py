@@ -1,4 +1,6 @@
 """Tests for query loader (JSON loading)."""
+import json
+import os
 import pytest
 from pathfilter.query_loader import (
     load_all_queries,
@@ -12,30 +14,59 @@ NORMALIZED_QUERIES_FILE = "normalized_input_data/queries_normalized.json"
 NORMALIZED_PATHS_DIR = "normalized_input_data/paths"
 PATHS_DIR = "input_data/paths"  # Fallback for path finding tests
 
+# Queries used as-is by the path file lookups (find_path_file_for_query only reads them)
+PFTQ1_QUERY = Query(
+    name="PFTQ-1-c",
+    start_label="imatinib",
+    start_curies=["CHEBI:31690"],
+    end_label="asthma",
+    end_curies=["MONDO:0004979"]
+)
+FAKE_QUERY = Query(
+    name="TEST",
+    start_label="fake",
+    start_curies=["FAKE:123"],
+    end_label="fake",
+    end_curies=["FAKE:456"]
+)
+
+
+@pytest.fixture(scope="session")
+def normalized_queries():
+    """Queries from the normalized JSON file, parsed once per test session."""
+    return load_all_queries(NORMALIZED_QUERIES_FILE)
+
+
+@pytest.fixture(scope="session")
+def normalized_queries_by_name(normalized_queries):
+    """The normalized queries keyed by name."""
+    return {query.name: query for query in normalized_queries}
+
 
 class TestLoadAllQueries:
     """Tests for loading queries from normalized JSON."""
 
     @pytest.mark.slow
-    def test_load_all_queries_from_json(self):
+    def test_load_all_queries_from_json(self, normalized_queries):
         """Test loading all queries from normalized JSON file."""
-        queries = load_all_queries(NORMALIZED_QUERIES_FILE)
+        queries = normalized_queries
 
         assert len(queries) > 0
 
-        # All loaded queries should have expected nodes
+        # All loaded queries should have expected nodes; collect names as we go
+        query_names = set()
         for query in queries:
             assert len(query.expected_nodes) > 0
+            query_names.add(query.name)
 
         # Check that specific queries are present
-        query_names = [q.name for q in queries]
         assert "PFTQ-1-c" in query_names
         assert "PFTQ-4" in query_names
 
     @pytest.mark.slow
-    def test_queries_have_required_fields(self):
+    def test_queries_have_required_fields(self, normalized_queries):
         """Test that all loaded queries have required fields."""
-        queries = load_all_queries(NORMALIZED_QUERIES_FILE)
+        queries = normalized_queries
 
         for query in queries:
             assert query.name
@@ -46,12 +77,10 @@ class TestLoadAllQueries:
             assert len(query.expected_nodes) > 0
 
     @pytest.mark.slow
-    def test_queries_have_normalized_curies(self):
+    def test_queries_have_normalized_curies(self, normalized_queries_by_name):
         """Test that loaded queries contain normalized CURIEs."""
-        queries = load_all_queries(NORMALIZED_QUERIES_FILE)
-
         # Find PFTQ-1-c and check it has normalized CURIEs
-        pftq1 = next((q for q in queries if q.name == "PFTQ-1-c"), None)
+        pftq1 = normalized_queries_by_name.get("PFTQ-1-c")
         assert pftq1 is not None
 
         # These should be normalized (preferred identifiers)
@@ -62,15 +91,27 @@ class TestLoadAllQueries:
         assert "CKIT" in pftq1.expected_nodes or "KIT" in pftq1.expected_nodes
         assert len(pftq1.expected_nodes) > 0
 
-    @pytest.mark.slow
-    def test_auto_detect_json_from_ods_path(self):
-        """Test that loader auto-detects JSON when given ODS path."""
-        # This should auto-detect and load queries_normalized.json
-        queries = load_all_queries("normalized_input_data/Pathfinder Test Queries.xlsx.ods")
+    def test_auto_detect_json_from_ods_path(self, tmp_path):
+        """Given an ODS path, the loader reads queries_normalized.json beside it."""
+        (tmp_path / "queries_normalized.json").write_text(json.dumps([{
+            "name": "PFTQ-1-c",
+            "start_label": "imatinib",
+            "start_curies": ["CHEBI:31690"],
+            "end_label": "asthma",
+            "end_curies": ["MONDO:0004979"],
+            "expected_nodes": {"CKIT": ["NCBIGene:3815"]},
+        }]))
 
-        assert len(queries) > 0
-        query_names = [q.name for q in queries]
-        assert "PFTQ-1-c" in query_names
+        # The ODS file itself is never opened
+        queries = load_all_queries(str(tmp_path / "Pathfinder Test Queries.xlsx.ods"))
+
+        assert [q.name for q in queries] == ["PFTQ-1-c"]
+        assert queries[0].expected_nodes == {"CKIT": ["NCBIGene:3815"]}
+
+    def test_auto_detect_missing_json(self, tmp_path):
+        """An ODS path without a normalized JSON beside it raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="normalize_input_data.py"):
+            load_all_queries(str(tmp_path / "Pathfinder Test Queries.xlsx.ods"))
 
 
 class TestFindPathFileForQuery:
@@ -78,26 +119,17 @@ class TestFindPathFileForQuery:
 
     def test_find_path_file_pftq1(self):
         """Test finding path file for PFTQ-1."""
-        query = Query(
-            name="PFTQ-1-c",
-            start_label="imatinib",
-            start_curies=["CHEBI:31690"],
-            end_label="asthma",
-            end_curies=["MONDO:0004979"]
-        )
-
         # This file may or may not exist - just test the function works
-        path_file = find_path_file_for_query(query, PATHS_DIR)
+        path_file = find_path_file_for_query(PFTQ1_QUERY, PATHS_DIR)
 
         if path_file:
             assert path_file.endswith(".xlsx")
             assert "CHEBI_31690" in path_file or "MONDO_0004979" in path_file
 
     @pytest.mark.slow
-    def test_find_existing_path_file(self):
+    def test_find_existing_path_file(self, normalized_queries):
         """Test finding a path file that we know exists."""
-        # Load queries from normalized JSON
-        queries = load_all_queries(NORMALIZED_QUERIES_FILE)
+        queries = normalized_queries
 
         found_count = 0
         for query in queries:
@@ -110,7 +142,6 @@ class TestFindPathFileForQuery:
                 found_count += 1
                 assert path_file.endswith(".xlsx")
                 # Verify file actually exists
-                import os
                 assert os.path.exists(path_file)
 
         # Should find at least some path files
@@ -118,13 +149,35 @@ class TestFindPathFileForQuery:
 
     def test_find_path_file_not_found(self):
         """Test behavior when path file doesn't exist."""
-        query = Query(
-            name="TEST",
-            start_label="fake",
-            start_curies=["FAKE:123"],
-            end_label="fake",
-            end_curies=["FAKE:456"]
-        )
-
-        path_file = find_path_file_for_query(query, PATHS_DIR)
+        path_file = find_path_file_for_query(FAKE_QUERY, PATHS_DIR)
         assert path_file is None
+
+    def test_find_path_file_in_directory(self, tmp_path):
+        """Both filename patterns are found from the directory listing."""
+        (tmp_path / "CHEBI_1_to_MONDO_2.xlsx").touch()
+        (tmp_path / "CHEBI_3_to_MONDO_4_paths.xlsx").touch()
+        first = Query(name="A", start_label="a", start_curies=["CHEBI:1"],
+                      end_label="b", end_curies=["MONDO:2"])
+        second = Query(name="B", start_label="a", start_curies=["CHEBI:3"],
+                       end_label="b", end_curies=["MONDO:9", "MONDO:4"])
+
+        assert find_path_file_for_query(first, str(tmp_path)) == str(tmp_path / "CHEBI_1_to_MONDO_2.xlsx")
+        assert find_path_file_for_query(second, str(tmp_path)) == str(tmp_path / "CHEBI_3_to_MONDO_4_paths.xlsx")
+
+    def test_find_path_file_added_later(self, tmp_path):
+        """Files added after a lookup, even to a directory missing at first, are found."""
+        paths_dir = tmp_path / "paths"
+        query = Query(name="A", start_label="a", start_curies=["CHEBI:1"],
+                      end_label="b", end_curies=["MONDO:2", "MONDO:3"])
+
+        assert find_path_file_for_query(query, str(paths_dir)) is None
+
+        paths_dir.mkdir()
+        (paths_dir / "CHEBI_1_to_MONDO_3.xlsx").touch()
+        assert find_path_file_for_query(query, str(paths_dir)) == str(paths_dir / "CHEBI_1_to_MONDO_3.xlsx")
+
+        (paths_dir / "CHEBI_1_to_MONDO_2.xlsx").touch()
+        # Make sure the directory's mtime differs even on coarse-grained filesystems
+        mtime_ns = os.stat(paths_dir).st_mtime_ns
+        os.utime(paths_dir, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        assert find_path_file_for_query(query, str(paths_dir)) == str(paths_dir / "CHEBI_1_to_MONDO_2.xlsx")